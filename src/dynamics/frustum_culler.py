@@ -2,53 +2,275 @@
 ./src/dynamics/frustum_culler.py
 
 Camera frustum culling for selecting which molecules to simulate.
+
+Instance centres of mass and bounding radii are cached per ObjectState in an InstanceBounds, so a
+cull is a single NumPy expression over an (M, 3) array instead of a transform of every atom.
+Each SimulationThread owns the bounds of its ObjectState and refreshes them from every frame it
+writes; the render loop culls against them to skip off-screen instances.
 """
 
+from typing import TYPE_CHECKING
+
 import numpy as np
 
 from src.render_molecules.arrangement.geometry import (
-    calculate_environment_center_of_mass,
+    calculate_center_of_mass,
+    compute_bounding_sphere_radius,
 )
 from src.render_molecules.arrangement.scene_state import ObjectState
+from src.utils.constants import ELEMENT_MASSES
+
+if TYPE_CHECKING:
+    from src.dynamics.sim_thread import AtomMapping
+
+
+class InstanceBounds:
+    """
+    Cached bounding spheres (mass-weighted centre + radius) for every instance of one ObjectState.
+
+    Call refresh() after instances are added, removed or re-posed, or update_from_atoms() with the
+    simulation's atom positions while dynamics is moving atoms without touching instance poses.
+
+    Args:
+        object_state (ObjectState): State whose instances are tracked.
+        padding (float, optional): Extra radius in Angstroms added to every instance. Defaults to 0.0.
+    """
+
+    def __init__(self, object_state: ObjectState, padding: float = 0.0) -> None:
+        self.object_state: ObjectState = object_state
+        self.padding: float = padding
+        self.ids: np.ndarray = np.empty(0, dtype=np.int64)  # (M,)
+        self.centres: np.ndarray = np.empty((0, 3), dtype=float)  # (M, 3) Angstroms
+        self.radii: np.ndarray = np.empty(0, dtype=float)  # (M,) Angstroms
+        self._template_com: dict[int, np.ndarray] = {}
+        self._template_radius: dict[int, float] = {}
+        # (mapping it was built from, atom rows, row -> instance slot, atom masses)
+        self._segments: tuple[AtomMapping, np.ndarray, np.ndarray, np.ndarray] | None = None
+        self.refresh()
+
+    def _template_bounds(self, template_id: int) -> tuple[np.ndarray, float]:
+        if template_id not in self._template_com:
+            template = self.object_state.templates[template_id]
+            self._template_com[template_id] = calculate_center_of_mass(template=template)
+            self._template_radius[template_id] = compute_bounding_sphere_radius(template)
+        return self._template_com[template_id], self._template_radius[template_id]
+
+    def refresh(self) -> None:
+        """Recomputes every centre from the current instance poses: COM = R @ local_com + position."""
+        store = self.object_state.instances
+        local_coms = np.empty((len(store), 3), dtype=float)
+        radii = np.empty(len(store), dtype=float)
+        for tid, rows in store.rows_by_template().items():
+            local_com, radius = self._template_bounds(tid)
+            local_coms[rows] = local_com
+            radii[rows] = radius
+
+        self.ids = store.ids.copy()
+        self.centres = store.world_centres(local_coms)
+        self.radii = radii + self.padding
+        self._segments = None
+
+    def update_from_atoms(
+        self,
+        positions: np.ndarray,
+        atom_mapping: "AtomMapping",
+        scale: float = 1.0,
+    ) -> None:
+        """
+        Recomputes centres of the simulated instances from flat atom positions.
+
+        Args:
+            positions (np.ndarray): Flat simulation positions, shape (N, 3).
+            atom_mapping (AtomMapping): Mapping the positions were flattened with.
+            scale (float, optional): Multiplier taking positions to Angstroms, e.g. 1e10 for metres.
+                Defaults to 1.0.
+        """
+        if self._segments is None or self._segments[0] is not atom_mapping:
+            self._segments = self._build_segments(atom_mapping)
+        _mapping, rows, segment, weights = self._segments
+        if rows.size == 0:
+            return
+
+        count = len(self.ids)
+        weighted = positions[rows] * weights[:, None]
+        total = np.bincount(segment, weights=weights, minlength=count)
+        sums = np.stack(
+            [np.bincount(segment, weights=weighted[:, k], minlength=count) for k in range(3)],
+            axis=1,
+        )
+        touched = total > 0
+        # Swap in a new array so a reader on another thread never sees a half-written one
+        centres = self.centres.copy()
+        centres[touched] = sums[touched] / total[touched, None] * scale
+        self.centres = centres
+
+    def _build_segments(
+        self, atom_mapping: "AtomMapping"
+    ) -> tuple["AtomMapping", np.ndarray, np.ndarray, np.ndarray]:
+        """Maps the mapping's atom rows onto bounds slots with per-atom mass weights."""
+        order = np.argsort(self.ids, kind="stable")
+        sorted_ids = self.ids[order]
+        if sorted_ids.size == 0 or atom_mapping.total_atoms == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return atom_mapping, empty, empty, np.empty(0, dtype=float)
+
+        pos = np.searchsorted(sorted_ids, atom_mapping.instance_ids)
+        pos = np.minimum(pos, sorted_ids.size - 1)
+        tracked = sorted_ids[pos] == atom_mapping.instance_ids  # (M_sim,)
+        slot_of = order[pos]
+
+        weights = np.empty(atom_mapping.total_atoms, dtype=float)
+        for tid in np.unique(atom_mapping.template_ids).tolist():
+            elements = self.object_state.templates[tid].elements
+            masses = np.array([ELEMENT_MASSES.get(int(el), 12.0) for el in elements], dtype=float)
+            group = np.flatnonzero(atom_mapping.template_ids == tid)
+            rows = (atom_mapping.starts[group, None] + np.arange(len(masses))).ravel()
+            weights[rows] = np.tile(masses, len(group))
+
+        rows = np.flatnonzero(tracked[atom_mapping.atom_slot])
+        return (
+            atom_mapping,
+            rows,
+            slot_of[atom_mapping.atom_slot[rows]],
+            weights[rows],
+        )
+
+
+def cone_mask(
+    centres: np.ndarray,
+    radii: np.ndarray,
+    camera_pos: np.ndarray,
+    camera_forward: np.ndarray,
+    half_angle_rad: float,
+) -> np.ndarray:
+    """
+    Tests bounding spheres against a circular view cone. A sphere passes if any part of it lies
+    inside the cone, i.e. its angle off-axis is within half_angle plus its angular radius.
+
+    Args:
+        centres (np.ndarray): Sphere centres, shape (M, 3).
+        radii (np.ndarray): Sphere radii, shape (M,).
+        camera_pos (np.ndarray): Cone apex, shape (3,).
+        camera_forward (np.ndarray): Cone axis unit vector, shape (3,).
+        half_angle_rad (float): Cone half-angle in radians.
+
+    Returns:
+        np.ndarray: Boolean mask, shape (M,).
+    """
+    to_mol = centres - camera_pos
+    dist = np.linalg.norm(to_mol, axis=1)
+    inside = dist <= np.maximum(radii, 1e-15)
+    safe = np.where(inside, 1.0, dist)
+    angle = np.arccos(np.clip(to_mol @ camera_forward / safe, -1.0, 1.0))
+    angular_radius = np.arcsin(np.clip(radii / safe, 0.0, 1.0))
+    return inside | (angle <= half_angle_rad + angular_radius)
+
+
+def frustum_planes(
+    camera_pos: np.ndarray,
+    camera_forward: np.ndarray,
+    camera_up: np.ndarray,
+    fov_degrees: float,
+    aspect_ratio: float,
+    near: float,
+    far: float,
+) -> np.ndarray:
+    """
+    Builds the six planes of a perspective frustum with inward-facing normals.
+
+    Args:
+        camera_pos (np.ndarray): Camera world position, shape (3,).
+        camera_forward (np.ndarray): Camera forward unit vector, shape (3,).
+        camera_up (np.ndarray): Camera up vector, shape (3,). Need not be orthogonal to forward.
+        fov_degrees (float): Horizontal field of view in degrees.
+        aspect_ratio (float): Width / height of the view.
+        near (float): Near clip distance.
+        far (float): Far clip distance.
+
+    Returns:
+        np.ndarray: Planes as rows (nx, ny, nz, d) with n . p + d >= 0 inside, shape (6, 4).
+    """
+    forward = camera_forward / np.linalg.norm(camera_forward)
+    right = np.cross(forward, camera_up)
+    right /= np.linalg.norm(right)
+    up = np.cross(right, forward)
+
+    half_h = np.radians(fov_degrees) / 2.0
+    half_v = np.arctan(np.tan(half_h) / aspect_ratio)
+    normals = np.array(
+        [
+            forward,  # near
+            -forward,  # far
+            np.cos(half_h) * right + np.sin(half_h) * forward,  # left
+            -np.cos(half_h) * right + np.sin(half_h) * forward,  # right
+            np.cos(half_v) * up + np.sin(half_v) * forward,  # bottom
+            -np.cos(half_v) * up + np.sin(half_v) * forward,  # top
+        ]
+    )
+    offsets = -normals @ camera_pos
+    offsets[0] -= near
+    offsets[1] += far
+    return np.column_stack([normals, offsets])
+
+
+def frustum_mask(centres: np.ndarray, radii: np.ndarray, planes: np.ndarray) -> np.ndarray:
+    """
+    Tests bounding spheres against frustum planes. Conservative: spheres straddling a corner
+    outside the frustum may pass, but no visible sphere is rejected.
+
+    Args:
+        centres (np.ndarray): Sphere centres, shape (M, 3).
+        radii (np.ndarray): Sphere radii, shape (M,).
+        planes (np.ndarray): Planes from frustum_planes, shape (P, 4).
+
+    Returns:
+        np.ndarray: Boolean mask, shape (M,).
+    """
+    signed = centres @ planes[:, :3].T + planes[:, 3]  # (M, P)
+    return np.all(signed >= -radii[:, None], axis=1)
 
 
 def get_active_instances(
     camera_pos: np.ndarray,
     camera_forward: np.ndarray,
     fov_degrees: float,
-    object_state: ObjectState,
+    bounds: InstanceBounds,
     margin_factor: float = 1.5,
 ) -> list[int]:
     """
-    Returns instance IDs whose centres of mass fall within the camera's
+    Returns instance IDs whose bounding spheres touch the camera's
     view cone (plus a margin for smooth simulation entry).
 
     Args:
         camera_pos: Camera world position, shape (3,).
         camera_forward: Camera forward unit vector, shape (3,).
         fov_degrees: Horizontal field of view in degrees.
-        object_state: Current object state with templates and instances.
+        bounds: Cached bounds for one object state, e.g. SimulationThread.bounds.
         margin_factor: Multiplier on FOV to include molecules slightly outside view.
 
     Returns:
         List of instance IDs within the expanded view cone.
     """
-    half_angle_rad = np.radians(fov_degrees * margin_factor / 2.0)
-    cos_limit = np.cos(half_angle_rad)
-    active: list[int] = []
+    half_angle_rad = min(np.radians(fov_degrees * margin_factor / 2.0), np.pi)
+    mask = cone_mask(
+        bounds.centres,
+        bounds.radii,
+        np.asarray(camera_pos, dtype=float),
+        np.asarray(camera_forward, dtype=float),
+        half_angle_rad,
+    )
+    return bounds.ids[mask].tolist()
 
-    for iid, inst in object_state.instances.items():
-        tmpl = object_state.templates[inst.template_id]
-        com = calculate_environment_center_of_mass(template=tmpl, instance=inst)
-        to_mol = com - camera_pos
-        dist = float(np.linalg.norm(to_mol))
 
-        if dist < 1e-15:
-            active.append(iid)
-            continue
+def get_frustum_instances(bounds: InstanceBounds, planes: np.ndarray) -> list[int]:
+    """
+    Returns instance IDs whose bounding spheres intersect a six-plane frustum.
 
-        cos_angle = float(np.dot(to_mol / dist, camera_forward))
-        if cos_angle >= cos_limit:
-            active.append(iid)
+    Args:
+        bounds: Cached bounds for one object state.
+        planes: Planes from frustum_planes, shape (6, 4).
 
-    return active
+    Returns:
+        List of instance IDs inside or touching the frustum.
+    """
+    return bounds.ids[frustum_mask(bounds.centres, bounds.radii, planes)].tolist()
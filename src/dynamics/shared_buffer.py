@@ -1,11 +1,12 @@
 """
 ./src/dynamics/shared_buffer.py
 
-Double-buffered numpy array for lock-free position transfer
-between the MD thread and the render thread.
+Position transfer between the MD thread and the render thread: a double-buffered
+array for the newest frame, and a timestamped ring of recent frames for smooth playback.
 """
 
 import threading
+import time
 
 import numpy as np
 
@@ -55,3 +56,132 @@ class SharedPositionBuffer:
     @property
     def n_atoms(self) -> int:
         return self._buffers[0].shape[0]
+
+
+class FrameRingBuffer:
+    """
+    Ring of the last K timestamped position frames, written by the MD thread and sampled by the
+    render thread at an arbitrary time. All storage is preallocated; sample() writes into a
+    caller-owned array, so playback does no per-frame allocation.
+
+    Args:
+        n_atoms: Number of atoms in the simulation.
+        capacity: Number of frames kept (K). At least 2.
+    """
+
+    def __init__(self, n_atoms: int, capacity: int = 8) -> None:
+        self._capacity: int = max(2, capacity)
+        self._frames: np.ndarray = np.zeros((self._capacity, n_atoms, 3), dtype=np.float64)
+        self._times: np.ndarray = np.zeros(self._capacity, dtype=np.float64)
+        self._seq: int = 0  # Frames written so far; the newest lives in slot (seq - 1) % K
+        self._lock: threading.Lock = threading.Lock()
+
+    def write(self, positions: np.ndarray, timestamp: float | None = None) -> None:
+        """
+        Copy positions into the oldest slot and publish it as the newest frame.
+        Called from the MD thread.
+
+        Args:
+            positions: Array of shape (N, 3) with updated atom positions.
+            timestamp: Monotonic wall time of the frame. Defaults to now.
+        """
+        stamp = time.monotonic() if timestamp is None else timestamp
+        with self._lock:
+            slot = self._seq % self._capacity
+            np.copyto(self._frames[slot], positions)
+            self._times[slot] = stamp
+            self._seq += 1
+
+    def read(self) -> np.ndarray:
+        """
+        Return a view of the newest frame.
+
+        Returns:
+            Array of shape (N, 3). Do not hold this reference across frames.
+        """
+        return self.frame(0)
+
+    def frame(self, age: int) -> np.ndarray:
+        """
+        Return a view of an older frame: age 0 is the newest, 1 the one before, and so on.
+
+        Args:
+            age: How many frames back, clamped to the frames available.
+
+        Returns:
+            Array of shape (N, 3). Do not hold this reference across frames.
+        """
+        with self._lock:
+            age = min(age, max(0, min(self._seq, self._capacity) - 1))
+            return self._frames[(self._seq - 1 - age) % self._capacity]
+
+    @property
+    def seq(self) -> int:
+        """Number of frames written so far. Changes whenever a new frame lands."""
+        return self._seq
+
+    @property
+    def latest_time(self) -> float:
+        """Timestamp of the newest frame, or 0.0 before the first write."""
+        with self._lock:
+            return float(self._times[(self._seq - 1) % self._capacity]) if self._seq else 0.0
+
+    def sample(
+        self, at_time: float, out: np.ndarray, max_extrapolation_s: float = 0.1
+    ) -> bool:
+        """
+        Write the positions at at_time into out. Interpolates linearly between the two frames
+        that bracket at_time. Past the newest frame, extrapolates with the velocity between
+        the two newest frames for at most max_extrapolation_s. Before the oldest frame it
+        holds the oldest frame.
+
+        Args:
+            at_time: Monotonic wall time to sample.
+            out: Preallocated array of shape (N, 3) to write into.
+            max_extrapolation_s: Cap on how far past the newest frame positions are projected.
+
+        Returns:
+            True if out was written, False if no frame has been written yet.
+        """
+        with self._lock:
+            count = min(self._seq, self._capacity)
+            if count == 0:
+                return False
+            newest = (self._seq - 1) % self._capacity
+
+            # Walk back from the newest frame to the first one at or before at_time
+            later = newest
+            for age in range(count):
+                slot = (self._seq - 1 - age) % self._capacity
+                if self._times[slot] <= at_time:
+                    break
+                later = slot
+            else:
+                np.copyto(out, self._frames[later])  # Older than everything we hold
+                return True
+
+            if slot == newest:
+                if count == 1:
+                    np.copyto(out, self._frames[newest])
+                    return True
+                prev = (self._seq - 2) % self._capacity
+                span = self._times[newest] - self._times[prev]
+                ahead = min(at_time - self._times[newest], max_extrapolation_s)
+                if span <= 0.0 or ahead <= 0.0:
+                    np.copyto(out, self._frames[newest])
+                    return True
+                np.subtract(self._frames[newest], self._frames[prev], out=out)
+                out *= ahead / span
+                out += self._frames[newest]
+                return True
+
+            span = self._times[later] - self._times[slot]
+            alpha = 0.0 if span <= 0.0 else (at_time - self._times[slot]) / span
+            np.subtract(self._frames[later], self._frames[slot], out=out)
+            out *= alpha
+            out += self._frames[slot]
+            return True
+
+    @property
+    def n_atoms(self) -> int:
+        return self._frames.shape[1]
@@ -0,0 +1,82 @@
+"""
+./src/dynamics/sim_scheduler.py
+
+Decides how much simulation time each loaded chunk gets, based on where the camera is looking.
+On-screen chunks near the camera run at full rate, everything else still loaded runs throttled,
+and chunks beyond a cut-off distance are paused.
+"""
+
+from enum import Enum, auto
+
+import numpy as np
+
+from src.dynamics.frustum_culler import cone_mask
+
+ChunkCoords = tuple[int, int, int]
+
+
+class SimTier(Enum):
+    """
+    Scheduling tiers for a chunk's simulation thread.
+    FULL runs unthrottled, REDUCED caps buffer writes per second, PAUSED stops stepping.
+    """
+
+    FULL = auto()
+    REDUCED = auto()
+    PAUSED = auto()
+
+
+def classify_chunks(
+    chunk_coords: list[ChunkCoords],
+    chunk_size: float,
+    camera_pos: np.ndarray,
+    camera_forward: np.ndarray,
+    fov_degrees: float,
+    full_distance: float,
+    pause_distance: float,
+    margin_factor: float = 1.2,
+) -> dict[ChunkCoords, SimTier]:
+    """
+    Assigns a tier to every chunk in one pass over arrays of chunk boxes.
+
+    Distance is measured from the camera to the nearest point of each chunk's box, so the chunk
+    the camera is in is at distance 0. Visibility tests each chunk's bounding sphere against the
+    view cone.
+
+    Args:
+        chunk_coords (list[ChunkCoords]): Chunks to classify, in the camera's chunk frame.
+        chunk_size (float): Chunk edge length in Angstroms.
+        camera_pos (np.ndarray): Camera position in molecular space (Angstroms), shape (3,).
+        camera_forward (np.ndarray): Camera forward unit vector, shape (3,).
+        fov_degrees (float): Horizontal field of view in degrees.
+        full_distance (float): Visible chunks closer than this run at full rate.
+        pause_distance (float): Chunks further than this are paused.
+        margin_factor (float, optional): Multiplier on FOV so chunks just off-screen keep full rate.
+            Defaults to 1.2.
+
+    Returns:
+        dict[ChunkCoords, SimTier]: Tier per chunk.
+    """
+    if not chunk_coords:
+        return {}
+    lo = np.array(chunk_coords, dtype=float) * chunk_size
+    hi = lo + chunk_size
+    gap = np.maximum(np.maximum(lo - camera_pos, 0.0), camera_pos - hi)
+    distance = np.linalg.norm(gap, axis=1)
+
+    centres = lo + chunk_size * 0.5
+    radii = np.full(len(chunk_coords), chunk_size * np.sqrt(3.0) * 0.5)
+    half_angle = min(np.radians(fov_degrees * margin_factor / 2.0), np.pi)
+    visible = cone_mask(centres, radii, camera_pos, camera_forward, half_angle)
+
+    full = visible & (distance <= full_distance)
+    paused = distance > pause_distance
+    tiers: dict[ChunkCoords, SimTier] = {}
+    for coords, is_full, is_paused in zip(chunk_coords, full.tolist(), paused.tolist()):
+        if is_paused:
+            tiers[coords] = SimTier.PAUSED
+        elif is_full:
+            tiers[coords] = SimTier.FULL
+        else:
+            tiers[coords] = SimTier.REDUCED
+    return tiers
@@ -4,28 +4,40 @@
 Background thread running the MD integration loop.
 """
 
+import heapq
 import logging
 import threading
 import time
 from dataclasses import dataclass
+from functools import cached_property
 
 import numpy as np
 
 from src.utils.constants import (
     AMU_TO_KG,
+    BOLTZMANN_CONSTANT,
+    CUMULATIVE_DRIFT_LIMIT_A,
     HARMONIC_DT,
     K_ANCHOR,
     K_BOND,
     LANGEVIN_GAMMA,
+    MD_CULL_PADDING_A,
+    MD_FRAME_HISTORY,
+    SIM_HEALTH_HOT_FACTOR,
+    SIM_HEALTH_MAX_RESETS,
+    SIM_HEALTH_WARM_CHECKS,
+    SIM_HEALTH_WARM_FACTOR,
+    SIM_MIN_DT_SCALE,
 )
 from src.dynamics.engine import MDEngine
+from src.dynamics.frustum_culler import InstanceBounds
 from src.dynamics.integrator import (
     assign_boltzmann_velocities,
     velocity_verlet_step,
 )
-from src.dynamics.shared_buffer import SharedPositionBuffer
-from src.render_molecules.arrangement.geometry import apply_instance_transform
-from src.render_molecules.arrangement.scene_state import ObjectState
+from src.dynamics.shared_buffer import FrameRingBuffer
+from src.render_molecules.arrangement.geometry import transform_template_instances
+from src.render_molecules.arrangement.scene_state import MoleculeTemplate, ObjectState
 from src.utils.constants import ELEMENT_MASSES
 
 logger = logging.getLogger(__name__)
@@ -33,15 +45,45 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class AtomMapping:
-    """Bidirectional map between flat simulation array indices and instance atoms."""
+    """
+    Bidirectional map between flat simulation array indices and instance atoms.
+
+    Instances occupy consecutive slots; slot k owns rows offsets[k]:offsets[k + 1] of the
+    positions array, in the template's atom order.
+    """
+
+    instance_ids: np.ndarray  # (M,) instance ID per slot
+    template_ids: np.ndarray  # (M,) template ID per slot
+    offsets: np.ndarray  # (M + 1,) first row of each slot; offsets[-1] == total_atoms
+    atom_slot: np.ndarray  # (N,) slot owning each row
+
+    @property
+    def total_atoms(self) -> int:
+        return int(self.offsets[-1])
 
-    sim_index_to_instance: list[tuple[int, int]]
-    """List of (instance_id, local_atom_index) for each row in positions array."""
+    @property
+    def starts(self) -> np.ndarray:
+        """First row of each slot, shape (M,)."""
+        return self.offsets[:-1]
 
-    instance_to_sim_range: dict[int, tuple[int, int]]
-    """Maps instance_id to (start_index, end_index) slice into positions array."""
+    @property
+    def atom_counts(self) -> np.ndarray:
+        """Atoms per slot, shape (M,)."""
+        return np.diff(self.offsets)
 
-    total_atoms: int
+    def sim_index_to_instance(self, index: int) -> tuple[int, int]:
+        """Returns (instance_id, local_atom_index) for one row of the positions array."""
+        slot = int(self.atom_slot[index])
+        return int(self.instance_ids[slot]), index - int(self.offsets[slot])
+
+    @cached_property
+    def instance_to_sim_range(self) -> dict[int, tuple[int, int]]:
+        """Maps instance_id to (start_index, end_index) slice into positions array."""
+        bounds = self.offsets.tolist()
+        return {
+            iid: (bounds[slot], bounds[slot + 1])
+            for slot, iid in enumerate(self.instance_ids.tolist())
+        }
 
 
 @dataclass
@@ -60,6 +102,84 @@ class SimulationState:
     error: str | None = None
 
 
+class StepBudgetController:
+    """
+    Feedback loop that keeps simulation threads from starving the render loop.
+
+    The render thread reports its frame time every frame. Simulation threads run their step
+    batches in sub-batches of sub_batch steps and sleep for yield_s between them, which releases
+    the GIL. When frames run over budget the sub-batches shrink and the yields grow
+    (multiplicative decrease); when frames come in comfortably under budget the sub-batches grow
+    again and the yields shrink, so the simulation takes whatever time rendering leaves over.
+    One controller is shared by every SimulationThread, since they all contend for the same GIL.
+
+    Args:
+        target_fps (float): Render frame rate to protect.
+        min_sub_batch (int): Smallest sub-batch, in integrator steps.
+        max_sub_batch (int): Largest sub-batch, in integrator steps.
+        max_yield_s (float): Longest sleep between sub-batches.
+    """
+
+    def __init__(
+        self,
+        target_fps: float = 60.0,
+        min_sub_batch: int = 1,
+        max_sub_batch: int = 500,
+        max_yield_s: float = 0.005,
+    ) -> None:
+        self.frame_budget_s: float = 1.0 / target_fps
+        self.min_sub_batch: int = max(1, min_sub_batch)
+        self.max_sub_batch: int = max(self.min_sub_batch, max_sub_batch)
+        self.max_yield_s: float = max_yield_s
+        self.sub_batch: int = self.min_sub_batch * 10
+        self.yield_s: float = 0.0
+        self.frame_time_s: float = self.frame_budget_s  # EMA of reported frame times
+        self._lock: threading.Lock = threading.Lock()
+        self._window_start: float = time.monotonic()
+        self._window_steps: int = 0
+        self._steps_per_second: float = 0.0
+
+    def report_frame(self, frame_s: float) -> None:
+        """
+        Feeds one render frame time into the controller and adjusts the sub-batch and yield.
+        Called from the render thread once per frame.
+
+        Args:
+            frame_s (float): Wall time of the last frame in seconds.
+        """
+        self.frame_time_s = 0.9 * self.frame_time_s + 0.1 * frame_s
+        if self.frame_time_s > self.frame_budget_s * 1.05:
+            self.sub_batch = max(self.min_sub_batch, int(self.sub_batch * 0.75))
+            self.yield_s = min(self.max_yield_s, max(self.yield_s * 1.5, 2e-4))
+        elif self.frame_time_s < self.frame_budget_s * 0.9:
+            self.sub_batch = min(self.max_sub_batch, self.sub_batch + 1)
+            self.yield_s = self.yield_s * 0.8 if self.yield_s > 1e-5 else 0.0
+
+    def record_steps(self, steps: int) -> None:
+        """
+        Counts integrator steps finished by any simulation thread.
+
+        Args:
+            steps (int): Steps just completed.
+        """
+        with self._lock:
+            self._window_steps += steps
+            now = time.monotonic()
+            elapsed = now - self._window_start
+            if elapsed >= 1.0:
+                self._steps_per_second = self._window_steps / elapsed
+                self._window_steps = 0
+                self._window_start = now
+
+    @property
+    def steps_per_second(self) -> float:
+        """Integrator steps per second across all threads, measured over the last ~1 s window."""
+        with self._lock:
+            if time.monotonic() - self._window_start > 2.0:
+                return 0.0  # Nothing recorded recently: every thread is paused
+            return self._steps_per_second
+
+
 def build_atom_mapping(
     object_state: ObjectState,
     active_instance_ids: list[int],
@@ -74,26 +194,98 @@ def build_atom_mapping(
     Returns:
         AtomMapping covering only the active instances.
     """
-    index_list: list[tuple[int, int]] = []
-    range_map: dict[int, tuple[int, int]] = {}
-    offset = 0
-
-    for iid in active_instance_ids:
-        inst = object_state.instances[iid]
-        tmpl = object_state.templates[inst.template_id]
-        n_atoms = len(tmpl.aids)
-        range_map[iid] = (offset, offset + n_atoms)
-        for local_idx in range(n_atoms):
-            index_list.append((iid, local_idx))
-        offset += n_atoms
+    store = object_state.instances
+    rows = store.rows_of(active_instance_ids)
+    template_ids = store.template_ids[rows]
+    unique, inverse = np.unique(template_ids, return_inverse=True)
+    template_atoms = np.array(
+        [len(object_state.templates[tid].aids) for tid in unique.tolist()], dtype=np.intp
+    )
+    counts = template_atoms[inverse].reshape(-1)
+    offsets = np.zeros(len(rows) + 1, dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
 
     return AtomMapping(
-        sim_index_to_instance=index_list,
-        instance_to_sim_range=range_map,
-        total_atoms=offset,
+        instance_ids=store.ids[rows].copy(),
+        template_ids=template_ids,
+        offsets=offsets,
+        atom_slot=np.repeat(np.arange(len(rows), dtype=np.intp), counts),
     )
 
 
+def _template_bond_locals(template: MoleculeTemplate) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Local atom indices of each bond's endpoints. Bonds naming an atom ID the template does not
+    have are dropped.
+    """
+    aids = np.asarray(template.aids, dtype=np.int64)
+    a1 = np.asarray(template.bonds_aid1, dtype=np.int64)
+    a2 = np.asarray(template.bonds_aid2, dtype=np.int64)
+    if aids.size == 0 or a1.size == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    order = np.argsort(aids, kind="stable")
+    sorted_aids = aids[order]
+    pos1 = np.minimum(np.searchsorted(sorted_aids, a1), aids.size - 1)
+    pos2 = np.minimum(np.searchsorted(sorted_aids, a2), aids.size - 1)
+    valid = (sorted_aids[pos1] == a1) & (sorted_aids[pos2] == a2)
+    return order[pos1[valid]].astype(np.intp), order[pos2[valid]].astype(np.intp)
+
+
+def build_bond_topology(
+    object_state: ObjectState,
+    atom_mapping: AtomMapping,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Flat simulation row pairs for every bond of every mapped instance.
+
+    Each template's bond list is resolved to local atom indices once, then tiled across its
+    instances by adding each slot's row offset.
+
+    Args:
+        object_state: Scene state with templates.
+        atom_mapping: Index mapping.
+
+    Returns:
+        Tuple of (first rows, second rows), each shape (B,), grouped by slot in mapping order.
+    """
+    unique, inverse = np.unique(atom_mapping.template_ids, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    locals_1: list[np.ndarray] = []
+    locals_2: list[np.ndarray] = []
+    for tid in unique.tolist():
+        l1, l2 = _template_bond_locals(object_state.templates[tid])
+        locals_1.append(l1)
+        locals_2.append(l2)
+    if not locals_1:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+
+    template_bonds = np.array([len(l1) for l1 in locals_1], dtype=np.intp)
+    template_first = np.concatenate(([0], np.cumsum(template_bonds)[:-1]))
+    all_1 = np.concatenate(locals_1)
+    all_2 = np.concatenate(locals_2)
+
+    slot_bonds = template_bonds[inverse]
+    bond_slot = np.repeat(np.arange(len(inverse)), slot_bonds)
+    local_k = np.arange(int(slot_bonds.sum())) - np.repeat(
+        np.cumsum(slot_bonds) - slot_bonds, slot_bonds
+    )
+    source = template_first[inverse[bond_slot]] + local_k
+    slot_start = atom_mapping.starts[bond_slot]
+    return slot_start + all_1[source], slot_start + all_2[source]
+
+
+def _template_sim_masses(template: MoleculeTemplate) -> np.ndarray:
+    """Per-atom integrator masses in kg for one template."""
+    elements = np.asarray(template.elements, dtype=np.int64)
+    mass_amu = np.array([ELEMENT_MASSES.get(int(el), 12.0) for el in elements], dtype=np.float64)
+    # Use carbon mass for H in the harmonic integrator: real H mass (1 amu)
+    # causes float64 overflow in the velocity update at dt > ~20 fs.
+    mass_amu[elements == 1] = 12.0
+    return mass_amu * AMU_TO_KG
+
+
 def flatten_positions(
     object_state: ObjectState,
     atom_mapping: AtomMapping,
@@ -101,6 +293,9 @@ def flatten_positions(
     """
     Extract world-space atom positions, masses, and atomic numbers into flat arrays.
 
+    Instances are grouped by template so each group is transformed with one einsum, and
+    masses and atomic numbers are tiled from per-template vectors.
+
     Args:
         object_state: Scene state.
         atom_mapping: Index mapping.
@@ -112,23 +307,24 @@ def flatten_positions(
     positions = np.empty((n, 3), dtype=np.float64)
     masses = np.empty(n, dtype=np.float64)
     atomic_numbers = np.empty(n, dtype=np.int64)
-
-    for iid, (start, end) in atom_mapping.instance_to_sim_range.items():
-        inst = object_state.instances[iid]
-        tmpl = object_state.templates[inst.template_id]
-        world_xyz = apply_instance_transform(template=tmpl, instance=inst)
-        coords = np.column_stack(world_xyz)  # (n_atoms, 3) in Angstroms
-        positions[start:end] = coords * 1e-10  # Å -> metres
-
-        for local_idx, global_idx in enumerate(range(start, end)):
-            element = int(tmpl.elements[local_idx])
-            atomic_numbers[global_idx] = element
-            mass_amu = ELEMENT_MASSES.get(element, 12.0)
-            # Use carbon mass for H in the harmonic integrator: real H mass (1 amu)
-            # causes float64 overflow in the velocity update at dt > ~20 fs.
-            if element == 1:
-                mass_amu = 12.0
-            masses[global_idx] = mass_amu * AMU_TO_KG
+    if len(atom_mapping.instance_ids) == 0:
+        return positions, masses, atomic_numbers
+
+    store = object_state.instances
+    rows = store.rows_of(atom_mapping.instance_ids)
+    starts = atom_mapping.starts
+    template_ids = atom_mapping.template_ids
+
+    for tid in np.unique(template_ids).tolist():
+        tmpl = object_state.templates[tid]
+        group = np.flatnonzero(template_ids == tid)
+        world = transform_template_instances(
+            tmpl, store.positions[rows[group]], store.rotations[rows[group]]
+        )  # (K, n_atoms, 3) in Angstroms
+        atom_rows = (starts[group, None] + np.arange(world.shape[1])).ravel()
+        positions[atom_rows] = world.reshape(-1, 3) * 1e-10  # Å -> metres
+        masses[atom_rows] = np.tile(_template_sim_masses(tmpl), len(group))
+        atomic_numbers[atom_rows] = np.tile(np.asarray(tmpl.elements, dtype=np.int64), len(group))
 
     return positions, masses, atomic_numbers
 
@@ -145,6 +341,10 @@ class SimulationThread:
     Internal timestep is fixed at 1 fs for stability regardless of the speed
     slider. set_timestep() maps the slider value to steps_per_write, controlling
     how many fs of simulation time are advanced each buffer write (visual speed).
+    An optional StepBudgetController splits each batch into sub-batches with GIL
+    yields in between, sized so the render loop holds its target frame rate.
+    With a SimulationWorkerPool the batches run on the pool's shared workers
+    instead of a dedicated thread.
     """
 
     def __init__(
@@ -153,8 +353,12 @@ class SimulationThread:
         active_instance_ids: list[int],
         temperature: float = 298.15,
         engine: MDEngine | None = None,
+        controller: StepBudgetController | None = None,
+        pool: "SimulationWorkerPool | None" = None,
     ) -> None:
         self.engine: MDEngine | None = engine
+        self.controller: StepBudgetController | None = controller
+        self.steps_per_second: float = 0.0  # EMA of this thread's measured step rate
         self.object_state: ObjectState = object_state
 
         self._mapping: AtomMapping = build_atom_mapping(
@@ -168,31 +372,29 @@ class SimulationThread:
 
         # Precompute bond spring data from molecular topology.
         # For each bond: (flat_i, flat_j) index pair and equilibrium bond vector.
-        f1_list: list[int] = []
-        f2_list: list[int] = []
-        for iid, (start, _end) in self._mapping.instance_to_sim_range.items():
-            inst = object_state.instances[iid]
-            tmpl = object_state.templates[inst.template_id]
-            aid_to_local = {int(aid): i for i, aid in enumerate(tmpl.aids)}
-            for a1, a2 in zip(tmpl.bonds_aid1, tmpl.bonds_aid2):
-                l1 = aid_to_local.get(int(a1))
-                l2 = aid_to_local.get(int(a2))
-                if l1 is not None and l2 is not None:
-                    f1_list.append(start + l1)
-                    f2_list.append(start + l2)
-
-        self._bond_f1: np.ndarray = np.array(f1_list, dtype=np.intp)
-        self._bond_f2: np.ndarray = np.array(f2_list, dtype=np.intp)
+        self._bond_f1, self._bond_f2 = build_bond_topology(object_state, self._mapping)
         # Equilibrium bond vectors: r_j_eq - r_i_eq for each bond
-        if len(f1_list):
-            self._bond_eq: np.ndarray = (
-                positions[self._bond_f2] - positions[self._bond_f1]
-            )
-        else:
-            self._bond_eq = np.zeros((0, 3))
+        self._bond_eq: np.ndarray = positions[self._bond_f2] - positions[self._bond_f1]
+
+        # Per-instance health monitoring. Slots in the mapping are contiguous and in order, so
+        # per-instance reductions are a single reduceat over the atom rows.
+        self.instance_ids: list[int] = self._mapping.instance_ids.tolist()
+        self._instance_starts: np.ndarray = self._mapping.starts
+        self._instance_atom_counts: np.ndarray = self._mapping.atom_counts
+        self._atom_instance: np.ndarray = self._mapping.atom_slot
+        n_instances = len(self.instance_ids)
+        # Published to the render thread: False once an instance is quarantined (pinned at
+        # equilibrium after repeated resets). Indexed like instance_ids.
+        self.instance_healthy: np.ndarray = np.ones(n_instances, dtype=bool)
+        self.instance_resets: np.ndarray = np.zeros(n_instances, dtype=np.int32)
+        # Consecutive health checks each instance has spent above SIM_HEALTH_WARM_FACTOR
+        self._instance_warm_checks: np.ndarray = np.zeros(n_instances, dtype=np.int32)
+        self._dt_scale: float = 1.0  # Fraction of HARMONIC_DT; halves on blow-up, recovers
 
         # Steps per buffer write; controlled by set_timestep via speed slider
         self._steps_per_write: int = 50
+        # Minimum wall time between buffer writes; 0 runs flat out (set by the scheduler)
+        self._write_interval: float = 0.0
 
         rng = np.random.default_rng(42)
         velocities = assign_boltzmann_velocities(masses, temperature, rng)
@@ -207,27 +409,37 @@ class SimulationThread:
             timestep=HARMONIC_DT,
         )
 
-        self.buffer: SharedPositionBuffer = SharedPositionBuffer(
-            self._mapping.total_atoms
+        self.buffer: FrameRingBuffer = FrameRingBuffer(
+            self._mapping.total_atoms, capacity=MD_FRAME_HISTORY
         )
         self.buffer.write(positions)
+        # Instance bounding spheres for culling, moved along with every frame written
+        self.bounds: InstanceBounds = InstanceBounds(object_state, padding=MD_CULL_PADDING_A)
 
         self._rng: np.random.Generator = rng
+        self.pool: SimulationWorkerPool | None = pool
         self._thread: threading.Thread | None = None
+        self._started: bool = False
         self._stop_event: threading.Event = threading.Event()
-        self._paused_event: threading.Event = threading.Event()
-        self._paused_event.set()  # Start paused; user must click toggle
+        # Set while the loop may step. Waiting on it blocks with no CPU use; stop() also sets it
+        # so a blocked thread wakes up and sees the stop request.
+        self._run_event: threading.Event = threading.Event()  # Start paused; user must click toggle
 
     @property
     def mapping(self) -> AtomMapping:
         return self._mapping
 
     def start(self) -> None:
-        """Spawn the background thread."""
-        if self._thread is not None and self._thread.is_alive():
+        """Spawn the background thread, or register with the worker pool if one was given."""
+        if self._started and not self._stop_event.is_set():
             return
         self._stop_event.clear()
         self.state.running = True
+        self._started = True
+        if self.pool is not None:
+            if self._run_event.is_set():
+                self.pool.schedule(self)
+            return
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
@@ -236,10 +448,11 @@ class SimulationThread:
 
         Setting the stop event lets the daemon thread exit asynchronously. We avoid
         joining here to prevent the main/UI thread from blocking when many
-        simulation threads are stopped at once.
+        simulation threads are stopped at once. Pooled simulations are dropped by
+        their worker the next time they come up.
         """
         self._stop_event.set()
-        self._paused_event.clear()
+        self._run_event.set()
         # Mark as not running immediately so callers observe the stopped state.
         self.state.running = False
         # Do not join the thread here; it is a daemon and will exit on its own.
@@ -249,18 +462,22 @@ class SimulationThread:
 
     def pause(self) -> None:
         """Pause the simulation loop. State is preserved."""
-        self._paused_event.set()
+        self._run_event.clear()
 
     def resume(self) -> None:
         """Resume the simulation loop from current state."""
-        self._paused_event.clear()
+        if self._stop_event.is_set():
+            return
+        self._run_event.set()
+        if self.pool is not None and self._started:
+            self.pool.schedule(self)
 
     def is_running(self) -> bool:
-        return (
-            self._thread is not None
-            and self._thread.is_alive()
-            and not self._paused_event.is_set()
-        )
+        if self._stop_event.is_set() or not self._run_event.is_set():
+            return False
+        if self.pool is not None:
+            return self._started
+        return self._thread is not None and self._thread.is_alive()
 
     def set_temperature(self, temperature: float) -> None:
         """Update the thermostat target. Takes effect on the next step."""
@@ -270,6 +487,81 @@ class SimulationThread:
         """Map speed-slider value to steps_per_write for the harmonic integrator."""
         self._steps_per_write = max(1, int(dt / HARMONIC_DT))
 
+    def _check_health(
+        self, pos: np.ndarray, vel: np.ndarray, masses: np.ndarray, temperature: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Per-write-batch stability check, escalating per instance:
+          hot (kinetic T > SIM_HEALTH_HOT_FACTOR x target,
+          or > SIM_HEALTH_WARM_FACTOR x target for
+          SIM_HEALTH_WARM_CHECKS checks in a row)             -> rescale its velocities to target
+          broken (non-finite, or an atom displaced more than
+          CUMULATIVE_DRIFT_LIMIT_A from equilibrium)          -> reset it to equilibrium with fresh
+                                                               velocities and halve the timestep
+          reset more than SIM_HEALTH_MAX_RESETS times         -> quarantine: pin at equilibrium
+        The timestep creeps back up after every clean batch.
+
+        Args:
+            pos: Positions after the batch, shape (N, 3) in metres. May be modified in place.
+            vel: Velocities after the batch, shape (N, 3) in m/s. May be modified in place.
+            masses: Atom masses, shape (N,) in kg.
+            temperature: Thermostat target in Kelvin.
+
+        Returns:
+            Tuple of (positions, velocities) safe to publish.
+        """
+        if len(self._instance_starts) == 0:
+            return pos, vel
+        starts = self._instance_starts
+        atom_instance = self._atom_instance
+
+        displacement_a = np.max(np.abs(pos - self._equilibrium), axis=1) / 1e-10
+        instance_disp = np.maximum.reduceat(displacement_a, starts)
+        kinetic = 0.5 * masses * np.sum(vel * vel, axis=1)
+        instance_temp = np.add.reduceat(kinetic, starts) / (
+            1.5 * self._instance_atom_counts * BOLTZMANN_CONSTANT
+        )
+        # NaN compares False, so non-finite instances land in broken
+        broken = ~((instance_disp <= CUMULATIVE_DRIFT_LIMIT_A) & np.isfinite(instance_temp))
+        target = max(temperature, 1.0)
+        warm = ~broken & (instance_temp > SIM_HEALTH_WARM_FACTOR * target)
+        self._instance_warm_checks = np.where(warm, self._instance_warm_checks + 1, 0)
+        hot = warm & (
+            (instance_temp > SIM_HEALTH_HOT_FACTOR * target)
+            | (self._instance_warm_checks >= SIM_HEALTH_WARM_CHECKS)
+        )
+        self._instance_warm_checks[hot] = 0
+
+        if hot.any():
+            scale = np.ones(len(starts))
+            scale[hot] = np.sqrt(max(temperature, 0.0) / instance_temp[hot])
+            vel = vel * scale[atom_instance][:, None]
+
+        if broken.any():
+            self.instance_resets[broken] += 1
+            rows = broken[atom_instance]
+            pos[rows] = self._equilibrium[rows]
+            vel[rows] = assign_boltzmann_velocities(masses[rows], temperature, self._rng)
+            self._dt_scale = max(SIM_MIN_DT_SCALE, self._dt_scale * 0.5)
+            self.instance_healthy = self.instance_resets <= SIM_HEALTH_MAX_RESETS
+            logger.warning(
+                "Reset %d unstable instance(s); timestep scale now %.3f",
+                int(broken.sum()),
+                self._dt_scale,
+            )
+        else:
+            self._dt_scale = min(1.0, self._dt_scale * 1.05)
+
+        if not self.instance_healthy.all():
+            rows = ~self.instance_healthy[atom_instance]
+            pos[rows] = self._equilibrium[rows]
+            vel[rows] = 0.0
+        return pos, vel
+
+    def set_write_interval(self, seconds: float) -> None:
+        """Throttle the loop to at most one buffer write per interval. 0 disables throttling."""
+        self._write_interval = max(0.0, seconds)
+
     def _compute_forces(self, positions: np.ndarray) -> np.ndarray:
         """
         Bond springs + weak per-atom anchor.
@@ -291,37 +583,137 @@ class SimulationThread:
         return forces
 
     def _run(self) -> None:
-        """Main loop: run _steps_per_write BAOAB steps then write buffer once."""
+        """Dedicated-thread loop: block while paused, otherwise step and write batches."""
+        while not self._stop_event.is_set():
+            self._run_event.wait()
+            if self._stop_event.is_set():
+                break
+            idle = self.run_batch()
+            if idle is None:
+                break
+            if idle > 0.0:
+                self._stop_event.wait(idle)
+
+    def run_batch(self) -> float | None:
+        """
+        Runs _steps_per_write BAOAB steps and writes the buffer once.
+
+        Returns:
+            float | None: Seconds to idle before the next batch to honour the write interval,
+                or None if the simulation failed and must not be run again.
+        """
         from src.dynamics.integrator import langevin_half_kick
 
-        while not self._stop_event.is_set():
-            if self._paused_event.is_set():
-                time.sleep(0.001)
-                continue
-
-            try:
-                dt = HARMONIC_DT
-                pos = self.state.positions
-                vel = self.state.velocities
-                masses = self.state.masses
-                T = self.state.temperature
-
-                for _ in range(self._steps_per_write):
+        try:
+            batch_start = time.monotonic()
+            pos = self.state.positions
+            vel = self.state.velocities
+            masses = self.state.masses
+            T = self.state.temperature
+
+            # Run the batch in controller-sized pieces, yielding the GIL in between
+            steps_left = self._steps_per_write
+            while steps_left > 0 and not self._stop_event.is_set():
+                controller = self.controller
+                n = steps_left if controller is None else min(steps_left, controller.sub_batch)
+                dt = HARMONIC_DT * self._dt_scale
+                for _ in range(n):
                     f = self._compute_forces(pos)
                     vel = langevin_half_kick(vel, f, masses, dt, T, LANGEVIN_GAMMA, self._rng)
                     pos = pos + dt * vel
                     f = self._compute_forces(pos)
                     vel = langevin_half_kick(vel, f, masses, dt, T, LANGEVIN_GAMMA, self._rng)
+                steps_left -= n
+                if controller is not None:
+                    controller.record_steps(n)
+                    if controller.yield_s > 0.0:
+                        time.sleep(controller.yield_s)
+
+            pos, vel = self._check_health(pos, vel, masses, T)
+            self.state.positions = pos
+            self.state.velocities = vel
+            self.state.forces = self._compute_forces(pos)
+            steps_done = self._steps_per_write - steps_left
+            self.state.step_count += steps_done
+            self.buffer.write(pos)
+            self.bounds.update_from_atoms(pos, self._mapping, scale=1e10)  # metres -> Angstroms
+
+            batch_elapsed = time.monotonic() - batch_start
+            rate = steps_done / max(batch_elapsed, 1e-9)
+            self.steps_per_second = 0.8 * self.steps_per_second + 0.2 * rate
+            return max(0.0, self._write_interval - batch_elapsed)
+
+        except Exception as exc:
+            logger.error("MD thread error: %s", exc, exc_info=True)
+            self.state.error = str(exc)
+            self.state.running = False
+            self._run_event.clear()
+            return None
+
+
+class SimulationWorkerPool:
+    """
+    A fixed set of worker threads shared by every SimulationThread created with pool=.
 
-                self.state.positions = pos
-                self.state.velocities = vel
-                self.state.forces = self._compute_forces(pos)
-                self.state.step_count += self._steps_per_write
-                self.buffer.write(pos)
-
-            except Exception as exc:
-                logger.error("MD thread error: %s", exc, exc_info=True)
-                self.state.error = str(exc)
-                self.state.running = False
-                self._paused_event.set()
-                break
+    Runnable simulations sit in a heap ordered by the time their next batch is due. A worker pops
+    the earliest one, runs one batch, and pushes it back if it is still running, so simulations
+    take turns batch by batch. Paused or stopped simulations are simply not in the heap, and
+    idle workers block on a condition variable, so nothing spins while the scene is static.
+    Streaming a chunk in therefore costs no new OS thread.
+
+    Args:
+        num_workers (int): Number of worker threads.
+    """
+
+    def __init__(self, num_workers: int = 2) -> None:
+        self._cond: threading.Condition = threading.Condition()
+        self._heap: list[tuple[float, int, SimulationThread]] = []
+        self._scheduled: set[int] = set()  # id() of simulations queued or being run
+        self._counter: int = 0  # Heap tie-breaker
+        self._workers: list[threading.Thread] = [
+            threading.Thread(target=self._work, name=f"sim-worker-{i}", daemon=True)
+            for i in range(max(1, num_workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def schedule(self, sim: "SimulationThread", delay: float = 0.0) -> None:
+        """
+        Queues a simulation for its next batch unless it is already queued or running.
+
+        Args:
+            sim (SimulationThread): Simulation to run.
+            delay (float, optional): Seconds before the batch is due. Defaults to 0.0.
+        """
+        with self._cond:
+            if id(sim) in self._scheduled:
+                return
+            self._scheduled.add(id(sim))
+            self._push(sim, delay)
+
+    def _push(self, sim: "SimulationThread", delay: float) -> None:
+        self._counter += 1
+        heapq.heappush(self._heap, (time.monotonic() + delay, self._counter, sim))
+        self._cond.notify()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    due = self._heap[0][0] - time.monotonic()
+                    if due <= 0.0:
+                        break
+                    self._cond.wait(due)
+                _due, _n, sim = heapq.heappop(self._heap)
+
+            # A paused simulation is skipped, but re-checked below in case it was resumed meanwhile
+            idle = sim.run_batch() if sim.is_running() else 0.0
+
+            with self._cond:
+                if idle is not None and sim.is_running():
+                    self._push(sim, idle)
+                else:
+                    self._scheduled.discard(id(sim))
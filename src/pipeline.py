@@ -0,0 +1,403 @@
+"""
+./src/pipeline.py
+
+python -m src.pipeline [--room albert_room] [--force STAGE ...] [--dry-run] [--adopt]
+
+Runs the data pipeline end to end, only redoing what changed:
+
+    frames -> reconstruction -> mesh -> annotations -> compositions -> structures -> templates
+
+Every stage records content hashes of its inputs and outputs in PIPELINE_STATE_PATH. A stage
+reruns only if an input, one of its outputs, or its settings (e.g. the LLM model and prompt) changed
+since it last ran. The two JSON stages also hash each object: when annotations.json changes, only
+the objects that were added or edited go through the LLM and PubChem, and every other object is
+copied from the previous output. Annotation is manual, so that stage is checked but never run.
+
+Stages import their tools only when they run, so a run that only has JSON work to do never needs
+ffmpeg or the 3D libraries installed.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+from src.render_molecules.arrangement.template_store import hash_source
+from src.utils.constants import (
+    FINAL_AGGREGATED,
+    OLLAMA_HOST,
+    PIPELINE_STATE_PATH,
+    TEMPLATE_STORE_DIR,
+)
+from src.utils.json_io import json_path, load_json, save_json
+from src.utils.resource_path import resource_path
+
+_STATE_FORMAT_VERSION = 1
+
+
+class PipelineError(RuntimeError):
+    """A stage cannot run, e.g. it needs a manual step or an unsupported platform."""
+
+
+@dataclass
+class Stage:
+    """
+    One pipeline step.
+
+    Attributes:
+        name (str): Stage name, as used by --force.
+        inputs (list[str]): Project-relative files or folders the stage reads.
+        outputs (list[str]): Project-relative files or folders the stage writes.
+        run (Callable[[], None] | None): Runs the stage. None for manual stages.
+        fingerprint (Callable[[], str]): Settings that change the stage's output besides its inputs.
+        manual (str): Instructions for a stage the user runs by hand; empty for automatic stages.
+    """
+
+    name: str
+    inputs: list[str]
+    outputs: list[str]
+    run: Callable[[], None] | None = None
+    fingerprint: Callable[[], str] = lambda: ""
+    manual: str = ""
+
+
+@dataclass
+class ObjectStage(Stage):
+    """
+    A stage mapping one object-keyed JSON file in vision_json/ to another, object by object.
+
+    Attributes:
+        source (str): Input filename in vision_json/.
+        target (str): Output filename in vision_json/.
+        transform (Callable[[dict], dict] | None): Processes a subset of the source objects and
+            returns their output entries, keyed like the input.
+    """
+
+    source: str = ""
+    target: str = ""
+    transform: Callable[[dict], dict] | None = None
+
+
+def hash_path(path: str) -> str | None:
+    """
+    Hashes the content of a file, or of every file below a folder with their relative paths.
+
+    Args:
+        path (str): Absolute path.
+
+    Returns:
+        str | None: Hex SHA-256, or None if the path does not exist.
+    """
+    if os.path.isfile(path):
+        return hash_source(path)
+    if not os.path.isdir(path):
+        return None
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            digest.update(os.path.relpath(file_path, path).encode())
+            digest.update(hash_source(file_path).encode())
+    return digest.hexdigest()
+
+
+def hash_object(entry: object, fingerprint: str) -> str:
+    """
+    Hashes one object's JSON entry together with the stage settings.
+
+    Args:
+        entry (object): The object's entry in a stage's source file.
+        fingerprint (str): Stage settings; see Stage.fingerprint.
+
+    Returns:
+        str: Hex SHA-256.
+    """
+    payload = json.dumps([fingerprint, entry], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def build_stages(room: str) -> list[Stage]:
+    """
+    Declares the pipeline for one room scan, with paths matching each script's defaults.
+
+    Args:
+        room (str): Scan name used in the video, image, USDZ and OBJ filenames.
+
+    Returns:
+        list[Stage]: Stages in run order.
+    """
+    video = f"data/env_vids/{room}.mov"
+    frames = f"data/env_imgs/{room}"
+    usdz = f"data/reconstructions/usdz/{room}.usdz"
+    obj = f"data/reconstructions/obj/{room}.obj"
+    vision = "data/vision_json/"
+
+    def extract() -> None:
+        from src.video_processing.reconstruction.vid_to_imgs import extract_frames_parallel
+
+        extract_frames_parallel(resource_path(video), resource_path(frames))
+
+    def reconstruct() -> None:
+        if sys.platform != "darwin":
+            raise PipelineError("reconstruction uses Apple's photogrammetry and only runs on macOS")
+        from src.video_processing.reconstruction.run_swift_scan import native_scan
+
+        os.makedirs(os.path.dirname(resource_path(usdz)), exist_ok=True)
+        native_scan(resource_path(frames), resource_path(usdz))
+
+    def convert() -> None:
+        from src.video_processing.view_reconstruction import convert_to_obj
+
+        convert_to_obj(resource_path(usdz), resource_path(obj))
+
+    def composition_settings() -> str:
+        from src.video_processing.material_tagging.add_molecular_components import (
+            MODEL,
+            prompt_digest,
+        )
+
+        return f"{MODEL}:{prompt_digest()}"
+
+    def compose(objects: dict) -> dict:
+        import ollama
+
+        from src.video_processing.material_tagging.add_molecular_components import (
+            MODEL,
+            aggregate_compositions,
+        )
+
+        client = ollama.Client(host=OLLAMA_HOST)
+        print(f"Pulling {MODEL} from ollama")
+        client.pull(MODEL)
+        return aggregate_compositions(objects, client=client)
+
+    def fetch_structures(objects: dict) -> dict:
+        from src.render_molecules.processing.mol_details_pubchem import build_details
+
+        build_details(objects)
+        return objects
+
+    def compile_templates() -> None:
+        from src.render_molecules.arrangement.template_store import TemplateStore
+
+        TemplateStore(resource_path(TEMPLATE_STORE_DIR) if TEMPLATE_STORE_DIR else None).load(
+            json_path(FINAL_AGGREGATED)
+        )
+
+    return [
+        Stage("frames", inputs=[video], outputs=[frames], run=extract),
+        Stage("reconstruction", inputs=[frames], outputs=[usdz], run=reconstruct),
+        Stage("mesh", inputs=[usdz], outputs=[obj], run=convert),
+        Stage(
+            "annotations",
+            inputs=[obj],
+            outputs=[vision + "annotations.json"],
+            manual="python -m src.video_processing.material_tagging.annotator",
+        ),
+        ObjectStage(
+            "compositions",
+            inputs=[vision + "annotations.json"],
+            outputs=[vision + "aggregated.json"],
+            fingerprint=composition_settings,
+            source="annotations.json",
+            target="aggregated.json",
+            transform=compose,
+        ),
+        ObjectStage(
+            "structures",
+            inputs=[vision + "aggregated.json"],
+            outputs=[vision + FINAL_AGGREGATED],
+            source="aggregated.json",
+            target=FINAL_AGGREGATED,
+            transform=fetch_structures,
+        ),
+        Stage("templates", inputs=[vision + FINAL_AGGREGATED], outputs=[], run=compile_templates),
+    ]
+
+
+class Pipeline:
+    """
+    Runs stages in order, skipping those whose recorded hashes still match.
+
+    Args:
+        stages (list[Stage]): Stages in run order; see build_stages.
+        state_path (str): Absolute path of the JSON file holding the recorded hashes.
+    """
+
+    def __init__(self, stages: list[Stage], state_path: str) -> None:
+        self.stages: list[Stage] = stages
+        self.state_path: str = state_path
+        self.state: dict[str, dict] = self._load_state()
+
+    def _load_state(self) -> dict[str, dict]:
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            print(f"Ignoring unreadable pipeline state {self.state_path}: {exc}")
+            return {}
+        if state.get("version") != _STATE_FORMAT_VERSION:
+            return {}
+        return state.get("stages", {})
+
+    def _save_state(self) -> None:
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": _STATE_FORMAT_VERSION, "stages": self.state}, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    @staticmethod
+    def _hashes(paths: list[str]) -> dict[str, str | None]:
+        return {path: hash_path(resource_path(path)) for path in paths}
+
+    def _record(self, stage: Stage, fingerprint: str, objects: Mapping[str, str] | None) -> None:
+        self.state[stage.name] = {
+            "fingerprint": fingerprint,
+            "inputs": self._hashes(stage.inputs),
+            "outputs": self._hashes(stage.outputs),
+            "objects": dict(objects or {}),
+        }
+        self._save_state()
+
+    def _source_objects(self, stage: ObjectStage, fingerprint: str) -> tuple[dict, dict[str, str]]:
+        source = load_json(stage.source)
+        return source, {name: hash_object(entry, fingerprint) for name, entry in source.items()}
+
+    def run(self, force: set[str] | None = None, dry_run: bool = False, adopt: bool = False) -> None:
+        """
+        Brings every stage up to date.
+
+        Args:
+            force (set[str] | None, optional): Stage names to rerun in full regardless of hashes.
+                Defaults to None.
+            dry_run (bool, optional): Only report what would run. Defaults to False.
+            adopt (bool, optional): Record the current files as up to date without running
+                anything, e.g. for outputs produced before the pipeline was used. Defaults to False.
+        """
+        force = force or set()
+        unknown = force - {stage.name for stage in self.stages}
+        if unknown:
+            raise PipelineError(f"unknown stage(s): {', '.join(sorted(unknown))}")
+
+        for stage in self.stages:
+            fingerprint = stage.fingerprint()
+            inputs = self._hashes(stage.inputs)
+            outputs = self._hashes(stage.outputs)
+            outputs_exist = all(digest is not None for digest in outputs.values())
+            recorded = self.state.get(stage.name)
+            current = (
+                recorded is not None
+                and recorded.get("fingerprint") == fingerprint
+                and recorded.get("inputs") == inputs
+                and recorded.get("outputs") == outputs
+                and outputs_exist
+            )
+
+            if adopt:
+                if not outputs_exist:
+                    print(f"[{stage.name}] outputs missing, nothing to adopt")
+                    continue
+                objects = None
+                if isinstance(stage, ObjectStage):
+                    objects = self._source_objects(stage, fingerprint)[1]
+                self._record(stage, fingerprint, objects)
+                print(f"[{stage.name}] adopted")
+                continue
+
+            if current and stage.name not in force:
+                print(f"[{stage.name}] up to date")
+                continue
+
+            # Sources of earlier steps are often absent (e.g. the video once the mesh exists)
+            missing = [path for path, digest in inputs.items() if digest is None]
+            if missing:
+                kept = "keeping existing outputs" if outputs_exist else "skipped"
+                print(f"[{stage.name}] inputs unavailable ({', '.join(missing)}), {kept}")
+                continue
+
+            if stage.manual:
+                if not outputs_exist:
+                    raise PipelineError(f"[{stage.name}] needs a manual step: {stage.manual}")
+                if recorded is not None and recorded.get("inputs") != inputs:
+                    print(f"[{stage.name}] inputs changed; rerun `{stage.manual}` if needed")
+                else:
+                    print(f"[{stage.name}] updated by hand")
+                if not dry_run:
+                    self._record(stage, fingerprint, None)
+                continue
+
+            if isinstance(stage, ObjectStage):
+                self._run_objects(stage, fingerprint, stage.name in force, dry_run)
+                continue
+
+            if dry_run:
+                print(f"[{stage.name}] would run")
+                continue
+            print(f"[{stage.name}] running")
+            assert stage.run is not None
+            stage.run()
+            self._record(stage, fingerprint, None)
+
+    def _run_objects(
+        self, stage: ObjectStage, fingerprint: str, full: bool, dry_run: bool
+    ) -> None:
+        """Reprocesses only the objects whose source entry (or the stage settings) changed."""
+        source, hashes = self._source_objects(stage, fingerprint)
+        previous: dict = {}
+        if not full and os.path.isfile(json_path(stage.target)):
+            previous = load_json(stage.target)
+        recorded = {} if full else self.state.get(stage.name, {}).get("objects", {})
+        stale = {
+            name: entry
+            for name, entry in source.items()
+            if recorded.get(name) != hashes[name] or name not in previous
+        }
+        removed = len(set(previous) - set(source))
+
+        print(
+            f"[{stage.name}] {len(stale)} of {len(source)} objects changed"
+            + (f", {removed} removed" if removed else "")
+        )
+        if dry_run:
+            return
+        assert stage.transform is not None
+        fresh = stage.transform(stale) if stale else {}
+        save_json(
+            {name: fresh[name] if name in stale else previous[name] for name in source},
+            stage.target,
+            compact=True,
+        )
+        self._record(stage, fingerprint, hashes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the Seer data pipeline incrementally.")
+    parser.add_argument("--room", default="albert_room", help="Scan name used in data/ filenames")
+    parser.add_argument(
+        "--force", nargs="*", default=[], metavar="STAGE", help="Stages to rerun in full"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would run")
+    parser.add_argument(
+        "--adopt",
+        action="store_true",
+        help="Record existing outputs as up to date without running anything",
+    )
+    args = parser.parse_args()
+
+    pipeline = Pipeline(build_stages(args.room), resource_path(PIPELINE_STATE_PATH))
+    try:
+        pipeline.run(force=set(args.force), dry_run=args.dry_run, adopt=args.adopt)
+    except PipelineError as exc:
+        print(f"Pipeline stopped: {exc}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,7 @@ from src.render_molecules.arrangement.scene_state import (
     MoleculeTemplate,
     ObjectState,
 )
+from src.render_molecules.arrangement.template_store import template_from_sim_details
 from src.utils.constants import ANGSTROM_TO_METRES
 from src.utils.json_io import load_json
 
@@ -53,30 +54,7 @@ def build_templates_from_object(object_data: dict) -> dict[int, MoleculeTemplate
     for mol_name, mol_data in object_data["composition"].items():
         if "sim_details" not in mol_data:
             continue
-
-        sd = mol_data["sim_details"]
-        aids = np.array(sd["atoms"]["aid"], dtype=int)
-        elements = np.array(sd["atoms"]["element"], dtype=int)
-
-        conformer = sd["coords"][0]["conformers"][0]
-        xs = np.array(conformer["x"], dtype=float)
-        ys = np.array(conformer["y"], dtype=float)
-        zs = np.array(conformer["z"], dtype=float)
-
-        bonds = sd.get("bonds", {})
-        bonds_aid1 = np.array(bonds.get("aid1", []), dtype=int)
-        bonds_aid2 = np.array(bonds.get("aid2", []), dtype=int)
-        bond_order = np.array(bonds.get("order", []), dtype=int)
-
-        templates[template_id] = MoleculeTemplate(
-            name=mol_name,
-            aids=aids,
-            elements=elements,
-            local_xyz=(xs, ys, zs),
-            bonds_aid1=bonds_aid1,
-            bonds_aid2=bonds_aid2,
-            bond_order=bond_order,
-        )
+        templates[template_id] = template_from_sim_details(mol_name, mol_data["sim_details"])
         template_id += 1
 
     return templates
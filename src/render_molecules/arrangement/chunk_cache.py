@@ -0,0 +1,255 @@
+"""
+./src/render_molecules/arrangement/chunk_cache.py
+
+Content-addressed cache for placed molecule arrangements.
+
+Placement is deterministic for a given template set, seed and PlacementConfig, so its output can be
+stored under a hash of exactly those inputs. Positions are stored relative to the placement box's
+min corner, so every toroidal copy of a chunk shares one entry. Entries are kept in memory as a
+handful of flat arrays and can optionally be persisted as one .npz file per key, so revisiting a
+chunk (or restarting the app) loads its layout instead of re-running place_molecules.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+import numpy as np
+
+from src.render_molecules.arrangement.placement import PlacementConfig
+from src.render_molecules.arrangement.scene_state import (
+    InstanceStore,
+    MoleculeInstance,
+    MoleculeTemplate,
+)
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FORMAT_VERSION = 1
+
+
+@dataclass
+class PackedArrangement:
+    """
+    Structure-of-arrays snapshot of a placed arrangement. Compact in memory and maps 1:1 onto .npz.
+    """
+
+    ids: np.ndarray  # (M,) instance IDs
+    template_ids: np.ndarray  # (M,) template IDs
+    positions: np.ndarray  # (M, 3) rigid-body translations relative to the box min corner
+    rotations: np.ndarray  # (M, 3, 3) rotation matrices
+    hprs: np.ndarray  # (M, 3) (yaw, pitch, roll) in radians
+
+
+def hash_templates(templates: dict[int, MoleculeTemplate]) -> str:
+    """
+    Hashes everything about a template set that can change a placement result.
+
+    Args:
+        templates (dict[int, MoleculeTemplate]): Template ID to template map.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    for template_id in sorted(templates):
+        template = templates[template_id]
+        digest.update(f"{template_id}:{template.name}".encode())
+        for array in (
+            template.aids,
+            template.elements,
+            *template.local_xyz,
+            template.bonds_aid1,
+            template.bonds_aid2,
+            template.bond_order,
+        ):
+            contiguous = np.ascontiguousarray(array)
+            digest.update(str(contiguous.dtype).encode())
+            digest.update(contiguous.tobytes())
+    return digest.hexdigest()
+
+
+def arrangement_key(
+    templates_hash: str,
+    config: PlacementConfig,
+    target_counts: dict[int, int],
+    box_size: np.ndarray,
+) -> str:
+    """
+    Builds the cache key for one placement call. The seed is part of the config.
+    The box only contributes its size, since placement is translation invariant.
+
+    Args:
+        templates_hash (str): Output of hash_templates for the template set.
+        config (PlacementConfig): Placement configuration used.
+        target_counts (dict[int, int]): Target counts per template ID.
+        box_size (np.ndarray): Edge lengths of the placement box, shape (3,).
+
+    Returns:
+        str: Hex SHA-256 digest usable as a filename.
+    """
+    payload = json.dumps(
+        {
+            "version": _CACHE_FORMAT_VERSION,
+            "templates": templates_hash,
+            "config": asdict(config),
+            "targets": sorted((int(k), int(v)) for k, v in target_counts.items()),
+            "box_size": [round(float(v), 6) for v in box_size],
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def pack_instances(
+    instances: dict[int, MoleculeInstance], origin: np.ndarray
+) -> PackedArrangement:
+    """
+    Converts placed instances into flat arrays.
+
+    Args:
+        instances (dict[int, MoleculeInstance]): Instance ID to instance map.
+        origin (np.ndarray): Box min corner subtracted from every position, shape (3,).
+
+    Returns:
+        PackedArrangement: Array-backed copy of the instances.
+    """
+    if not isinstance(instances, InstanceStore):
+        instances = InstanceStore(instances)
+    return PackedArrangement(
+        ids=instances.ids.copy(),
+        template_ids=instances.template_ids.copy(),
+        positions=instances.positions - origin,
+        rotations=instances.rotations.copy(),
+        hprs=instances.hprs.copy(),
+    )
+
+
+def unpack_instances(packed: PackedArrangement, origin: np.ndarray) -> InstanceStore:
+    """
+    Rebuilds a fresh instance store from a packed arrangement with one array copy per field.
+    Every call returns new arrays, so callers may mutate the result freely.
+
+    Args:
+        packed (PackedArrangement): Packed arrangement.
+        origin (np.ndarray): Box min corner added back onto every position, shape (3,).
+
+    Returns:
+        InstanceStore: Instance ID to instance map.
+    """
+    return InstanceStore.from_arrays(
+        ids=packed.ids,
+        template_ids=packed.template_ids,
+        positions=packed.positions + origin,
+        rotations=packed.rotations,
+        hprs=packed.hprs,
+        velocities=np.zeros_like(packed.positions, dtype=float),
+    )
+
+
+class ArrangementCache:
+    """
+    Bounded in-memory LRU of packed arrangements with an optional .npz directory behind it.
+    Safe to share between chunk worker threads.
+
+    Args:
+        max_entries (int): Maximum number of arrangements held in memory.
+        cache_dir (str | None): Directory for persisted .npz files. None keeps the cache in memory only.
+    """
+
+    def __init__(self, max_entries: int = 1000, cache_dir: str | None = None) -> None:
+        self.max_entries: int = max(1, max_entries)
+        self.cache_dir: str | None = cache_dir
+        self._entries: OrderedDict[str, PackedArrangement] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+        if cache_dir is not None:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+            except OSError as exc:
+                logger.warning("Chunk cache dir %s unavailable: %s", cache_dir, exc)
+                self.cache_dir = None
+
+    def _path(self, key: str) -> str:
+        assert self.cache_dir is not None
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def _remember(self, key: str, packed: PackedArrangement) -> None:
+        with self._lock:
+            self._entries[key] = packed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str, origin: np.ndarray) -> InstanceStore | None:
+        """
+        Looks up an arrangement, falling back to disk when it is not in memory.
+
+        Args:
+            key (str): Key from arrangement_key.
+            origin (np.ndarray): Min corner of the box to place the arrangement in, shape (3,).
+
+        Returns:
+            InstanceStore | None: Fresh instances, or None on a miss.
+        """
+        with self._lock:
+            packed = self._entries.get(key)
+            if packed is not None:
+                self._entries.move_to_end(key)
+        if packed is None and self.cache_dir is not None and os.path.exists(self._path(key)):
+            try:
+                with np.load(self._path(key)) as data:
+                    packed = PackedArrangement(
+                        ids=data["ids"],
+                        template_ids=data["template_ids"],
+                        positions=data["positions"],
+                        rotations=data["rotations"],
+                        hprs=data["hprs"],
+                    )
+            except (OSError, KeyError, ValueError) as exc:
+                logger.warning("Discarding unreadable chunk cache entry %s: %s", key, exc)
+                packed = None
+            if packed is not None:
+                self._remember(key, packed)
+
+        if packed is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return unpack_instances(packed, origin)
+
+    def put(
+        self, key: str, instances: dict[int, MoleculeInstance], origin: np.ndarray
+    ) -> None:
+        """
+        Stores an arrangement in memory and, if configured, on disk.
+
+        Args:
+            key (str): Key from arrangement_key.
+            instances (dict[int, MoleculeInstance]): Placed instances to snapshot.
+            origin (np.ndarray): Min corner of the box the instances were placed in, shape (3,).
+        """
+        packed = pack_instances(instances, origin)
+        self._remember(key, packed)
+        if self.cache_dir is None:
+            return
+
+        # Write to a temp file first so a crash never leaves a truncated entry behind
+        tmp_path = f"{self._path(key)}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(f, **asdict(packed))
+            os.replace(tmp_path, self._path(key))
+        except OSError as exc:
+            logger.warning("Could not persist chunk cache entry %s: %s", key, exc)
+
+    def clear(self) -> None:
+        """Drops all in-memory entries. Persisted files are left alone."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,183 @@
+"""
+./src/render_molecules/arrangement/chunk_pool.py
+
+Background worker pool for chunk generation.
+
+Workers run placement and build each chunk's node tree detached from the scene graph. The main
+thread only re-scores pending requests, hands the most urgent ones to free workers, and attaches
+finished chunks within a per-frame time budget, so crossing a chunk border no longer stalls a frame.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+from panda3d.core import NodePath
+
+from src.render_molecules.arrangement.scene_state import ObjectState
+
+logger = logging.getLogger(__name__)
+
+ChunkCoords = tuple[int, int, int]
+
+
+@dataclass
+class ChunkBuildResult:
+    """
+    Everything a worker produces for one chunk. chunk_np is not yet attached to the scene graph.
+    lod_nodes holds one child of chunk_np per level of detail that was built, from detail upwards;
+    instance_roots is empty unless the full-detail level was built. flat_np, when present, is a
+    flattened copy of the full-detail level for use while dynamics is off.
+    """
+
+    coords: ChunkCoords
+    object_state: ObjectState
+    chunk_np: NodePath
+    instance_roots: dict[int, NodePath]
+    detail: int
+    lod_nodes: dict[int, NodePath]
+    flat_np: NodePath | None = None
+
+
+class ChunkWorkerPool:
+    """
+    Priority-ordered chunk builds on a thread pool.
+
+    Requests are kept in a pending map keyed by chunk coords with a priority (lower is more urgent).
+    At most max_workers builds are in flight at once, so everything else stays re-orderable: the
+    caller can re-score pending chunks every frame as the camera moves.
+
+    Every request carries a context captured by the caller on the main thread (e.g. the templates
+    to place), which is handed to build_fn unchanged, so workers never read mutable caller state.
+
+    Args:
+        build_fn (Callable[[ChunkCoords, int, Any], ChunkBuildResult]): Builds one detached chunk at
+            the requested level of detail from the request's context. Runs on a worker.
+        max_workers (int): Number of worker threads.
+    """
+
+    def __init__(
+        self,
+        build_fn: Callable[[ChunkCoords, int, Any], ChunkBuildResult],
+        max_workers: int = 2,
+    ) -> None:
+        self._build_fn = build_fn
+        self.max_workers: int = max(1, max_workers)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="chunk-build"
+        )
+        self._pending: dict[ChunkCoords, tuple[float, int, Any]] = {}  # (priority, detail, context)
+        self._in_flight: dict[ChunkCoords, Future] = {}
+        self._abandoned: set[ChunkCoords] = set()  # Running builds whose result is unwanted
+        self.failed: set[ChunkCoords] = set()  # Never re-requested until cancel_all
+
+    def request(
+        self, coords: ChunkCoords, priority: float, detail: int = 0, context: Any = None
+    ) -> None:
+        """
+        Queues a chunk build, or updates its priority, detail and context if it is already pending.
+
+        Args:
+            coords (ChunkCoords): Chunk grid coords.
+            priority (float): Urgency; lower values are built first.
+            detail (int, optional): Finest level of detail to build, passed to build_fn. Defaults to 0.
+            context (Any, optional): Inputs for build_fn, captured by the caller when queueing.
+                Defaults to None.
+        """
+        if coords in self._in_flight:
+            self._abandoned.discard(coords)
+            return
+        if coords in self.failed:
+            return
+        self._pending[coords] = (priority, detail, context)
+
+    def cancel(self, coords: ChunkCoords) -> None:
+        """
+        Drops a pending request. In-flight builds finish but their result is discarded.
+
+        Args:
+            coords (ChunkCoords): Chunk grid coords.
+        """
+        self._pending.pop(coords, None)
+        future = self._in_flight.get(coords)
+        if future is None:
+            return
+        if future.cancel():
+            del self._in_flight[coords]
+        else:
+            self._abandoned.add(coords)
+
+    def cancel_all(self) -> None:
+        """Drops every pending request and orphans every in-flight build."""
+        self._pending.clear()
+        for future in self._in_flight.values():
+            future.cancel()
+        self._in_flight.clear()
+        self._abandoned.clear()
+        self.failed.clear()
+
+    def is_queued(self, coords: ChunkCoords) -> bool:
+        """Returns True if the chunk is pending or being built."""
+        return coords in self._pending or (
+            coords in self._in_flight and coords not in self._abandoned
+        )
+
+    def queued(self) -> list[ChunkCoords]:
+        """Returns coords of every pending or in-flight chunk."""
+        return [
+            *self._pending,
+            *(c for c in self._in_flight if c not in self._abandoned),
+        ]
+
+    def pump(self) -> None:
+        """Hands the most urgent pending chunks to idle workers."""
+        free = self.max_workers - len(self._in_flight)
+        if free <= 0 or not self._pending:
+            return
+        for coords in sorted(self._pending, key=lambda c: self._pending[c][0])[:free]:
+            _priority, detail, context = self._pending.pop(coords)
+            self._in_flight[coords] = self._executor.submit(self._build_fn, coords, detail, context)
+
+    def collect(
+        self, budget_s: float, max_results: int | None = None
+    ) -> Iterator[ChunkBuildResult]:
+        """
+        Yields finished builds until the time budget or max_results runs out.
+        Failed builds are logged and skipped.
+
+        Args:
+            budget_s (float): Wall-clock budget in seconds for the caller's attach work.
+            max_results (int | None, optional): Hard cap on results per call. Defaults to None.
+
+        Yields:
+            ChunkBuildResult: A finished, still-detached chunk.
+        """
+        start = time.perf_counter()
+        yielded = 0
+        for coords, future in list(self._in_flight.items()):
+            if not future.done():
+                continue
+            if time.perf_counter() - start > budget_s:
+                return
+            if max_results is not None and yielded >= max_results:
+                return
+            del self._in_flight[coords]
+            if coords in self._abandoned:
+                self._abandoned.discard(coords)
+                continue
+            try:
+                result = future.result()
+            except Exception as exc:
+                logger.error("Chunk %s failed to build: %s", coords, exc, exc_info=True)
+                self.failed.add(coords)
+                continue
+            yielded += 1
+            yield result
+
+    def shutdown(self) -> None:
+        """Stops accepting work and lets running builds finish in the background."""
+        self.cancel_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
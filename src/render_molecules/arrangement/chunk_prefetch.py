@@ -0,0 +1,166 @@
+"""
+./src/render_molecules/arrangement/chunk_prefetch.py
+
+Predictive chunk prefetching for the molecular world.
+
+Tracks the camera over recent frames, extrapolates where it is heading, and lists the chunks it will
+need before it gets there so the worker pool can build them ahead of time. Also keeps a running hit
+rate: how often a chunk was already loaded at the moment it entered the load radius.
+"""
+
+import logging
+from collections import deque
+from collections.abc import Iterable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ChunkCoords = tuple[int, int, int]
+
+_REPORT_EVERY = 50  # Log the hit rate after this many demanded chunks
+
+
+class ChunkPrefetcher:
+    """
+    Camera-velocity extrapolation over a toroidal chunk world.
+
+    Args:
+        chunk_size (float): Chunk edge length in Angstroms.
+        world_size (float): World edge length in Angstroms; positions wrap into [-world/2, world/2).
+        horizon_s (float): How far ahead in time to predict.
+        history_frames (int): Number of recent camera samples used for the velocity estimate.
+        path_samples (int): Number of points sampled along the predicted path.
+    """
+
+    def __init__(
+        self,
+        chunk_size: float,
+        world_size: float,
+        horizon_s: float = 2.0,
+        history_frames: int = 10,
+        path_samples: int = 4,
+    ) -> None:
+        self.chunk_size: float = chunk_size
+        self.world_size: float = world_size
+        self.horizon_s: float = horizon_s
+        self.path_samples: int = max(1, path_samples)
+        self._history: deque[tuple[float, np.ndarray]] = deque(maxlen=max(2, history_frames))
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def reset(self) -> None:
+        """Forgets the camera history, e.g. after a teleport or mode switch."""
+        self._history.clear()
+
+    def observe(self, now: float, position: np.ndarray) -> None:
+        """
+        Records one camera sample.
+
+        Args:
+            now (float): Monotonic time in seconds.
+            position (np.ndarray): Camera position in molecular space (Angstroms), shape (3,).
+        """
+        self._history.append((now, np.array(position, dtype=float)))
+
+    def velocity(self) -> np.ndarray:
+        """
+        Average camera velocity over the history window, unwrapping world-boundary jumps.
+
+        Returns:
+            np.ndarray: Velocity in Angstroms per second, shape (3,).
+        """
+        if len(self._history) < 2:
+            return np.zeros(3)
+        elapsed = self._history[-1][0] - self._history[0][0]
+        if elapsed <= 1e-6:
+            return np.zeros(3)
+        samples = np.array([pos for _t, pos in self._history])
+        steps = np.diff(samples, axis=0)
+        half = self.world_size * 0.5
+        steps = (steps + half) % self.world_size - half  # Minimum-image step across the wrap
+        return steps.sum(axis=0) / elapsed
+
+    def _wrap(self, position: np.ndarray) -> np.ndarray:
+        half = self.world_size * 0.5
+        return (position + half) % self.world_size - half
+
+    def predict_chunks(self, load_radius: int, max_offset: int) -> list[ChunkCoords]:
+        """
+        Lists chunks around the predicted camera path, nearest future first.
+
+        Args:
+            load_radius (int): Chunk radius loaded around the camera; applied around each path point.
+            max_offset (int): Chunks further than this (per axis) from the current chunk are skipped,
+                so prefetches never land outside the unload radius and thrash.
+
+        Returns:
+            list[ChunkCoords]: Chunk coords to prefetch, without duplicates.
+        """
+        if not self._history:
+            return []
+        velocity = self.velocity()
+        if not np.any(velocity):
+            return []
+        position = self._history[-1][1]
+        current = np.floor(self._wrap(position) / self.chunk_size).astype(int)
+        wc = int(round(self.world_size / self.chunk_size))
+
+        r = load_radius
+        neighborhood = np.array(
+            [
+                (dx, dy, dz)
+                for dx in range(-r, r + 1)
+                for dy in range(-r, r + 1)
+                for dz in range(-r, r + 1)
+            ]
+        )
+
+        seen: set[ChunkCoords] = set()
+        ordered: list[ChunkCoords] = []
+        for k in range(1, self.path_samples + 1):
+            ahead = self._wrap(position + velocity * (self.horizon_s * k / self.path_samples))
+            centre = np.floor(ahead / self.chunk_size).astype(int)
+            # Express the predicted chunk relative to the current one across the wrap
+            delta = (centre - current + wc // 2) % wc - wc // 2
+            for offset in neighborhood:
+                rel = delta + offset
+                if np.any(np.abs(rel) > max_offset):
+                    continue
+                coords = tuple(int(v) for v in current + rel)
+                if coords not in seen:
+                    seen.add(coords)
+                    ordered.append(coords)  # type: ignore[arg-type]
+        return ordered
+
+    def record_demand(
+        self, newly_needed: Iterable[ChunkCoords], ready: Iterable[ChunkCoords]
+    ) -> None:
+        """
+        Scores chunks that just entered the load radius: a hit if already loaded, else a miss.
+
+        Args:
+            newly_needed (Iterable[ChunkCoords]): Chunks that entered the load radius this frame.
+            ready (Iterable[ChunkCoords]): Chunks currently attached to the scene.
+        """
+        ready_set = set(ready)
+        before = self.hits + self.misses
+        for coords in newly_needed:
+            if coords in ready_set:
+                self.hits += 1
+            else:
+                self.misses += 1
+        after = self.hits + self.misses
+        if after // _REPORT_EVERY > before // _REPORT_EVERY:
+            logger.info(
+                "Chunk prefetch hit rate: %.1f%% (%d/%d)",
+                100.0 * self.hit_rate,
+                self.hits,
+                after,
+            )
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of demanded chunks that were already loaded. 0.0 before any demand."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
@@ -134,6 +134,27 @@ def get_rotation_matrix(yaw: float, pitch: float, roll: float) -> Matrix3x3:
     return Rz @ Ry @ Rx
 
 
+def get_euler_angles(rotation_matrix: Matrix3x3) -> tuple[float, float, float]:
+    """
+    Recovers (yaw, pitch, roll) in radians from a ZYX rotation matrix. Inverse of get_rotation_matrix.
+
+    Args:
+        rotation_matrix (Matrix3x3): Rotation matrix of shape (3, 3)
+
+    Returns:
+        tuple[float, float, float]: (yaw, pitch, roll) in radians
+    """
+    pitch = float(np.arcsin(np.clip(-rotation_matrix[2, 0], -1.0, 1.0)))
+    if abs(rotation_matrix[2, 0]) < 1.0 - 1e-9:
+        yaw = float(np.arctan2(rotation_matrix[1, 0], rotation_matrix[0, 0]))
+        roll = float(np.arctan2(rotation_matrix[2, 1], rotation_matrix[2, 2]))
+    else:
+        # Gimbal lock: yaw and roll share an axis, so fold everything into yaw
+        yaw = float(np.arctan2(-rotation_matrix[0, 1], rotation_matrix[1, 1]))
+        roll = 0.0
+    return yaw, pitch, roll
+
+
 def apply_transformation(
     template: MoleculeTemplate,
     position: Matrix3x1,
@@ -180,6 +201,24 @@ def apply_instance_transform(
     )
 
 
+def transform_template_instances(
+    template: MoleculeTemplate, positions: np.ndarray, rotations: np.ndarray
+) -> np.ndarray:
+    """
+    Applies many rigid-body poses to one template in a single einsum.
+
+    Args:
+        template (MoleculeTemplate): The molecule template shared by every pose
+        positions (np.ndarray): Instance translations, shape (K, 3)
+        rotations (np.ndarray): Instance rotation matrices, shape (K, 3, 3)
+
+    Returns:
+        np.ndarray: World coordinates per instance and atom, shape (K, n_atoms, 3)
+    """
+    local = np.column_stack(template.local_xyz)
+    return np.einsum("kij,nj->kni", rotations, local) + positions[:, None, :]
+
+
 # ============================================================================
 # Molecular Properties
 # ============================================================================
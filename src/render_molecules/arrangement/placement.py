@@ -9,6 +9,7 @@ into account IMFs, force fields and more to create accurate images.
 """
 
 import math
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from itertools import product
 
@@ -19,6 +20,7 @@ from src.render_molecules.arrangement.geometry import (
     check_instance_overlap,
     compute_bbox_center,
     compute_bounding_sphere_radius,
+    get_euler_angles,
     get_rotation_matrix,
     point_in_bounds,
     radians,
@@ -28,6 +30,7 @@ from src.render_molecules.arrangement.scene_state import (
     MoleculeTemplate,
     ObjectState,
 )
+from src.utils.constants import ANGSTROM_TO_METRES, DEFAULT_RADIUS, ELEMENT_RADII
 from src.utils.type_annotations import Matrix3x1, Matrix3x3
 
 
@@ -143,6 +146,10 @@ class PlacementConfig:
     seed: int | None = 0
     jitter_scale: float = 0.0
 
+    # "frontier" grows outward from anchors; "poisson" fills the box with Bridson blue noise
+    placement_engine: str = "frontier"
+    poisson_candidates_per_point: int = 30
+
     max_seed_attempts: int = 128
     max_candidate_attempts: int = 128
     max_total_attempts: int = 5000
@@ -160,13 +167,36 @@ class PlacementConfig:
 
     enable_relaxation: bool = False
     relaxation_passes: int = 0
-    relaxation_step_size: float = 0.0
-    relaxation_rotation_step: float = 0.0
+    relaxation_step_size: float = 0.0  # Max translation per pass, Angstroms
+    relaxation_rotation_step: float = 0.0  # Max rotation per pass, radians
 
     require_in_bounds: bool = True
     require_no_overlap: bool = True
 
 
+def derive_chunk_seed(
+    world_seed: int,
+    chunk_coords: tuple[int, int, int],
+    world_chunks: int,
+) -> int:
+    """
+    Derives a placement seed for one chunk from the world seed and the chunk's wrapped coordinates.
+    Uses np.random.SeedSequence spawn keys instead of Python's hash(), so the result is identical
+    across runs, machines and worker processes, and toroidal copies of a chunk share a seed.
+
+    Args:
+        world_seed (int): Non-negative seed for the whole molecular world.
+        chunk_coords (tuple[int, int, int]): Integer (ix, iy, iz) chunk grid coords.
+        world_chunks (int): Chunks per axis before the world wraps around.
+
+    Returns:
+        int: Seed in [0, 2**31) suitable for PlacementConfig.seed.
+    """
+    spawn_key = tuple(int(c) % world_chunks for c in chunk_coords)
+    sequence = np.random.SeedSequence(entropy=world_seed, spawn_key=spawn_key)
+    return int(sequence.generate_state(1, dtype=np.uint32)[0]) % (2**31)
+
+
 def create_instance(
     template_id: int,
     object_state: ObjectState,
@@ -434,8 +464,390 @@ def schedule_next_molecule(
     return int(rng.choice(list(remaining.keys()), p=weights))
 
 
-def relax_overlaps():  # Stub for now
-    pass
+def iter_poisson_disk(
+    start: Matrix3x1,
+    spacing: float,
+    rng: np.random.Generator,
+    bounds: tuple[Matrix3x1, Matrix3x1] | None = None,
+    candidates_per_point: int = 30,
+) -> Iterator[Matrix3x1]:
+    """
+    Lazily yields blue-noise points using Bridson's Poisson-disk sampling.
+    Every yielded point is at least `spacing` away from all previously yielded points.
+    A background grid with cell size equal to `spacing` means each acceptance test only
+    looks at the 27 surrounding cells, so generating n points costs O(n).
+
+    Args:
+        start (Matrix3x1): First point, shape (3,). Sampling grows outward from here.
+        spacing (float): Minimum distance between any two points. Must be positive.
+        rng (np.random.Generator): PRNG generator instance.
+        bounds (tuple[Matrix3x1, Matrix3x1] | None, optional): (min_corner, max_corner) box
+            that points must stay inside. None means unbounded. Defaults to None.
+        candidates_per_point (int, optional): Bridson's k; candidates tried around an active
+            point before it is retired. Defaults to 30.
+
+    Raises:
+        ValueError: If spacing is not positive.
+
+    Yields:
+        Matrix3x1: Accepted point, shape (3,).
+    """
+    if spacing <= 0:
+        raise ValueError("Poisson-disk spacing must be positive")
+
+    spacing_sq = spacing * spacing
+    origin = np.asarray(start, dtype=float)
+    cells: dict[tuple[int, int, int], list[int]] = {}
+    points: list[np.ndarray] = []
+    active: list[int] = []
+
+    def cell_of(point: np.ndarray) -> tuple[int, int, int]:
+        i, j, k = np.floor((point - origin) / spacing).astype(int)
+        return (int(i), int(j), int(k))
+
+    def accept(point: np.ndarray) -> None:
+        cells.setdefault(cell_of(point), []).append(len(points))
+        active.append(len(points))
+        points.append(point)
+
+    accept(origin.copy())
+    yield origin.copy()
+
+    while active:
+        slot = int(rng.integers(len(active)))
+        anchor = points[active[slot]]
+
+        # Uniform-by-volume samples in the spherical shell [spacing, 2 * spacing]
+        directions = rng.standard_normal((candidates_per_point, 3))
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        radii = spacing * np.cbrt(1.0 + 7.0 * rng.random(candidates_per_point))
+        candidates = anchor + directions * radii[:, None]
+
+        if bounds is not None:
+            lower, upper = bounds
+            inside = np.all((candidates >= lower) & (candidates <= upper), axis=1)
+            candidates = candidates[inside]
+
+        for candidate in candidates:
+            ci, cj, ck = cell_of(candidate)
+            nearby = [
+                idx
+                for di, dj, dk in product((-1, 0, 1), repeat=3)
+                for idx in cells.get((ci + di, cj + dj, ck + dk), ())
+            ]
+            if nearby:
+                delta = np.asarray([points[idx] for idx in nearby]) - candidate
+                if np.any(np.einsum("ij,ij->i", delta, delta) < spacing_sq):
+                    continue
+            accept(candidate)
+            yield candidate.copy()
+            break
+        else:
+            # No candidate fit around this anchor; retire it (swap-remove keeps this O(1))
+            active[slot] = active[-1]
+            active.pop()
+
+
+def place_molecules_poisson(
+    object_state: ObjectState,
+    config: PlacementConfig,
+    target_counts: dict[int, int],
+) -> ObjectState:
+    """
+    Placement engine that draws COM positions from a Poisson-disk stream instead of growing a
+    frontier. Runs in near-linear time and keeps its acceptance rate close to 1 right up to
+    target density, since the blue-noise spacing already rules out bounding-sphere overlap.
+    Atom-level overlap checks are only run when min_center_distance is tighter than twice the
+    largest bounding sphere radius.
+
+    Args:
+        object_state (ObjectState): The object state container with templates and instances.
+        config (PlacementConfig): The placement configuration.
+        target_counts (dict[int, int]): Number of targets.
+
+    Raises:
+        ValueError: If the templates list in ObjectState is empty, or the spacing is not positive.
+
+    Returns:
+        ObjectState: The final object state, with the modified instances appended.
+    """
+    if not object_state.templates:
+        raise ValueError("No templates available for placement")
+
+    rng = np.random.default_rng(seed=config.seed)
+    grid = build_spatial_grid(object_state=object_state)
+    placed_counts: dict[int, int] = {
+        template_id: 0 for template_id in target_counts.keys()
+    }
+
+    max_radius = max(
+        compute_bounding_sphere_radius(template=t)
+        for t in object_state.templates.values()
+    )
+    safe_distance = 2.0 * max_radius * config.overlap_safety_factor
+    spacing = config.min_center_distance or safe_distance
+    if spacing <= 0:
+        raise ValueError(
+            "Poisson placement needs a positive min_center_distance for point-like templates"
+        )
+    needs_overlap_check = config.require_no_overlap and spacing < safe_distance
+
+    all_corners = np.hstack([object_state.box_bottom, object_state.box_top])
+    bounds = (
+        (np.min(all_corners, axis=1), np.max(all_corners, axis=1))
+        if config.require_in_bounds
+        else None
+    )
+    start = compute_bbox_center(object_state.box_bottom, object_state.box_top)
+
+    next_instance_id = 0
+    attempts = 0
+    for position in iter_poisson_disk(
+        start=start,
+        spacing=spacing,
+        rng=rng,
+        bounds=bounds,
+        candidates_per_point=config.poisson_candidates_per_point,
+    ):
+        if all(placed_counts[tid] >= target_counts[tid] for tid in target_counts):
+            break
+        if attempts >= config.max_total_attempts:
+            break
+        attempts += 1
+
+        template_id = schedule_next_molecule(
+            target_counts=target_counts, placed_counts=placed_counts, rng=rng
+        )
+        rotation, hpr = sample_random_rotation(rng=rng)
+
+        if needs_overlap_check and not check_placement(
+            candidate_position=position,
+            candidate_rotation=rotation,
+            template_id=template_id,
+            object_state=object_state,
+            config=config,
+            grid=grid,
+        ):
+            continue  # Point stays reserved in the blue-noise stream; just leave it empty
+
+        object_state.instances[next_instance_id] = create_instance(
+            template_id=template_id,
+            object_state=object_state,
+            instance_id=next_instance_id,
+            position=position,
+            rotation=rotation,
+            hpr=hpr,
+        )
+        grid.insert(instance_id=next_instance_id, position=position)
+        placed_counts[template_id] += 1
+        next_instance_id += 1
+
+    if config.enable_relaxation:
+        relax_overlaps(object_state=object_state, config=config)
+
+    return object_state
+
+
+def find_instance_pairs(
+    positions: np.ndarray,
+    cutoffs: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds all instance pairs whose centers are closer than the sum of their cutoff radii.
+    Candidates come from a SpatialGrid, then the distance test runs over all pairs at once.
+
+    Args:
+        positions (np.ndarray): Instance centers, shape (M, 3).
+        cutoffs (np.ndarray): Per-instance interaction radius, shape (M,).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Index arrays (I, J) with I < J, each shape (P,).
+    """
+    empty = np.zeros(0, dtype=np.intp)
+    if len(positions) < 2:
+        return empty, empty
+
+    cell_size = max(2.0 * float(np.max(cutoffs)), 1e-6)
+    min_corner = np.min(positions, axis=0)
+    dims = np.max(positions, axis=0) - min_corner
+    grid = SpatialGrid(
+        cell_size=cell_size,
+        origin=min_corner,
+        nx=max(1, math.ceil(dims[0] / cell_size)),
+        ny=max(1, math.ceil(dims[1] / cell_size)),
+        nz=max(1, math.ceil(dims[2] / cell_size)),
+    )
+    for idx, position in enumerate(positions):
+        grid.insert(instance_id=idx, position=position)
+
+    first: list[int] = []
+    second: list[int] = []
+    for idx, position in enumerate(positions):
+        for other in grid.neighbors(position):
+            if other > idx:
+                first.append(idx)
+                second.append(other)
+    if not first:
+        return empty, empty
+
+    I = np.asarray(first, dtype=np.intp)
+    J = np.asarray(second, dtype=np.intp)
+    delta = positions[I] - positions[J]
+    close = np.einsum("ij,ij->i", delta, delta) < (cutoffs[I] + cutoffs[J]) ** 2
+    return I[close], J[close]
+
+
+def relax_overlaps(object_state: ObjectState, config: PlacementConfig) -> ObjectState:
+    """
+    Rigid-body soft-sphere relaxation. Every atom is a soft sphere with its van der Waals radius;
+    overlapping atoms of different instances push each other apart with a force proportional to
+    their overlap depth. Forces are summed into a translation and a torque per instance, and each
+    pass moves every instance at once. This lets placement pack aggressively and then resolve the
+    residual overlap here instead of rejecting candidates.
+
+    Per pass, each instance moves by at most config.relaxation_step_size Angstroms and rotates by
+    at most config.relaxation_rotation_step radians. Stops early once nothing overlaps.
+
+    Args:
+        object_state (ObjectState): Placed scene state; instances are updated in place.
+        config (PlacementConfig): Placement configuration with relaxation settings.
+
+    Returns:
+        ObjectState: The same object state with relaxed instance poses.
+    """
+    if not object_state.instances or config.relaxation_passes <= 0:
+        return object_state
+
+    instance_ids = list(object_state.instances.keys())
+    instances = [object_state.instances[iid] for iid in instance_ids]
+    m = len(instances)
+
+    # Per-template data: atom coordinates about the COM, radii, and a scalar inertia proxy
+    template_local: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray, float, float]] = {}
+    for tid, template in object_state.templates.items():
+        local_com = calculate_center_of_mass(template=template)
+        centered = np.column_stack(template.local_xyz) - local_com
+        radii = np.array(
+            [
+                ELEMENT_RADII.get(int(element), DEFAULT_RADIUS) / ANGSTROM_TO_METRES
+                for element in template.elements
+            ]
+        )
+        inertia = max(float(np.sum(centered * centered)), 1.0)
+        reach = float(np.max(np.linalg.norm(centered, axis=1) + radii))
+        template_local[tid] = (local_com, centered, radii, inertia, reach)
+
+    counts = np.array([len(template_local[inst.template_id][1]) for inst in instances])
+    owner = np.repeat(np.arange(m), counts)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    centered_flat = np.vstack([template_local[inst.template_id][1] for inst in instances])
+    radii_flat = np.concatenate([template_local[inst.template_id][2] for inst in instances])
+    inertia = np.array([template_local[inst.template_id][3] for inst in instances])
+    reach = np.array([template_local[inst.template_id][4] for inst in instances])
+
+    rotations = np.stack([inst.rotation for inst in instances])
+    coms = np.stack(
+        [
+            inst.rotation @ template_local[inst.template_id][0] + inst.position
+            for inst in instances
+        ]
+    )
+
+    bounds = None
+    if config.require_in_bounds:
+        all_corners = np.hstack([object_state.box_bottom, object_state.box_top])
+        bounds = (np.min(all_corners, axis=1), np.max(all_corners, axis=1))
+
+    safety = config.overlap_safety_factor
+    moved = np.zeros(m, dtype=bool)
+    turned = np.zeros(m, dtype=bool)
+
+    for _ in range(config.relaxation_passes):
+        I, J = find_instance_pairs(coms, reach * safety)
+        if len(I) == 0:
+            break
+
+        # Expand every instance pair into all of its atom pairs
+        pair_sizes = counts[I] * counts[J]
+        pair_of = np.repeat(np.arange(len(I)), pair_sizes)
+        local = np.arange(int(pair_sizes.sum())) - np.repeat(
+            np.cumsum(pair_sizes) - pair_sizes, pair_sizes
+        )
+        width = counts[J][pair_of]
+        atom_a = starts[I][pair_of] + local // width
+        atom_b = starts[J][pair_of] + local % width
+
+        offsets = np.einsum("nij,nj->ni", rotations[owner], centered_flat)
+        world = coms[owner] + offsets
+
+        delta = world[atom_a] - world[atom_b]
+        dist = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+        overlap = (radii_flat[atom_a] + radii_flat[atom_b]) * safety - dist
+        touching = overlap > 0
+        if not np.any(touching):
+            break
+
+        atom_a, atom_b = atom_a[touching], atom_b[touching]
+        delta, dist, overlap = delta[touching], dist[touching], overlap[touching]
+        normal = delta / np.maximum(dist, 1e-8)[:, None]
+        # Coincident atoms have no direction; push them along a fixed axis instead
+        normal[dist < 1e-8] = (1.0, 0.0, 0.0)
+        push = 0.5 * overlap[:, None] * normal  # Each side resolves half the overlap
+
+        force = np.zeros((m, 3))
+        torque = np.zeros((m, 3))
+        np.add.at(force, owner[atom_a], push)
+        np.add.at(force, owner[atom_b], -push)
+        np.add.at(torque, owner[atom_a], np.cross(offsets[atom_a], push))
+        np.add.at(torque, owner[atom_b], np.cross(offsets[atom_b], -push))
+
+        # Translate, capped at the configured step
+        if config.relaxation_step_size > 0:
+            step = np.linalg.norm(force, axis=1, keepdims=True)
+            scale = np.minimum(1.0, config.relaxation_step_size / np.maximum(step, 1e-12))
+            coms += force * scale
+            if bounds is not None:
+                np.clip(coms, bounds[0], bounds[1], out=coms)
+
+        # Rotate about each COM by the torque / inertia axis-angle, capped at the configured step
+        if config.relaxation_rotation_step > 0:
+            spin = torque / inertia[:, None]
+            angle = np.linalg.norm(spin, axis=1)
+            turning = angle > 1e-12
+            if np.any(turning):
+                axis = spin[turning] / angle[turning, None]
+                theta = np.minimum(angle[turning], config.relaxation_rotation_step)
+                kx = np.zeros((len(axis), 3, 3))
+                kx[:, 0, 1], kx[:, 0, 2] = -axis[:, 2], axis[:, 1]
+                kx[:, 1, 0], kx[:, 1, 2] = axis[:, 2], -axis[:, 0]
+                kx[:, 2, 0], kx[:, 2, 1] = -axis[:, 1], axis[:, 0]
+                sin = np.sin(theta)[:, None, None]
+                cos = np.cos(theta)[:, None, None]
+                delta_rot = np.eye(3) + sin * kx + (1.0 - cos) * (kx @ kx)
+                rotations[turning] = delta_rot @ rotations[turning]
+                turned |= turning
+
+        moved[np.unique(owner[np.concatenate((atom_a, atom_b))])] = True
+
+    # Write poses back; position stays the rigid-body translation, not the COM
+    store = object_state.instances
+    moved_idx = np.flatnonzero(moved)
+    local_coms = np.array(
+        [template_local[instances[idx].template_id][0] for idx in moved_idx]
+    ).reshape(-1, 3)
+    rows = store.rows_of([instance_ids[idx] for idx in moved_idx])
+    hprs = store.hprs[rows]
+    for k, idx in enumerate(moved_idx):
+        if turned[idx]:
+            hprs[k] = get_euler_angles(rotations[idx])
+    store.set_poses(
+        rows,
+        positions=coms[moved_idx] - np.einsum("mij,mj->mi", rotations[moved_idx], local_coms),
+        rotations=rotations[moved_idx],
+        hprs=hprs,
+    )
+
+    return object_state
 
 
 def place_molecules(
@@ -453,10 +865,17 @@ def place_molecules(
 
     Raises:
         ValueError: If the templates list in ObjectState is empty.
+        ValueError: If config.placement_engine is not a known engine.
 
     Returns:
         ObjectState: The final object state, with the modified instances appended.
     """
+    if config.placement_engine == "poisson":
+        return place_molecules_poisson(
+            object_state=object_state, config=config, target_counts=target_counts
+        )
+    if config.placement_engine != "frontier":
+        raise ValueError(f"Unknown placement engine: {config.placement_engine!r}")
 
     # --- Creation of persistent variables ---
 
@@ -565,6 +984,6 @@ def place_molecules(
             active_frontier[next_anchor_instance_id] += 1
 
     if config.enable_relaxation:
-        relax_overlaps()
+        relax_overlaps(object_state=object_state, config=config)
 
     return object_state
@@ -16,14 +16,21 @@ from panda3d.core import (
     Geom,
     GeomNode,
     GeomPoints,
+    GeomVertexArrayFormat,
     GeomVertexData,
     GeomVertexFormat,
     GeomVertexWriter,
+    InternalName,
     LineSegs,
     NodePath,
     TransparencyAttrib,
 )
 
+from src.render_molecules.arrangement.geometry import (
+    calculate_center_of_mass,
+    compute_bounding_sphere_radius,
+    transform_template_instances,
+)
 from src.render_molecules.arrangement.scene_state import (
     MoleculeInstance,
     MoleculeTemplate,
@@ -42,6 +49,11 @@ _DENSITY_NODE_CACHE: dict[tuple, GeomNode] = {}
 _ATOM_SCALE_FACTOR: float = 1.0  # Global scale factor for atom rendering
 _ALL_ATOM_SPHERES: list[NodePath] = []  # Track all atom spheres for rescaling
 
+# Chunk levels of detail, finest first
+CHUNK_LOD_FULL: int = 0  # Atom spheres and bond clouds
+CHUNK_LOD_POINTS: int = 1  # One point sprite per atom
+CHUNK_LOD_IMPOSTOR: int = 2  # One billboard per molecule
+
 
 def set_atom_scale_factor(scale: float) -> None:
     """
@@ -186,6 +198,160 @@ def render_object_state(
     return instance_roots
 
 
+def _sprite_format() -> GeomVertexFormat:
+    """
+    Float32 position + float32 RGBA in one interleaved array, so point data can be written
+    straight from a NumPy buffer instead of row by row through GeomVertexWriter.
+    """
+    array_format = GeomVertexArrayFormat()
+    array_format.addColumn(InternalName.getVertex(), 3, Geom.NTFloat32, Geom.CPoint)
+    array_format.addColumn(InternalName.getColor(), 4, Geom.NTFloat32, Geom.CColor)
+    return GeomVertexFormat.registerFormat(GeomVertexFormat(array_format))
+
+
+def _sprite_node(name: str, xyz: np.ndarray, rgba: np.ndarray, size: float) -> NodePath:
+    """
+    Builds one point-sprite Geom. Points use perspective thickness, so size is in scene units
+    and every point renders as a camera-facing square (a billboard) that shrinks with distance.
+
+    Args:
+        name (str): Node name
+        xyz (np.ndarray): Point positions, shape (N, 3)
+        rgba (np.ndarray): Point colours, shape (N, 4)
+        size (float): Point edge length in Angstroms
+
+    Returns:
+        NodePath: Detached node holding the points
+    """
+    rows = np.hstack([xyz, rgba]).astype(np.float32)
+    vdata = GeomVertexData(name, _sprite_format(), Geom.UHStatic)
+    vdata.uncleanSetNumRows(len(rows))
+    memoryview(vdata.modifyArray(0)).cast("B")[:] = rows.tobytes()
+
+    prim = GeomPoints(Geom.UHStatic)
+    prim.addNextVertices(len(rows))
+    prim.closePrimitive()
+    geom = Geom(vdata)
+    geom.addPrimitive(prim)
+    node = GeomNode(name)
+    node.addGeom(geom)
+
+    sprites = NodePath(node)
+    sprites.setRenderModeThickness(size)
+    sprites.setRenderModePerspective(True)
+    return sprites
+
+
+def _instances_by_template(
+    object_state: ObjectState,
+) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+    """
+    Groups instance poses by template.
+
+    Returns:
+        dict[int, tuple[np.ndarray, np.ndarray]]: Template ID to (positions (K, 3), rotations (K, 3, 3))
+    """
+    store = object_state.instances
+    return {
+        tid: (store.positions[rows], store.rotations[rows])
+        for tid, rows in store.rows_by_template().items()
+    }
+
+
+def build_atom_points(parent: NodePath, object_state: ObjectState) -> NodePath:
+    """
+    Mid-range chunk LOD: every atom of every instance as one point sprite in a single Geom,
+    coloured by element. Bonds are dropped.
+
+    Args:
+        parent (NodePath): Scene-graph parent
+        object_state (ObjectState): Fully placed object state
+
+    Returns:
+        NodePath: The "lod_points" node
+    """
+    xyz_parts: list[np.ndarray] = []
+    rgba_parts: list[np.ndarray] = []
+    radii: list[float] = []
+    for tid, (positions, rotations) in _instances_by_template(object_state).items():
+        template = object_state.templates[tid]
+        world = transform_template_instances(template, positions, rotations)
+        rgba = np.array(
+            [(*ELEMENT_COLORS.get(el, DEFAULT_COLOR), 1.0) for el in template.elements],
+            dtype=float,
+        )
+        xyz_parts.append(world.reshape(-1, 3))
+        rgba_parts.append(np.tile(rgba, (len(positions), 1)))
+        radii.extend(ELEMENT_RADII.get(el, DEFAULT_RADIUS) for el in template.elements)
+
+    if not xyz_parts:
+        return parent.attachNewNode("lod_points")
+    mean_radius = float(np.mean(radii)) / ANGSTROM_TO_METRES
+    sprites = _sprite_node(
+        "lod_points",
+        np.vstack(xyz_parts),
+        np.vstack(rgba_parts),
+        size=2.0 * mean_radius * _ATOM_SCALE_FACTOR,
+    )
+    sprites.reparentTo(parent)
+    return sprites
+
+
+def build_molecule_impostors(parent: NodePath, object_state: ObjectState) -> NodePath:
+    """
+    Far chunk LOD: one billboard per molecule at its centre of mass, sized to the molecule's
+    bounding sphere and tinted with its mean atom colour. One Geom per template.
+
+    Args:
+        parent (NodePath): Scene-graph parent
+        object_state (ObjectState): Fully placed object state
+
+    Returns:
+        NodePath: The "lod_impostors" node
+    """
+    impostors = parent.attachNewNode("lod_impostors")
+    for tid, (positions, rotations) in _instances_by_template(object_state).items():
+        template = object_state.templates[tid]
+        local_com = calculate_center_of_mass(template=template)
+        centres = rotations @ local_com + positions
+        tint = np.mean(
+            [ELEMENT_COLORS.get(el, DEFAULT_COLOR) for el in template.elements], axis=0
+        )
+        # Bare atoms have a zero bounding radius; fall back to their vdW diameter
+        radius = max(
+            compute_bounding_sphere_radius(template),
+            ELEMENT_RADII.get(template.elements[0], DEFAULT_RADIUS) / ANGSTROM_TO_METRES,
+        )
+        rgba = np.tile([*tint, 1.0], (len(centres), 1))
+        _sprite_node(f"impostors_{tid}", centres, rgba, size=2.0 * radius).reparentTo(
+            impostors
+        )
+    return impostors
+
+
+def bake_static_geometry(source: NodePath, parent: NodePath) -> NodePath:
+    """
+    Copies a per-instance subtree and flattens the copy into a handful of large Geoms, merging
+    every atom sphere and bond cloud that shares a render state. The source is left untouched
+    so dynamics can keep driving individual atoms.
+
+    Args:
+        source (NodePath): Subtree to bake, e.g. a chunk's full-detail node
+        parent (NodePath): Where to attach the flattened copy
+
+    Returns:
+        NodePath: The flattened copy, named "<source>_flat"
+    """
+    flat = source.copyTo(parent)
+    flat.setName(f"{source.getName()}_flat")
+    # Loaded sphere models are ModelNodes carrying tags, both of which block flattening
+    for node in flat.findAllMatches("**/=base_radius"):
+        node.clearTag("base_radius")
+    flat.clearModelNodes()
+    flat.flattenStrong()
+    return flat
+
+
 def clear_removed_instance(
     instance_roots: dict[int, NodePath],
     instance_id: int,
@@ -579,18 +745,26 @@ def update_atom_positions(
     atom_mapping: "AtomMapping",
     positions: np.ndarray,
     object_state: ObjectState,
+    healthy: np.ndarray | None = None,
 ) -> None:
     """
     Move existing atom sphere NodePaths to new positions from the simulation buffer.
-    Does not recreate the scene graph.
+    Does not recreate the scene graph. Positions are trusted: the simulation validates
+    them and flags instances it has given up on.
 
     Args:
         instance_roots: Map of instance ID to molecule root NodePath.
         atom_mapping: AtomMapping from the simulation thread.
         positions: Flat (N, 3) array of current atom positions in world space.
         object_state: Current object state for template lookup.
+        healthy: Per-instance flags in atom_mapping order (SimulationThread.instance_healthy).
+            Instances flagged False are left where they are.
     """
-    for instance_id, (start, end) in atom_mapping.instance_to_sim_range.items():
+    offsets = atom_mapping.offsets.tolist()
+    for slot, instance_id in enumerate(atom_mapping.instance_ids.tolist()):
+        start, end = offsets[slot], offsets[slot + 1]
+        if healthy is not None and not healthy[slot]:
+            continue
         root = instance_roots.get(instance_id)
         if root is None or root.isEmpty():
             continue
@@ -610,11 +784,6 @@ def update_atom_positions(
         root_pos = root.getPos(root.getParent())
         rx, ry, rz = float(root_pos.x), float(root_pos.y), float(root_pos.z)
 
-        # Skip if simulation has blown up (NaN, inf, or atoms >50Å from root)
-        local = inst_positions_a - np.array([[rx, ry, rz]])
-        if not np.all(np.isfinite(local)) or np.max(np.abs(local)) > 50.0:
-            continue
-
         for node, pos_a in zip(atom_nodes, inst_positions_a):
             node.setPos(
                 float(pos_a[0]) - rx,
@@ -695,10 +864,6 @@ def _draw_sticks(
     if len(template.bonds_aid1) == 0:
         return
 
-    # Skip if any atom position is unreasonable (blown-up simulation)
-    if not np.all(np.isfinite(local_coords)) or np.max(np.abs(local_coords)) > 50.0:
-        return
-
     lines = LineSegs("stick_bonds")
     lines.setThickness(thickness)
     lines.setColor(0.75, 0.75, 0.75, 1.0)
@@ -753,9 +918,6 @@ def update_stick_bonds(
             int(n.getName().split("_")[1]): i for i, n in enumerate(atom_nodes)
         }
 
-        if not np.all(np.isfinite(local_coords)) or np.max(np.abs(local_coords)) > 50.0:
-            continue
-
         stick_np = root.find("stick_bonds")
 
         if stick_np.isEmpty():
@@ -7,6 +7,7 @@ This is not something that should be ran, instead it is just a container for all
 It contains all the wrappers for everything to keep it all organized.
 """
 
+from collections.abc import Iterator, MutableMapping
 from dataclasses import dataclass
 
 import numpy as np
@@ -58,10 +59,336 @@ class MoleculeInstance:
     )
 
 
+class InstanceView:
+    """
+    Per-instance handle into an InstanceStore with the same attributes as MoleculeInstance.
+
+    position and rotation are writable views into the store's arrays, so in-place edits land in the
+    store. Those views stay valid until the store grows or removes an instance; re-read them after.
+
+    Args:
+        store (InstanceStore): Owning store.
+        instance_id (int): ID of the instance this handle reads and writes.
+    """
+
+    __slots__ = ("_store", "id")
+
+    def __init__(self, store: "InstanceStore", instance_id: int) -> None:
+        self._store: InstanceStore = store
+        self.id: int = instance_id
+
+    @property
+    def _row(self) -> int:
+        return self._store._slot[self.id]
+
+    @property
+    def template_id(self) -> int:
+        return int(self._store._template_ids[self._row])
+
+    @template_id.setter
+    def template_id(self, value: int) -> None:
+        self._store._template_ids[self._row] = value
+
+    @property
+    def position(self) -> np.ndarray:
+        return self._store._positions[self._row]
+
+    @position.setter
+    def position(self, value: np.ndarray) -> None:
+        self._store._positions[self._row] = value
+
+    @property
+    def rotation(self) -> np.ndarray:
+        return self._store._rotations[self._row]
+
+    @rotation.setter
+    def rotation(self, value: np.ndarray) -> None:
+        self._store._rotations[self._row] = value
+
+    @property
+    def hpr(self) -> tuple[float, float, float]:
+        yaw, pitch, roll = self._store._hprs[self._row].tolist()
+        return (yaw, pitch, roll)
+
+    @hpr.setter
+    def hpr(self, value: tuple[float, float, float]) -> None:
+        self._store._hprs[self._row] = value
+
+    @property
+    def velocity(self) -> np.ndarray | None:
+        row = self._row
+        return self._store._velocities[row] if self._store._has_velocity[row] else None
+
+    @velocity.setter
+    def velocity(self, value: np.ndarray | None) -> None:
+        row = self._row
+        self._store._has_velocity[row] = value is not None
+        self._store._velocities[row] = 0.0 if value is None else value
+
+    def __repr__(self) -> str:
+        return (
+            f"InstanceView(id={self.id}, template_id={self.template_id}, "
+            f"position={self.position!r}, hpr={self.hpr!r})"
+        )
+
+
+class InstanceStore(MutableMapping[int, MoleculeInstance]):
+    """
+    Structure-of-arrays instance container that behaves like dict[int, MoleculeInstance].
+
+    Poses live in contiguous arrays (one row per instance, in insertion order) so whole-scene work
+    such as culling, rendering and packing can read them without a Python loop. Assigning a
+    MoleculeInstance copies it into the arrays; indexing returns an InstanceView onto its row.
+    Removing an instance moves the last row into its place, so row order is not stable across
+    deletions.
+
+    Args:
+        instances (dict[int, MoleculeInstance] | None, optional): Initial contents. Defaults to None.
+        capacity (int, optional): Initial number of preallocated rows. Defaults to 16.
+    """
+
+    def __init__(
+        self,
+        instances: dict[int, MoleculeInstance] | None = None,
+        capacity: int = 16,
+    ) -> None:
+        self._count: int = 0
+        self._slot: dict[int, int] = {}  # Instance ID -> row
+        self._allocate(max(1, capacity, len(instances or ())))
+        for instance_id, instance in (instances or {}).items():
+            self[instance_id] = instance
+
+    @classmethod
+    def from_arrays(
+        cls,
+        ids: np.ndarray,
+        template_ids: np.ndarray,
+        positions: np.ndarray,
+        rotations: np.ndarray,
+        hprs: np.ndarray,
+        velocities: np.ndarray | None = None,
+    ) -> "InstanceStore":
+        """
+        Builds a store from per-field arrays with one copy per field and no per-instance objects.
+
+        Args:
+            ids (np.ndarray): Instance IDs, shape (M,).
+            template_ids (np.ndarray): Template ID per instance, shape (M,).
+            positions (np.ndarray): Rigid-body translations, shape (M, 3).
+            rotations (np.ndarray): Rotation matrices, shape (M, 3, 3).
+            hprs (np.ndarray): (yaw, pitch, roll) in radians, shape (M, 3).
+            velocities (np.ndarray | None, optional): Velocities, shape (M, 3). Defaults to None.
+
+        Returns:
+            InstanceStore: New store holding copies of the arrays.
+        """
+        count = len(ids)
+        store = cls(capacity=count)
+        store._ids[:count] = ids
+        store._template_ids[:count] = template_ids
+        store._positions[:count] = positions
+        store._rotations[:count] = rotations
+        store._hprs[:count] = hprs
+        if velocities is not None:
+            store._velocities[:count] = velocities
+            store._has_velocity[:count] = True
+        store._slot = {int(iid): row for row, iid in enumerate(store._ids[:count].tolist())}
+        store._count = count
+        return store
+
+    def _allocate(self, capacity: int) -> None:
+        old = self._count
+        ids = np.empty(capacity, dtype=np.int64)
+        template_ids = np.empty(capacity, dtype=np.int64)
+        positions = np.zeros((capacity, 3), dtype=float)
+        rotations = np.zeros((capacity, 3, 3), dtype=float)
+        hprs = np.zeros((capacity, 3), dtype=float)
+        velocities = np.zeros((capacity, 3), dtype=float)
+        has_velocity = np.zeros(capacity, dtype=bool)
+        if old:
+            ids[:old] = self._ids[:old]
+            template_ids[:old] = self._template_ids[:old]
+            positions[:old] = self._positions[:old]
+            rotations[:old] = self._rotations[:old]
+            hprs[:old] = self._hprs[:old]
+            velocities[:old] = self._velocities[:old]
+            has_velocity[:old] = self._has_velocity[:old]
+        self._ids: np.ndarray = ids
+        self._template_ids: np.ndarray = template_ids
+        self._positions: np.ndarray = positions
+        self._rotations: np.ndarray = rotations
+        self._hprs: np.ndarray = hprs
+        self._velocities: np.ndarray = velocities
+        self._has_velocity: np.ndarray = has_velocity
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids[: self._count].tolist())
+
+    def __contains__(self, instance_id: object) -> bool:
+        return instance_id in self._slot
+
+    def __getitem__(self, instance_id: int) -> InstanceView:
+        if instance_id not in self._slot:
+            raise KeyError(instance_id)
+        return InstanceView(self, instance_id)
+
+    def __setitem__(self, instance_id: int, instance: MoleculeInstance | InstanceView) -> None:
+        row = self._slot.get(instance_id)
+        if row is None:
+            if self._count == len(self._ids):
+                self._allocate(2 * len(self._ids))
+            row = self._count
+            self._count += 1
+            self._slot[instance_id] = row
+            self._ids[row] = instance_id
+        self._template_ids[row] = instance.template_id
+        self._positions[row] = instance.position
+        self._rotations[row] = instance.rotation
+        self._hprs[row] = instance.hpr
+        velocity = instance.velocity
+        self._has_velocity[row] = velocity is not None
+        self._velocities[row] = 0.0 if velocity is None else velocity
+
+    def __delitem__(self, instance_id: int) -> None:
+        row = self._slot.pop(instance_id)
+        last = self._count - 1
+        if row != last:
+            moved_id = int(self._ids[last])
+            for array in (
+                self._ids,
+                self._template_ids,
+                self._positions,
+                self._rotations,
+                self._hprs,
+                self._velocities,
+                self._has_velocity,
+            ):
+                array[row] = array[last]
+            self._slot[moved_id] = row
+        self._count = last
+
+    def __repr__(self) -> str:
+        return f"InstanceStore({self._count} instances)"
+
+    # Whole-store array access. These are live views of the first len(self) rows.
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Instance IDs, shape (M,)."""
+        return self._ids[: self._count]
+
+    @property
+    def template_ids(self) -> np.ndarray:
+        """Template ID per instance, shape (M,)."""
+        return self._template_ids[: self._count]
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Rigid-body translations, shape (M, 3)."""
+        return self._positions[: self._count]
+
+    @property
+    def rotations(self) -> np.ndarray:
+        """Rotation matrices, shape (M, 3, 3)."""
+        return self._rotations[: self._count]
+
+    @property
+    def hprs(self) -> np.ndarray:
+        """(yaw, pitch, roll) in radians, shape (M, 3)."""
+        return self._hprs[: self._count]
+
+    def rows_of(self, instance_ids: list[int] | np.ndarray) -> np.ndarray:
+        """
+        Maps instance IDs to their current rows.
+
+        Args:
+            instance_ids (list[int] | np.ndarray): IDs to look up.
+
+        Returns:
+            np.ndarray: Row per ID, shape (K,).
+        """
+        return np.fromiter(
+            (self._slot[int(iid)] for iid in instance_ids), dtype=np.int64, count=len(instance_ids)
+        )
+
+    def rows_by_template(self) -> dict[int, np.ndarray]:
+        """
+        Groups rows by template ID.
+
+        Returns:
+            dict[int, np.ndarray]: Template ID to the rows of its instances, in row order. Empty
+                for an empty store.
+        """
+        if len(self) == 0:
+            return {}
+        template_ids = self.template_ids
+        order = np.argsort(template_ids, kind="stable")
+        unique, starts = np.unique(template_ids[order], return_index=True)
+        return {
+            int(tid): rows
+            for tid, rows in zip(unique.tolist(), np.split(order, starts[1:]), strict=True)
+        }
+
+    def world_centres(self, local_points: np.ndarray) -> np.ndarray:
+        """
+        Transforms one local-space point per instance into world space: R @ p + position.
+
+        Args:
+            local_points (np.ndarray): Local-space point per row, shape (M, 3), e.g. template COMs.
+
+        Returns:
+            np.ndarray: World-space points, shape (M, 3).
+        """
+        return np.einsum("mij,mj->mi", self.rotations, local_points) + self.positions
+
+    def translate(self, offset: np.ndarray, rows: np.ndarray | None = None) -> None:
+        """
+        Shifts instance positions in place.
+
+        Args:
+            offset (np.ndarray): Translation, shape (3,) or (K, 3).
+            rows (np.ndarray | None, optional): Rows to move. Defaults to None, which moves all.
+        """
+        if rows is None:
+            self._positions[: self._count] += offset
+        else:
+            self._positions[rows] += offset
+
+    def set_poses(
+        self,
+        rows: np.ndarray,
+        positions: np.ndarray,
+        rotations: np.ndarray | None = None,
+        hprs: np.ndarray | None = None,
+    ) -> None:
+        """
+        Writes new poses for several rows at once.
+
+        Args:
+            rows (np.ndarray): Rows to update, shape (K,).
+            positions (np.ndarray): New translations, shape (K, 3).
+            rotations (np.ndarray | None, optional): New rotation matrices, shape (K, 3, 3).
+                Defaults to None, which keeps the current rotations.
+            hprs (np.ndarray | None, optional): New (yaw, pitch, roll), shape (K, 3).
+                Defaults to None, which keeps the current angles.
+        """
+        self._positions[rows] = positions
+        if rotations is not None:
+            self._rotations[rows] = rotations
+        if hprs is not None:
+            self._hprs[rows] = hprs
+
+
 @dataclass
 class ObjectState:
     """
     The full snapshot of a single object.
+
+    instances accepts any dict of MoleculeInstance and stores it as an InstanceStore, so
+    per-instance code keeps working while bulk code can read the pose arrays directly.
     """
 
     object_key: str  # Canonical unique key from JSON, e.g. books_2
@@ -71,13 +398,16 @@ class ObjectState:
     templates: dict[
         int, MoleculeTemplate
     ]  # Points each molecule template ID to its respective molecule template
-    instances: dict[
-        int, MoleculeInstance
-    ]  # Points each instance ID to its respective instance for easier lookup
+    instances: InstanceStore  # Points each instance ID to its respective instance for easier lookup
     box_bottom: np.ndarray  # BBox corner
     box_top: np.ndarray  # BBox corner
     rng_seed: int  # Random seed for reproducible arrangement
 
+    def __setattr__(self, name: str, value: object) -> None:
+        if name == "instances" and not isinstance(value, InstanceStore):
+            value = InstanceStore(value)  # type: ignore[arg-type]
+        super().__setattr__(name, value)
+
 
 @dataclass
 class Environment:
@@ -0,0 +1,276 @@
+"""
+./src/render_molecules/arrangement/template_store.py
+
+Compiled, memory-mappable store of molecule templates for every object in the aggregated JSON.
+
+Parsing the PubChem-shaped JSON into MoleculeTemplates means walking nested lists and converting
+them to arrays on every load. The store does that once: all templates of all objects are packed
+into a handful of flat arrays (atoms, coordinates, bonds, plus offset tables) and written as .npy
+files in a directory named after the format version and a hash of the source JSON. Later loads
+memory-map those files, and templates are slices of the mapped arrays, so nothing is parsed or
+copied until it is used. Editing the JSON changes its hash and triggers a recompile.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from collections.abc import Mapping
+
+import numpy as np
+
+from src.render_molecules.arrangement.scene_state import MoleculeTemplate
+from src.utils.json_io import LazyJson
+
+logger = logging.getLogger(__name__)
+
+_STORE_FORMAT_VERSION = 1
+_ARRAY_NAMES = (
+    "object_keys",  # (K,) object keys, in JSON order
+    "object_offsets",  # (K + 1,) first template row of each object
+    "template_names",  # (T,) molecule names
+    "atom_offsets",  # (T + 1,) first atom row of each template
+    "bond_offsets",  # (T + 1,) first bond row of each template
+    "aids",  # (A,) PubChem atom IDs
+    "elements",  # (A,) atomic numbers
+    "xyz",  # (3, A) local coordinates; each axis row is contiguous
+    "bonds_aid1",  # (B,) first atom ID of each bond
+    "bonds_aid2",  # (B,) second atom ID of each bond
+    "bond_order",  # (B,) bond orders
+)
+
+
+def template_from_sim_details(name: str, sim_details: dict) -> MoleculeTemplate:
+    """
+    Builds one template from a molecule's PubChem sim_details block.
+
+    Args:
+        name (str): Molecule name/label.
+        sim_details (dict): The molecule's "sim_details" entry from the aggregated JSON.
+
+    Returns:
+        MoleculeTemplate: Template using the first conformer's coordinates.
+    """
+    conformer = sim_details["coords"][0]["conformers"][0]
+    bonds = sim_details.get("bonds", {})
+    return MoleculeTemplate(
+        name=name,
+        aids=np.array(sim_details["atoms"]["aid"], dtype=int),
+        elements=np.array(sim_details["atoms"]["element"], dtype=int),
+        local_xyz=(
+            np.array(conformer["x"], dtype=float),
+            np.array(conformer["y"], dtype=float),
+            np.array(conformer["z"], dtype=float),
+        ),
+        bonds_aid1=np.array(bonds.get("aid1", []), dtype=int),
+        bonds_aid2=np.array(bonds.get("aid2", []), dtype=int),
+        bond_order=np.array(bonds.get("order", []), dtype=int),
+    )
+
+
+def hash_source(path: str) -> str:
+    """
+    Hashes the raw bytes of a source JSON file.
+
+    Args:
+        path (str): File to hash.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def compile_templates(data: Mapping) -> dict[str, np.ndarray]:
+    """
+    Packs the templates of every object into flat arrays. Template order within an object matches
+    build_templates_from_object: composition order, skipping molecules without sim_details.
+
+    Args:
+        data (Mapping): Parsed aggregated JSON (or a LazyJson over it), object key to entry.
+
+    Returns:
+        dict[str, np.ndarray]: One array per name in _ARRAY_NAMES.
+    """
+    object_keys: list[str] = []
+    object_offsets = [0]
+    templates: list[MoleculeTemplate] = []
+    for object_key, object_data in data.items():
+        composition = (
+            object_data.get("composition", {}) if isinstance(object_data, Mapping) else {}
+        )
+        for mol_name, mol_data in composition.items():
+            if "sim_details" in mol_data:
+                templates.append(template_from_sim_details(mol_name, mol_data["sim_details"]))
+        object_keys.append(str(object_key))
+        object_offsets.append(len(templates))
+
+    def offsets(sizes: list[int]) -> np.ndarray:
+        out = np.zeros(len(sizes) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=out[1:])
+        return out
+
+    def concat(parts: list[np.ndarray], dtype: type) -> np.ndarray:
+        return np.concatenate(parts).astype(dtype) if parts else np.empty(0, dtype=dtype)
+
+    return {
+        "object_keys": np.array(object_keys, dtype=str),
+        "object_offsets": np.array(object_offsets, dtype=np.int64),
+        "template_names": np.array([t.name for t in templates], dtype=str),
+        "atom_offsets": offsets([len(t.aids) for t in templates]),
+        "bond_offsets": offsets([len(t.bonds_aid1) for t in templates]),
+        "aids": concat([t.aids for t in templates], np.int64),
+        "elements": concat([t.elements for t in templates], np.int64),
+        "xyz": (
+            np.vstack([np.column_stack(t.local_xyz) for t in templates]).T.copy()
+            if templates
+            else np.empty((3, 0), dtype=float)
+        ),
+        "bonds_aid1": concat([t.bonds_aid1 for t in templates], np.int64),
+        "bonds_aid2": concat([t.bonds_aid2 for t in templates], np.int64),
+        "bond_order": concat([t.bond_order for t in templates], np.int64),
+    }
+
+
+class CompiledTemplates:
+    """
+    Read-only view over compiled template arrays, possibly memory-mapped.
+    Templates handed out are slices of those arrays and must not be modified.
+
+    Args:
+        arrays (dict[str, np.ndarray]): Output of compile_templates, or the same arrays loaded back.
+    """
+
+    def __init__(self, arrays: dict[str, np.ndarray]) -> None:
+        self._arrays: dict[str, np.ndarray] = arrays
+        keys = arrays["object_keys"].tolist()
+        self._object_row: dict[str, int] = {key: row for row, key in enumerate(keys)}
+
+    def __contains__(self, object_key: object) -> bool:
+        return object_key in self._object_row
+
+    @property
+    def object_keys(self) -> list[str]:
+        """Compiled object keys, in JSON order."""
+        return list(self._object_row)
+
+    def templates_for(self, object_key: str) -> dict[int, MoleculeTemplate] | None:
+        """
+        Returns one object's templates, keyed like build_templates_from_object.
+
+        Args:
+            object_key (str): Object key from the aggregated JSON.
+
+        Returns:
+            dict[int, MoleculeTemplate] | None: Template ID to template, or None for unknown keys.
+        """
+        row = self._object_row.get(object_key)
+        if row is None:
+            return None
+        a = self._arrays
+        first, last = a["object_offsets"][row : row + 2].tolist()
+        atom_offsets = a["atom_offsets"]
+        bond_offsets = a["bond_offsets"]
+        xyz = a["xyz"]
+
+        templates: dict[int, MoleculeTemplate] = {}
+        for template_id, t in enumerate(range(first, last)):
+            a0, a1 = atom_offsets[t : t + 2].tolist()
+            b0, b1 = bond_offsets[t : t + 2].tolist()
+            templates[template_id] = MoleculeTemplate(
+                name=str(a["template_names"][t]),
+                aids=a["aids"][a0:a1],
+                elements=a["elements"][a0:a1],
+                local_xyz=(xyz[0, a0:a1], xyz[1, a0:a1], xyz[2, a0:a1]),
+                bonds_aid1=a["bonds_aid1"][b0:b1],
+                bonds_aid2=a["bonds_aid2"][b0:b1],
+                bond_order=a["bond_order"][b0:b1],
+            )
+        return templates
+
+
+class TemplateStore:
+    """
+    Compiles the aggregated JSON once per content hash and memory-maps the result afterwards.
+    Without a cache dir (or if it is not writable) templates are compiled in memory each load.
+
+    Args:
+        cache_dir (str | None): Directory holding compiled stores. None disables persistence.
+    """
+
+    def __init__(self, cache_dir: str | None = None) -> None:
+        self.cache_dir: str | None = cache_dir
+        if cache_dir is not None:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+            except OSError as exc:
+                logger.warning("Template store dir %s unavailable: %s", cache_dir, exc)
+                self.cache_dir = None
+
+    def _entry_dir(self, source_hash: str) -> str:
+        assert self.cache_dir is not None
+        return os.path.join(self.cache_dir, f"v{_STORE_FORMAT_VERSION}-{source_hash}")
+
+    def load(self, json_path: str, data: Mapping | None = None) -> CompiledTemplates:
+        """
+        Returns compiled templates for a JSON file, compiling and persisting them on a miss.
+
+        Args:
+            json_path (str): Absolute path of the aggregated JSON.
+            data (Mapping | None, optional): The file's already-loaded content, used on a miss to
+                skip parsing it again. Defaults to None.
+
+        Returns:
+            CompiledTemplates: Templates for every object in the file.
+        """
+        if self.cache_dir is None:
+            return CompiledTemplates(compile_templates(data or self._parse(json_path)))
+
+        source_hash = hash_source(json_path)
+        entry = self._entry_dir(source_hash)
+        if os.path.isdir(entry):
+            try:
+                return CompiledTemplates(
+                    {
+                        name: np.load(os.path.join(entry, f"{name}.npy"), mmap_mode="r")
+                        for name in _ARRAY_NAMES
+                    }
+                )
+            except (OSError, ValueError) as exc:
+                logger.warning("Discarding unreadable template store %s: %s", entry, exc)
+                shutil.rmtree(entry, ignore_errors=True)
+
+        arrays = compile_templates(data or self._parse(json_path))
+        self._persist(entry, arrays)
+        return CompiledTemplates(arrays)
+
+    @staticmethod
+    def _parse(json_path: str) -> Mapping:
+        return LazyJson(json_path)
+
+    def _persist(self, entry: str, arrays: dict[str, np.ndarray]) -> None:
+        # Write into a temp dir and rename it into place, so readers never see a partial store
+        tmp_dir = f"{entry}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(tmp_dir, exist_ok=True)
+            for name, array in arrays.items():
+                np.save(os.path.join(tmp_dir, f"{name}.npy"), array)
+            os.replace(tmp_dir, entry)
+        except OSError as exc:
+            logger.warning("Could not persist template store %s: %s", entry, exc)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return
+        self._prune(keep=entry)
+
+    def _prune(self, keep: str) -> None:
+        """Removes stores compiled from older versions of the JSON."""
+        assert self.cache_dir is not None
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if path != keep and os.path.isdir(path) and not name.endswith(".tmp"):
+                shutil.rmtree(path, ignore_errors=True)
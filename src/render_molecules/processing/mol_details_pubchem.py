@@ -5,85 +5,125 @@ python -m src.render_molecules.mol_details_pubchem
 
 Gets the details for each molecule using PubChem instead of RDKit.
 Writes bond details (order, position, etc.), atom details (position, idx) to a JSON file.
+Each distinct molecule is fetched once, concurrently, through the cached PubChemClient.
 """
 
-from urllib.parse import quote
-
-import requests
-
+from src.render_molecules.processing.pubchem_client import PubChemClient
+from src.utils.constants import PUBCHEM_CACHE_DIR
 from src.utils.json_io import load_json, save_json
+from src.utils.resource_path import resource_path
 from src.utils.type_annotations import Aggregations
 
 
-def fetch_pubchem_data(mol_name: str, smiles: str | None) -> dict | None:
-    endpoints = [
-        f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/name/{quote(mol_name.replace('-', ' '))}/JSON?record_type=3d",
-    ]
-    if smiles:
-        endpoints.append(
-            f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/smiles/{quote(smiles)}/JSON?record_type=3d"
-        )
-
-    endpoints.append(
-        f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/name/{quote(mol_name.replace('-', ' '))}/JSON"
+def fetch_pubchem_data(
+    mol_name: str, smiles: str | None, client: PubChemClient | None = None
+) -> dict | None:
+    """
+    Fetches one compound record, trying 3D then 2D records by name and then by SMILES.
+
+    Args:
+        mol_name (str): Molecule name.
+        smiles (str | None): Optional SMILES string.
+        client (PubChemClient | None, optional): Client to use. Defaults to None, which uses an
+            uncached client for this call only.
+
+    Returns:
+        dict | None: PUG REST compound JSON, or None if nothing matched.
+    """
+    if client is not None:
+        return client.fetch_compound(mol_name, smiles)
+    own_client = PubChemClient()
+    try:
+        return own_client.fetch_compound(mol_name, smiles)
+    finally:
+        own_client.close()
+
+
+def extract_sim_details(mol_name: str, data: dict | None) -> dict | None:
+    """
+    Pulls atoms, bonds and coordinates out of a compound record, padding Z for 2D records.
+
+    Args:
+        mol_name (str): Molecule name, for log messages.
+        data (dict | None): PUG REST compound JSON.
+
+    Returns:
+        dict | None: The sim_details entry, or None if the record is missing or incomplete.
+    """
+    if not data:
+        print(f"Could not fetch data for {mol_name}")
+        return None
+
+    compound = data["PC_Compounds"][0]
+    atoms = compound.get("atoms")
+    bonds = compound.get("bonds", {"aid1": [], "aid2": [], "order": []})
+    coords = compound.get("coords")
+
+    # Pad Z dimension if working with 2D fallback data
+    if coords and len(coords) > 0 and "conformers" in coords[0]:
+        conf = coords[0]["conformers"][0]
+        if "x" in conf and "z" not in conf:
+            conf["z"] = [0.0] * len(conf["x"])
+
+    atoms_ok = bool(atoms and atoms.get("aid") and atoms.get("element"))
+    bonds_ok = bool(
+        bonds is not None
+        and "aid1" in bonds
+        and "aid2" in bonds
+        and "order" in bonds
     )
-
-    if smiles:
-        endpoints.append(
-            f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/smiles/{quote(smiles)}/JSON"
+    coords_ok = bool(coords and len(coords) > 0 and coords[0].get("conformers"))
+
+    if not (atoms_ok and bonds_ok and coords_ok):
+        print(f"Skipping {mol_name}: incomplete PubChem data")
+        return None
+
+    return {
+        "atoms": atoms,
+        "bonds": bonds,
+        "coords": coords,
+    }
+
+
+def build_details(aggregations: Aggregations, client: PubChemClient | None = None):
+    """
+    Adds sim_details to every molecule of every object, dropping molecules PubChem cannot resolve.
+    Molecules are deduplicated across the whole aggregation and fetched concurrently.
+
+    Args:
+        aggregations (Aggregations): Aggregated objects; modified in place.
+        client (PubChemClient | None, optional): Client to use. Defaults to None, which creates a
+            cached client for this call.
+    """
+    own_client = client is None
+    if client is None:
+        client = PubChemClient(
+            cache_dir=resource_path(PUBCHEM_CACHE_DIR) if PUBCHEM_CACHE_DIR else None
         )
 
-    for url in endpoints:
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            if "Fault" not in data:
-                return data
-    return None
+    try:
+        wanted = [
+            (mol_name, mol_details.get("smiles"))
+            for obj_details in aggregations.values()
+            for mol_name, mol_details in obj_details["composition"].items()
+        ]
+        records = client.fetch_compounds(wanted)
+    finally:
+        if own_client:
+            client.close()
+    print(f"Resolved {len(records)} distinct molecules with {client.requests_sent} requests")
 
+    details = {key: extract_sim_details(key[0], data) for key, data in records.items()}
 
-def build_details(aggregations: Aggregations):
     for obj_details in aggregations.values():
         composition = obj_details["composition"]
         molecules_to_remove: list[str] = []
         for mol_name, mol_details in composition.items():
-            data = fetch_pubchem_data(mol_name, mol_details.get("smiles"))
-
-            if not data:
-                print(f"Could not fetch data for {mol_name}")
+            sim_details = details[(mol_name, mol_details.get("smiles"))]
+            if sim_details is None:
                 molecules_to_remove.append(mol_name)
                 continue
-
-            compound = data["PC_Compounds"][0]
-            atoms = compound.get("atoms")
-            bonds = compound.get("bonds", {"aid1": [], "aid2": [], "order": []})
-            coords = compound.get("coords")
-
-            # Pad Z dimension if working with 2D fallback data
-            if coords and len(coords) > 0 and "conformers" in coords[0]:
-                conf = coords[0]["conformers"][0]
-                if "x" in conf and "z" not in conf:
-                    conf["z"] = [0.0] * len(conf["x"])
-
-            atoms_ok = bool(atoms and atoms.get("aid") and atoms.get("element"))
-            bonds_ok = bool(
-                bonds is not None
-                and "aid1" in bonds
-                and "aid2" in bonds
-                and "order" in bonds
-            )
-            coords_ok = bool(coords and len(coords) > 0 and coords[0].get("conformers"))
-
-            if not (atoms_ok and bonds_ok and coords_ok):
-                print(f"Skipping {mol_name}: incomplete PubChem data")
-                molecules_to_remove.append(mol_name)
-                continue
-
-            mol_details["sim_details"] = {
-                "atoms": atoms,
-                "bonds": bonds,
-                "coords": coords,
-            }
+            mol_details["sim_details"] = sim_details
 
         for mol_name in molecules_to_remove:
             composition.pop(mol_name, None)
@@ -92,7 +132,7 @@ def build_details(aggregations: Aggregations):
 def main():
     aggregations: Aggregations = load_json("aggregated.json")
     build_details(aggregations)
-    save_json(aggregations, "final_aggregated.json")
+    save_json(aggregations, "final_aggregated.json", compact=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,323 @@
+"""
+./src/render_molecules/processing/pubchem_client.py
+
+Shared PubChem PUG REST client for the pipeline's processing stages.
+
+One pooled requests session is reused by every worker thread, requests are spaced to stay under
+PubChem's rate limit, transient failures (429/5xx) are retried with backoff, and every definitive
+answer (a 200 or a 404 "not found") is kept in an on-disk cache keyed by URL, so re-running a stage
+only hits the network for molecules it has never seen. The base URL is configurable so the client
+can be pointed at a local stub server.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.utils.constants import (
+    PUBCHEM_BASE_URL,
+    PUBCHEM_MAX_REQUESTS_PER_S,
+    PUBCHEM_TIMEOUT_S,
+    PUBCHEM_WORKERS,
+)
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+
+_CACHEABLE_STATUSES = (200, 404)  # Definitive answers; anything else may succeed on a retry
+_RETRY_STATUSES = (429, 500, 502, 503, 504)  # PubChem busy/throttled or transient server errors
+
+
+class RateLimiter:
+    """
+    Spaces calls at least 1 / rate seconds apart across all threads.
+
+    Args:
+        rate_per_s (float): Maximum calls per second. Non-positive disables limiting.
+    """
+
+    def __init__(self, rate_per_s: float) -> None:
+        self.interval: float = 1.0 / rate_per_s if rate_per_s > 0 else 0.0
+        self._next: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Blocks until the caller may issue its request."""
+        if self.interval <= 0.0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class ResponseCache:
+    """
+    One JSON file per URL holding the HTTP status and decoded body. Safe across threads.
+
+    Args:
+        cache_dir (str | None): Directory for cached responses. None disables the cache.
+    """
+
+    def __init__(self, cache_dir: str | None) -> None:
+        self.cache_dir: str | None = cache_dir
+        if cache_dir is not None:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+            except OSError as exc:
+                logger.warning("PubChem cache dir %s unavailable: %s", cache_dir, exc)
+                self.cache_dir = None
+
+    def _path(self, url: str) -> str:
+        assert self.cache_dir is not None
+        return os.path.join(self.cache_dir, f"{hashlib.sha256(url.encode()).hexdigest()}.json")
+
+    def get(self, url: str) -> tuple[int, Any] | None:
+        """
+        Looks up a cached response.
+
+        Args:
+            url (str): Request URL.
+
+        Returns:
+            tuple[int, Any] | None: (status, body), or None on a miss.
+        """
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._path(url), "rb") as f:
+                entry = json.load(f)
+            return int(entry["status"]), entry["body"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Ignoring unreadable PubChem cache entry for %s: %s", url, exc)
+            return None
+
+    def put(self, url: str, status: int, body: Any) -> None:
+        """
+        Stores a response, writing through a temp file so readers never see a partial entry.
+
+        Args:
+            url (str): Request URL.
+            status (int): HTTP status code.
+            body (Any): Decoded JSON body.
+        """
+        if self.cache_dir is None:
+            return
+        path = self._path(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"url": url, "status": status, "body": body}, f)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            logger.warning("Could not cache PubChem response for %s: %s", url, exc)
+
+
+class PubChemClient:
+    """
+    Thread-safe, rate-limited, cached PUG REST client.
+
+    Args:
+        base_url (str): PUG REST root, e.g. "https://pubchem.ncbi.nlm.nih.gov/rest/pug".
+        cache_dir (str | None): Response cache directory. None disables caching.
+        max_workers (int): Worker threads for map_concurrent; also the connection pool size.
+        rate_per_s (float): Request rate ceiling shared by all workers.
+        timeout_s (float): Per-request connect/read timeout.
+        retries (int): Retries for connection errors and 429/5xx responses.
+        backoff_s (float): First retry delay; doubles on each further retry.
+    """
+
+    def __init__(
+        self,
+        base_url: str = PUBCHEM_BASE_URL,
+        cache_dir: str | None = None,
+        max_workers: int = PUBCHEM_WORKERS,
+        rate_per_s: float = PUBCHEM_MAX_REQUESTS_PER_S,
+        timeout_s: float = PUBCHEM_TIMEOUT_S,
+        retries: int = 3,
+        backoff_s: float = 0.5,
+    ) -> None:
+        self.base_url: str = base_url.rstrip("/")
+        self.max_workers: int = max(1, max_workers)
+        self.timeout_s: float = timeout_s
+        self.cache: ResponseCache = ResponseCache(cache_dir)
+        self.limiter: RateLimiter = RateLimiter(rate_per_s)
+        self.requests_sent: int = 0  # Network requests, excluding cache hits
+
+        self.retries: int = max(0, retries)
+        self.backoff_s: float = backoff_s
+        # urllib3 only retries connection failures; busy/throttled statuses are retried in _send
+        # so every attempt goes through the rate limiter
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_workers,
+            max_retries=Retry(total=self.retries, status_forcelist=(), backoff_factor=backoff_s),
+        )
+        self.session: requests.Session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._count_lock: threading.Lock = threading.Lock()
+
+    def close(self) -> None:
+        """Releases pooled connections."""
+        self.session.close()
+
+    def _send(self, url: str) -> requests.Response | None:
+        """GETs a URL under the rate limit, retrying busy and throttled responses with backoff."""
+        response: requests.Response | None = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff_s * 2 ** (attempt - 1))
+            self.limiter.wait()
+            with self._count_lock:
+                self.requests_sent += 1
+            try:
+                response = self.session.get(url, timeout=self.timeout_s)
+            except requests.RequestException as exc:
+                logger.warning("PubChem request failed for %s: %s", url, exc)
+                return None
+            if response.status_code not in _RETRY_STATUSES:
+                break
+        return response
+
+    def get_json(self, path: str) -> Any | None:
+        """
+        GETs one PUG REST path, through the cache.
+
+        Args:
+            path (str): Path below base_url, already URL-quoted, e.g. "/compound/cid/2244/JSON".
+
+        Returns:
+            Any | None: Decoded body of a 200 response without a PubChem "Fault", else None.
+        """
+        url = f"{self.base_url}{path}"
+        cached = self.cache.get(url)
+        if cached is not None:
+            status, body = cached
+        else:
+            response = self._send(url)
+            if response is None:
+                return None
+            status = response.status_code
+            try:
+                body = response.json()
+            except ValueError:
+                body = None
+            if status in _CACHEABLE_STATUSES and (status != 200 or body is not None):
+                self.cache.put(url, status, body)
+
+        if status != 200 or not isinstance(body, dict) or "Fault" in body:
+            return None
+        return body
+
+    def fetch_compound(self, mol_name: str, smiles: str | None) -> dict | None:
+        """
+        Fetches a compound record, preferring 3D records and falling back to 2D.
+        Tries the name first, then the SMILES if given.
+
+        Args:
+            mol_name (str): Molecule name; hyphens are treated as spaces.
+            smiles (str | None): Optional SMILES string.
+
+        Returns:
+            dict | None: PUG REST compound JSON, or None if nothing matched.
+        """
+        name = quote(mol_name.replace("-", " "), safe="")
+        candidates = [f"/compound/name/{name}/JSON?record_type=3d"]
+        if smiles:
+            candidates.append(f"/compound/smiles/{quote(smiles, safe='')}/JSON?record_type=3d")
+        candidates.append(f"/compound/name/{name}/JSON")
+        if smiles:
+            candidates.append(f"/compound/smiles/{quote(smiles, safe='')}/JSON")
+
+        for path in candidates:
+            data = self.get_json(path)
+            if data is not None:
+                return data
+        return None
+
+    def map_concurrent(self, fn: Callable[[K], Any], keys: Iterable[K]) -> dict[K, Any]:
+        """
+        Runs fn over distinct keys on the client's workers.
+
+        Args:
+            fn (Callable[[K], Any]): Per-key work, typically built on get_json.
+            keys (Iterable[K]): Keys; duplicates are only processed once.
+
+        Returns:
+            dict[K, Any]: Result per distinct key.
+        """
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(unique)), thread_name_prefix="pubchem"
+        ) as executor:
+            return dict(zip(unique, executor.map(fn, unique), strict=True))
+
+    def fetch_compounds(
+        self, molecules: Iterable[tuple[str, str | None]]
+    ) -> dict[tuple[str, str | None], dict | None]:
+        """
+        Fetches many compounds concurrently, once per distinct (name, SMILES) pair.
+
+        Args:
+            molecules (Iterable[tuple[str, str | None]]): (name, SMILES) pairs.
+
+        Returns:
+            dict[tuple[str, str | None], dict | None]: Compound JSON (or None) per pair.
+        """
+        return self.map_concurrent(lambda key: self.fetch_compound(*key), molecules)
+
+    def fetch_smiles(self, mol_name: str) -> str | None:
+        """
+        Looks up the SMILES for a molecule name, retrying with hyphens as spaces.
+
+        Args:
+            mol_name (str): Molecule name.
+
+        Returns:
+            str | None: SMILES, or None if PubChem does not know the name.
+        """
+        for variant in dict.fromkeys((mol_name, mol_name.replace("-", " "))):
+            data = self.get_json(
+                f"/compound/name/{quote(variant, safe='')}/property/IsomericSMILES/JSON"
+            )
+            for row in (data or {}).get("PropertyTable", {}).get("Properties", []):
+                # PubChem now answers IsomericSMILES requests under the "SMILES" key
+                smiles = row.get("SMILES") or row.get("IsomericSMILES")
+                if smiles:
+                    return smiles
+        return None
+
+    def resolve_smiles(self, mol_names: Iterable[str]) -> dict[str, str | None]:
+        """
+        Resolves SMILES for many molecule names, one cached property request per distinct name,
+        run concurrently under the rate limit.
+
+        PUG REST's name namespace takes a single name per request, so looking names up directly
+        costs one round trip each, fewer than mapping them to CIDs first and batching by CID.
+
+        Args:
+            mol_names (Iterable[str]): Molecule names.
+
+        Returns:
+            dict[str, str | None]: SMILES per distinct name; None if unresolved.
+        """
+        return self.map_concurrent(self.fetch_smiles, mol_names)
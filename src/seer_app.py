@@ -11,30 +11,78 @@ from typing import Any, cast
 import numpy as np
 from direct.gui.DirectGui import DirectLabel, DirectSlider
 from direct.showbase.ShowBase import ShowBase
+from direct.showbase.ShowBaseGlobal import globalClock
 from panda3d.core import LineSegs, NodePath, Point3, TransparencyAttrib
 
+from src.dynamics.frustum_culler import frustum_planes, get_frustum_instances
+from src.dynamics.sim_scheduler import SimTier, classify_chunks
+from src.dynamics.sim_thread import SimulationWorkerPool, StepBudgetController
 from src.render_molecules.arrange_molecules import build_templates_from_object
+from src.render_molecules.arrangement.chunk_cache import (
+    ArrangementCache,
+    arrangement_key,
+    hash_templates,
+)
+from src.render_molecules.arrangement.chunk_pool import ChunkBuildResult, ChunkWorkerPool
+from src.render_molecules.arrangement.chunk_prefetch import ChunkPrefetcher
 from src.render_molecules.arrangement.geometry import compute_bounding_sphere_radius
-from src.render_molecules.arrangement.placement import PlacementConfig, place_molecules
+from src.render_molecules.arrangement.placement import (
+    PlacementConfig,
+    derive_chunk_seed,
+    place_molecules,
+)
 from src.render_molecules.arrangement.renderer import (
+    CHUNK_LOD_FULL,
+    CHUNK_LOD_IMPOSTOR,
+    CHUNK_LOD_POINTS,
+    bake_static_geometry,
+    build_atom_points,
+    build_molecule_impostors,
     render_object_state,
     set_atom_scale_factor,
 )
 from src.render_molecules.arrangement.scene_state import MoleculeTemplate, ObjectState
+from src.render_molecules.arrangement.template_store import TemplateStore
 from src.utils.constants import (
+    CHUNK_ATTACH_BUDGET_MS,
+    CHUNK_CACHE_DIR,
+    CHUNK_CACHE_MAX_ENTRIES,
+    CHUNK_FLATTEN_PER_FRAME,
+    CHUNK_FLATTEN_STATIC,
     CHUNK_MOL_COUNT_PER_TEMPLATE,
+    CHUNK_PLACEMENT_ENGINE,
+    CHUNK_RELAXATION,
+    CHUNK_RELAXATION_PASSES,
+    CHUNK_RELAXATION_ROTATION,
+    CHUNK_RELAXATION_STEP_A,
     CHUNK_SIZE_A,
+    CHUNK_SPACING_RADII,
+    CHUNK_WORKER_THREADS,
     FADE_FOV_START,
     FINAL_AGGREGATED,
     LOAD_RADIUS_CHUNKS,
+    LOD_FULL_RADIUS_CHUNKS,
+    LOD_POINTS_RADIUS_CHUNKS,
     MAX_CHUNKS_PER_FRAME,
+    MD_MAX_EXTRAPOLATION_S,
+    MD_RENDER_DELAY_S,
     MOL_CAM_SPEED_A,
     MOL_VIEW_SCALE,
+    PREFETCH_HISTORY_FRAMES,
+    PREFETCH_HORIZON_S,
+    PREFETCH_PATH_SAMPLES,
+    SIM_FULL_RATE_DISTANCE_A,
+    SIM_PAUSE_DISTANCE_A,
+    SIM_REDUCED_WRITE_INTERVAL_S,
+    SIM_TARGET_FPS,
+    SIM_WORKER_THREADS,
+    TEMPLATE_STORE_DIR,
     UNLOAD_RADIUS_CHUNKS,
         WORLD_CHUNKS,
-        CUMULATIVE_DRIFT_LIMIT_A,
+        WORLD_SEED,
 )
-from src.utils.json_io import load_json
+from src.utils.json_io import json_path, load_json_lazy
+from src.utils.resource_path import resource_path
 from src.utils.type_annotations import Aggregations, Bounds
 from src.video_processing.environment import (
     AGGREGATION_PATH,
@@ -48,6 +96,10 @@ from src.video_processing.environment import (
 from src.zoom.raycast_picker import RaycastPicker
 
 
+# Templates for chunk builds and their hash, captured together on the main thread
+ChunkTemplates = tuple[dict[int, MoleculeTemplate], str | None]
+
+
 class SeerApp(ShowBase):
     def __init__(
         self,
@@ -89,16 +141,51 @@ class SeerApp(ShowBase):
 
         self._loaded_chunks: dict[tuple[int, int, int], NodePath] = {}
         self._mol_templates: dict[int, MoleculeTemplate] | None = None
+        self._mol_templates_hash: str | None = None
+        # Placed chunk layouts, reused whenever a chunk (or a toroidal copy of it) streams back in
+        self._chunk_cache: ArrangementCache = ArrangementCache(
+            max_entries=CHUNK_CACHE_MAX_ENTRIES,
+            cache_dir=resource_path(CHUNK_CACHE_DIR) if CHUNK_CACHE_DIR else None,
+        )
+        # Placement and node building run off the main thread; the stream task only attaches
+        self._chunk_pool: ChunkWorkerPool = ChunkWorkerPool(
+            build_fn=self._generate_chunk, max_workers=CHUNK_WORKER_THREADS
+        )
+        self._prefetcher: ChunkPrefetcher = ChunkPrefetcher(
+            chunk_size=CHUNK_SIZE_A,
+            world_size=WORLD_CHUNKS * CHUNK_SIZE_A,
+            horizon_s=PREFETCH_HORIZON_S,
+            history_frames=PREFETCH_HISTORY_FRAMES,
+            path_samples=PREFETCH_PATH_SAMPLES,
+        )
+        # Chunks inside the load radius last frame; used to score prefetch hits
+        self._needed_chunks: set[tuple[int, int, int]] = set()
         self._mol_origin: Point3 | None = None
         self._atom_slider: DirectSlider | None = None
         self._atom_label: DirectLabel | None = None
         self._sim_threads: dict[tuple[int, int, int], Any] = {}
+        # Shared by every chunk's simulation thread; fed with frame times by _md_update_task
+        self._step_controller: StepBudgetController = StepBudgetController(
+            target_fps=SIM_TARGET_FPS
+        )
+        self._speed_label_refresh: float = 0.0
+        # Chunk simulations run batch by batch on these workers instead of a thread each
+        self._sim_pool: SimulationWorkerPool = SimulationWorkerPool(
+            num_workers=SIM_WORKER_THREADS
+        )
         self._chunk_object_states: dict[tuple[int, int, int], ObjectState] = {}
         self._chunk_instance_roots: dict[tuple[int, int, int], dict[int, NodePath]] = {}
+        # Per-chunk LOD children (level -> node) and the node currently unstashed
+        self._chunk_lod_nodes: dict[tuple[int, int, int], dict[int, NodePath]] = {}
+        self._chunk_shown: dict[tuple[int, int, int], NodePath] = {}
+        # Level each chunk currently shows; only CHUNK_LOD_FULL chunks are simulated
+        self._chunk_levels: dict[tuple[int, int, int], int] = {}
+        # Flattened copies of full-detail chunks, shown instead of them while dynamics is off
+        self._chunk_flat_nodes: dict[tuple[int, int, int], NodePath] = {}
         self._cloud_rendering: bool = False
         self._sim_running: bool = False
-        # Per-chunk interpolation state for smooth animation between MACE steps
-        self._chunk_interp: dict[tuple[int, int, int], dict] = {}
+        # Per-chunk playback positions sampled from each simulation's frame ring
+        self._chunk_interp: dict[tuple[int, int, int], np.ndarray] = {}
 
         if room_state is None:
             room_state = RoomState(window=self.win, camera=self.camLens)
@@ -125,7 +212,12 @@ class SeerApp(ShowBase):
         else:
             raise ValueError("Missing loader.")
 
-        self.room_data = load_json(FINAL_AGGREGATED)
+        # Indexed, not parsed: corners are decoded on first use, compositions only if needed
+        self.room_data = load_json_lazy(FINAL_AGGREGATED)
+        # Every object's molecule templates, memory-mapped from a store compiled per JSON hash
+        self._compiled_templates = TemplateStore(
+            cache_dir=resource_path(TEMPLATE_STORE_DIR) if TEMPLATE_STORE_DIR else None
+        ).load(json_path(FINAL_AGGREGATED), data=self.room_data)
         self.room_picker = RaycastPicker(
             camera_node=self.camera,
             cam_node=self.camNode,
@@ -261,6 +353,7 @@ class SeerApp(ShowBase):
         )
 
         self._sim_running = status
+        # The stream task swaps flattened and per-instance chunks on its next pass
         if status:
             # Switch all loaded chunks to cheap stick bonds before simulation starts
             for coords, inst_roots in self._chunk_instance_roots.items():
@@ -277,6 +370,8 @@ class SeerApp(ShowBase):
                 obj_state = self._chunk_object_states.get(coords)
                 if obj_state:
                     restore_clouds_from_sticks(inst_roots, obj_state, self)
+            # Atoms have moved since the chunks were baked; rebake from the live nodes
+            self._drop_flattened_chunks()
 
     def _on_cloud_toggle(self, status: bool) -> None:
         """Handle the cloud rendering toggle checkbox. Only applies during dynamics."""
@@ -314,40 +409,85 @@ class SeerApp(ShowBase):
         )
 
     def _start_chunk_simulations(self) -> None:
-        """Start a harmonic SimulationThread for all loaded chunks."""
+        """
+        Start a harmonic SimulationThread for all chunks currently shown at full detail.
+        Threads start paused; _schedule_chunk_simulations decides which ones step and how fast.
+        """
         from src.dynamics.sim_thread import SimulationThread
         from src.utils.constants import MD_TIMESTEP
 
-        # Stop threads for chunks that are no longer loaded
+        # Stop threads for chunks whose atom nodes are gone
         for coords in list(self._sim_threads):
-            if coords not in self._chunk_object_states:
+            if coords not in self._chunk_instance_roots:
                 self._sim_threads.pop(coords).stop()
 
         temperature = float(self._temp_slider["value"])
         dt = MD_TIMESTEP * float(self._speed_slider["value"])
 
-        # Start/resume simulations for all loaded chunks
+        # Start/resume simulations for all chunks that have atom nodes to drive
         for coords, obj_state in self._chunk_object_states.items():
             if obj_state is None or not obj_state.instances:
                 continue
+            if not self._chunk_at_full_detail(coords):
+                continue
             if coords in self._sim_threads:
-                self._sim_threads[coords].resume()
                 continue
             sim = SimulationThread(
                 object_state=obj_state,
                 active_instance_ids=list(obj_state.instances.keys()),
                 temperature=temperature,
+                controller=self._step_controller,
+                pool=self._sim_pool,
             )
             sim.set_timestep(dt)
             sim.start()
-            sim.resume()
             self._sim_threads[coords] = sim
 
+        self._schedule_chunk_simulations()
+
+    def _schedule_chunk_simulations(self) -> None:
+        """
+        Resumes, throttles or pauses each chunk's simulation by its tier: full rate for on-screen
+        chunks near the camera, throttled for other loaded chunks, paused beyond SIM_PAUSE_DISTANCE_A.
+        Chunks shown below full detail are paused whatever their tier, as nothing draws their atoms.
+        """
+        if not self._sim_threads or self._mol_origin is None or self.camera is None:
+            return
+        cam_pos = self.camera.getPos()
+        origin = self._mol_origin
+        mol_cam = np.array(
+            [
+                (cam_pos.x - origin.x) / MOL_VIEW_SCALE,
+                (cam_pos.y - origin.y) / MOL_VIEW_SCALE,
+                (cam_pos.z - origin.z) / MOL_VIEW_SCALE,
+            ]
+        )
+        cam_forward = self.camera.getQuat(self.render).getForward()
+        tiers = classify_chunks(
+            chunk_coords=list(self._sim_threads),
+            chunk_size=CHUNK_SIZE_A,
+            camera_pos=mol_cam,
+            camera_forward=np.array([cam_forward.x, cam_forward.y, cam_forward.z]),
+            fov_degrees=float(self.camLens.getFov()[0]),
+            full_distance=SIM_FULL_RATE_DISTANCE_A,
+            pause_distance=SIM_PAUSE_DISTANCE_A,
+        )
+        for coords, tier in tiers.items():
+            sim = self._sim_threads[coords]
+            if tier is SimTier.PAUSED or not self._chunk_at_full_detail(coords):
+                sim.pause()
+                continue
+            sim.set_write_interval(
+                0.0 if tier is SimTier.FULL else SIM_REDUCED_WRITE_INTERVAL_S
+            )
+            sim.resume()
+
     def _md_update_task(self, task) -> int:
         """
-        Read shared position buffers each frame and move atom NodePaths.
-        Interpolates between the previous and current simulation step so that
-        atoms move smoothly rather than snapping every MACE inference cycle.
+        Sample each simulation's frame ring each frame and move atom NodePaths.
+        Playback runs MD_RENDER_DELAY_S behind real time and interpolates between
+        the timestamped frames around that moment, so irregular MD batches still
+        play back smoothly. Only instances whose bounds touch the view frustum are moved.
 
         Args:
             task: Panda3D task object.
@@ -368,64 +508,87 @@ class SeerApp(ShowBase):
 
         now = _time.monotonic()
 
+        # Let the simulation threads size their work around the render frame budget
+        self._step_controller.report_frame(globalClock.getDt())
+        if now - self._speed_label_refresh >= 0.5:
+            self._speed_label_refresh = now
+            multiplier = float(self._speed_slider["value"])
+            steps_k = self._step_controller.steps_per_second / 1000.0
+            self._speed_label["text"] = f"Speed: {multiplier:.1f}x ({steps_k:.1f}k steps/s)"
+
+        planes = self._mol_frustum_planes()
+
         for coords, sim in list(self._sim_threads.items()):
-            if not sim.is_running():
+            if not sim.is_running() or not self._chunk_at_full_detail(coords):
                 continue
             obj_state = self._chunk_object_states.get(coords)
             inst_roots = self._chunk_instance_roots.get(coords)
             if obj_state is None or inst_roots is None:
                 continue
 
-            new_buf = sim.buffer.read()
-
-            # Initialise interpolation state on first encounter
-            if coords not in self._chunk_interp:
-                self._chunk_interp[coords] = {
-                    "prev": new_buf.copy(),
-                    "curr": new_buf.copy(),
-                    "last_step_time": now,
-                    "step_duration": 0.5,  # initial guess; adapts via EMA
-                    # Anchor stores the first-received safe frame for cumulative drift checks
-                    "anchor": new_buf.copy(),
-                }
+            ring = sim.buffer
 
-            state = self._chunk_interp[coords]
-
-            # Detect when the background thread has written a new frame
-            if not np.array_equal(new_buf, state["curr"]):
-                elapsed = now - state["last_step_time"]
-                state["step_duration"] = elapsed * 0.4 + state["step_duration"] * 0.6
-                state["last_step_time"] = now
-
-                # Reject the new frame if any atom moved more than 2Å in one step.
-                # Also reject if the cumulative drift from the first-received
-                # frame exceeds a sensible threshold (prevents slow, multi-step
-                # drift that stays under the per-step limit).
-                max_step_a = np.max(np.abs(new_buf - state["curr"])) / 1e-10
-                cumulative_a = np.max(np.abs(new_buf - state["anchor"])) / 1e-10
-                if (
-                    max_step_a <= 5.0
-                    and cumulative_a <= CUMULATIVE_DRIFT_LIMIT_A
-                    and np.all(np.isfinite(new_buf))
-                ):
-                    state["prev"] = state["curr"]
-                    state["curr"] = new_buf.copy()
-                # If blow-up detected: silently hold curr; atoms freeze visually.
-
-            # t in [0, 1]: how far through the current step we are
-            t = min(
-                (now - state["last_step_time"]) / max(state["step_duration"], 1e-4),
-                1.0,
+            # Preallocate the per-chunk playback array on first encounter
+            positions = self._chunk_interp.get(coords)
+            if positions is None:
+                positions = np.empty((ring.n_atoms, 3))
+                self._chunk_interp[coords] = positions
+
+            # Play back at a fixed delay so there is nearly always a later frame to blend towards.
+            # Frames are validated by the simulation, so no checks are needed here.
+            ring.sample(
+                now - MD_RENDER_DELAY_S, positions, max_extrapolation_s=MD_MAX_EXTRAPOLATION_S
             )
-            positions = state["prev"] * (1.0 - t) + state["curr"] * t
 
-            update_atom_positions(inst_roots, sim.mapping, positions, obj_state)
+            if planes is not None:
+                inst_roots = {
+                    iid: inst_roots[iid]
+                    for iid in get_frustum_instances(sim.bounds, planes)
+                    if iid in inst_roots
+                }
+                if not inst_roots:
+                    continue
+
+            update_atom_positions(
+                inst_roots, sim.mapping, positions, obj_state, healthy=sim.instance_healthy
+            )
             update_stick_bonds(inst_roots, obj_state)
             if self._cloud_rendering:
                 rebuild_bond_clouds(inst_roots, obj_state, self)
 
         return task.cont
 
+    def _mol_frustum_planes(self) -> np.ndarray | None:
+        """
+        Builds the camera's view frustum in molecular-space Angstroms.
+
+        Returns:
+            np.ndarray | None: Planes from frustum_planes, shape (6, 4), or None outside molecular
+                mode.
+        """
+        if self._mol_origin is None or self.camera is None:
+            return None
+        cam_pos = self.camera.getPos()
+        origin = self._mol_origin
+        mol_cam = np.array(
+            [
+                (cam_pos.x - origin.x) / MOL_VIEW_SCALE,
+                (cam_pos.y - origin.y) / MOL_VIEW_SCALE,
+                (cam_pos.z - origin.z) / MOL_VIEW_SCALE,
+            ]
+        )
+        quat = self.camera.getQuat(self.render)
+        forward, up = quat.getForward(), quat.getUp()
+        return frustum_planes(
+            camera_pos=mol_cam,
+            camera_forward=np.array([forward.x, forward.y, forward.z]),
+            camera_up=np.array([up.x, up.y, up.z]),
+            fov_degrees=float(self.camLens.getFov()[0]),
+            aspect_ratio=float(self.camLens.getAspectRatio()),
+            near=float(self.camLens.getNear()) / MOL_VIEW_SCALE,
+            far=float(self.camLens.getFar()) / MOL_VIEW_SCALE,
+        )
+
     def _on_atom_scale_changed(self) -> None:
         """
         Reads the slider value and applies it to all rendered atom spheres.
@@ -434,6 +597,7 @@ class SeerApp(ShowBase):
             return
         scale = float(self._atom_slider["value"])
         set_atom_scale_factor(scale)
+        self._drop_flattened_chunks()
         if self._atom_label is not None:
             self._atom_label["text"] = f"Atom Scale: {scale:.2f}x"
 
@@ -471,7 +635,8 @@ class SeerApp(ShowBase):
             elif mol_cam[dim] >= half_world:
                 mol_cam[dim] -= world_size_a
                 teleport[dim] = -world_size_a * MOL_VIEW_SCALE
-        if np.any(teleport != 0) and self.camera is not None:
+        teleported = bool(np.any(teleport != 0))
+        if teleported and self.camera is not None:
             self.camera.setPos(
                 cam_pos.x + teleport[0],
                 cam_pos.y + teleport[1],
@@ -489,9 +654,25 @@ class SeerApp(ShowBase):
             for iy in range(cy - r, cy + r + 1)
             for iz in range(cz - r, cz + r + 1)
         ]
-        candidates.sort(
-            key=lambda c: (c[0] - cx) ** 2 + (c[1] - cy) ** 2 + (c[2] - cz) ** 2
-        )
+
+        # Chunks that just entered the load radius tell us whether prefetching kept up.
+        # A teleport renames every chunk, so that frame says nothing about prefetching.
+        needed = set(candidates)
+        if teleported:
+            self._prefetcher.reset()
+        elif self._needed_chunks:
+            self._prefetcher.record_demand(
+                needed - self._needed_chunks, self._loaded_chunks.keys()
+            )
+        self._needed_chunks = needed
+        self._prefetcher.observe(task.time, mol_cam)
+        predicted = [
+            coords
+            for coords in self._prefetcher.predict_chunks(
+                load_radius=LOAD_RADIUS_CHUNKS, max_offset=UNLOAD_RADIUS_CHUNKS
+            )
+            if coords not in needed
+        ]
 
         ur = UNLOAD_RADIUS_CHUNKS
         for coords in list(self._loaded_chunks):
@@ -503,34 +684,222 @@ class SeerApp(ShowBase):
                 self._loaded_chunks.pop(coords).detachNode()
                 self._chunk_object_states.pop(coords, None)
                 self._chunk_instance_roots.pop(coords, None)
+                self._chunk_lod_nodes.pop(coords, None)
+                self._chunk_shown.pop(coords, None)
+                self._chunk_levels.pop(coords, None)
+                self._chunk_flat_nodes.pop(coords, None)
                 sim = self._sim_threads.pop(coords, None)
                 if sim is not None:
                     sim.stop()
+        # Drop requests that are neither needed now nor on the predicted path any more
+        wanted = needed.union(predicted)
+        for coords in self._chunk_pool.queued():
+            if coords not in wanted:
+                self._chunk_pool.cancel(coords)
+
+        cam_forward = self.camera.getQuat(self.render).getForward()
+        forward = np.array([cam_forward.x, cam_forward.y, cam_forward.z])
+        centre = (cx, cy, cz)
+        # Captured here so workers never read templates that molecular-mode exit/entry replaces
+        templates_context: ChunkTemplates = (self._mol_templates or {}, self._mol_templates_hash)
+        for coords in [*candidates, *predicted]:
+            detail = self._chunk_lod_level(coords, centre)
+            lod_nodes = self._chunk_lod_nodes.get(coords)
+            # Loaded chunks are only rebuilt when they need finer detail than they have
+            if lod_nodes is None or detail < min(lod_nodes):
+                self._chunk_pool.request(
+                    coords,
+                    self._chunk_priority(coords, mol_cam, forward),
+                    detail=detail,
+                    context=templates_context,
+                )
+        self._chunk_pool.pump()
+
+        for result in self._chunk_pool.collect(
+            budget_s=CHUNK_ATTACH_BUDGET_MS / 1000.0, max_results=MAX_CHUNKS_PER_FRAME
+        ):
+            self._attach_chunk(result)
+
+        if CHUNK_FLATTEN_STATIC and not self._sim_running:
+            self._bake_flattened_chunks(CHUNK_FLATTEN_PER_FRAME)
+        for coords in self._loaded_chunks:
+            self._set_chunk_lod(coords, self._chunk_lod_level(coords, centre))
 
-        generated = 0
-        for coords in candidates:
-            if generated >= MAX_CHUNKS_PER_FRAME:
-                break
-            if coords not in self._loaded_chunks:
-                self._loaded_chunks[coords] = self._generate_chunk(coords)
-                generated += 1
+        # After the LOD pass, so chunks that just reached full detail get a simulation
+        if self._sim_running:
+            self._start_chunk_simulations()
 
         return task.cont
 
-    def _generate_chunk(self, chunk_coords: tuple[int, int, int]) -> NodePath:
+    def _chunk_lod_level(
+        self, chunk_coords: tuple[int, int, int], centre: tuple[int, int, int]
+    ) -> int:
+        """
+        Picks a chunk's level of detail from its Chebyshev chunk distance to the camera's chunk.
+
+        Args:
+            chunk_coords (tuple[int, int, int]): Integer (ix, iy, iz) grid coords
+            centre (tuple[int, int, int]): Chunk the camera is in
+
+        Returns:
+            int: CHUNK_LOD_FULL, CHUNK_LOD_POINTS or CHUNK_LOD_IMPOSTOR
+        """
+        dist = max(abs(a - b) for a, b in zip(chunk_coords, centre))
+        if dist <= LOD_FULL_RADIUS_CHUNKS:
+            return CHUNK_LOD_FULL
+        if dist <= LOD_POINTS_RADIUS_CHUNKS:
+            return CHUNK_LOD_POINTS
+        return CHUNK_LOD_IMPOSTOR
+
+    def _set_chunk_lod(self, chunk_coords: tuple[int, int, int], level: int) -> None:
+        """
+        Unstashes the chunk's node for the requested level and stashes the previous one.
+        Falls back to the finest level built so far while an upgrade is still in flight.
+        Full detail uses the flattened copy while dynamics is off and one has been baked.
+
+        Args:
+            chunk_coords (tuple[int, int, int]): Integer (ix, iy, iz) grid coords
+            level (int): Wanted level of detail
+        """
+        lod_nodes = self._chunk_lod_nodes[chunk_coords]
+        level = level if level in lod_nodes else min(lod_nodes)
+        self._chunk_levels[chunk_coords] = level
+        node = lod_nodes[level]
+        flat = self._chunk_flat_nodes.get(chunk_coords)
+        if level == CHUNK_LOD_FULL and flat is not None and not self._sim_running:
+            node = flat
+
+        previous = self._chunk_shown.get(chunk_coords)
+        if previous is not None and previous == node:
+            return
+        if previous is not None and not previous.isEmpty():
+            previous.stash()
+        node.unstash()
+        self._chunk_shown[chunk_coords] = node
+
+    def _chunk_at_full_detail(self, chunk_coords: tuple[int, int, int]) -> bool:
         """
-        Places and renders molecules for one chunk. Attaches result to mol_root.
+        Whether a chunk is currently shown at CHUNK_LOD_FULL with atom nodes to drive.
 
         Args:
             chunk_coords (tuple[int, int, int]): Integer (ix, iy, iz) grid coords
 
         Returns:
-            NodePath: The chunk node attache to mol_root
+            bool: True if the chunk's simulation should be allowed to run
+        """
+        return (
+            self._chunk_levels.get(chunk_coords) == CHUNK_LOD_FULL
+            and chunk_coords in self._chunk_instance_roots
+        )
+
+    def _bake_flattened_chunks(self, limit: int) -> None:
+        """
+        Bakes flattened copies for full-detail chunks that lack one, at most limit per call.
+
+        Args:
+            limit (int): Maximum number of chunks to flatten
+        """
+        for coords, lod_nodes in self._chunk_lod_nodes.items():
+            if limit <= 0:
+                return
+            if CHUNK_LOD_FULL not in lod_nodes or coords in self._chunk_flat_nodes:
+                continue
+            flat = bake_static_geometry(lod_nodes[CHUNK_LOD_FULL], self._loaded_chunks[coords])
+            flat.stash()
+            self._chunk_flat_nodes[coords] = flat
+            limit -= 1
+
+    def _drop_flattened_chunks(self) -> None:
+        """
+        Discards every flattened chunk copy so the per-instance nodes are shown until rebaked.
+        """
+        for coords, flat in self._chunk_flat_nodes.items():
+            lod_nodes = self._chunk_lod_nodes.get(coords)
+            shown = self._chunk_shown.get(coords)
+            if shown is not None and shown == flat and lod_nodes:
+                lod_nodes[CHUNK_LOD_FULL].unstash()
+                self._chunk_shown[coords] = lod_nodes[CHUNK_LOD_FULL]
+            flat.removeNode()
+        self._chunk_flat_nodes.clear()
+
+    def _chunk_priority(
+        self,
+        chunk_coords: tuple[int, int, int],
+        mol_cam: np.ndarray,
+        forward: np.ndarray,
+    ) -> float:
+        """
+        Scores how urgently a chunk is needed; lower is sooner. Distance from the camera to the
+        chunk centre, weighted up to 3x for chunks behind the camera.
+
+        Args:
+            chunk_coords (tuple[int, int, int]): Integer (ix, iy, iz) grid coords
+            mol_cam (np.ndarray): Camera position in molecular space (Angstroms), shape (3,)
+            forward (np.ndarray): Camera forward unit vector, shape (3,)
+
+        Returns:
+            float: Priority score
+        """
+        centre = (np.array(chunk_coords, dtype=float) + 0.5) * CHUNK_SIZE_A
+        offset = centre - mol_cam
+        dist = float(np.linalg.norm(offset))
+        if dist < 1e-6:
+            return 0.0
+        facing = float(np.dot(offset / dist, forward))
+        return dist * (2.0 - facing)
+
+    def _attach_chunk(self, result: ChunkBuildResult) -> None:
+        """
+        Attaches a chunk built by the worker pool to mol_root and registers its state.
+        A finer-detail rebuild of an already loaded chunk replaces it; anything else is dropped.
+
+        Args:
+            result (ChunkBuildResult): Finished, detached chunk.
+        """
+        coords = result.coords
+        existing = self._chunk_lod_nodes.get(coords)
+        if existing is not None:
+            if result.detail >= min(existing):
+                result.chunk_np.removeNode()
+                return
+            # Coarser builds never carry atom nodes, so no simulation is bound to the old chunk
+            self._loaded_chunks.pop(coords).removeNode()
+            self._chunk_shown.pop(coords, None)
+            self._chunk_levels.pop(coords, None)
+
+        result.chunk_np.reparentTo(self.mol_root)
+        self._loaded_chunks[coords] = result.chunk_np
+        self._chunk_object_states[coords] = result.object_state
+        self._chunk_lod_nodes[coords] = result.lod_nodes
+        if result.flat_np is not None:
+            self._chunk_flat_nodes[coords] = result.flat_np
+        if result.instance_roots:
+            self._chunk_instance_roots[coords] = result.instance_roots
+
+    def _generate_chunk(
+        self,
+        chunk_coords: tuple[int, int, int],
+        detail: int = CHUNK_LOD_FULL,
+        templates_context: ChunkTemplates | None = None,
+    ) -> ChunkBuildResult:
+        """
+        Places and renders molecules for one chunk into a detached node tree.
+        Runs on a chunk worker thread, so it must not touch the live scene graph or app state:
+        the templates and their hash come in with the request instead of being read from self.
+        Every level from detail up to CHUNK_LOD_IMPOSTOR is built, each stashed until chosen.
+
+        Args:
+            chunk_coords (tuple[int, int, int]): Integer (ix, iy, iz) grid coords
+            detail (int, optional): Finest level of detail to build. Defaults to CHUNK_LOD_FULL.
+            templates_context (ChunkTemplates | None, optional): (templates, templates hash)
+                captured on the main thread when the build was queued. Defaults to None, which
+                places nothing.
+
+        Returns:
+            ChunkBuildResult: The placed state and its chunk node, not yet attached to mol_root
         """
         ix, iy, iz = chunk_coords
-        wc = WORLD_CHUNKS
-        seed_key = (ix % wc, iy % wc, iz % wc)
-        seed = abs(hash(seed_key)) % (2**31)
+        seed = derive_chunk_seed(WORLD_SEED, chunk_coords, WORLD_CHUNKS)
         s = CHUNK_SIZE_A
         cmin = np.array([ix, iy, iz], dtype=float) * s
         cmax = cmin + s
@@ -552,7 +921,7 @@ class SeerApp(ShowBase):
             dtype=float,
         )
 
-        templates = self._mol_templates or {}
+        templates, templates_hash = templates_context or ({}, None)
         target_counts = {tid: CHUNK_MOL_COUNT_PER_TEMPLATE for tid in templates}
         total = sum(target_counts.values())
 
@@ -574,27 +943,68 @@ class SeerApp(ShowBase):
             # 0 and allow all instances to pile at the same point. Floor at 2.0Å so
             # even bare metal atoms are spaced apart.
             effective_r = max(max_r, 2.0)
+            # With relaxation, pack tighter and skip atom checks; relax_overlaps resolves overlap
+            spacing_radii = CHUNK_SPACING_RADII if CHUNK_RELAXATION else 3.5
             config = PlacementConfig(
                 seed=seed,
+                placement_engine=CHUNK_PLACEMENT_ENGINE,
                 frontier_radius=CHUNK_SIZE_A * 0.5,
-                min_center_distance=effective_r * 3.5,
+                min_center_distance=effective_r * spacing_radii,
                 max_total_attempts=total * 100,
                 target_instance_count=total,
                 stop_when_target_met=True,
+                enable_relaxation=CHUNK_RELAXATION,
+                relaxation_passes=CHUNK_RELAXATION_PASSES,
+                relaxation_step_size=CHUNK_RELAXATION_STEP_A,
+                relaxation_rotation_step=CHUNK_RELAXATION_ROTATION,
                 require_in_bounds=True,
-                require_no_overlap=True,
+                require_no_overlap=not CHUNK_RELAXATION,
             )
-            object_state = place_molecules(
-                object_state=object_state, config=config, target_counts=target_counts
+            if templates_hash is None:
+                templates_hash = hash_templates(templates)
+            cache_key = arrangement_key(
+                templates_hash=templates_hash,
+                config=config,
+                target_counts=target_counts,
+                box_size=cmax - cmin,
             )
-
-        chunk_np = self.mol_root.attachNewNode(f"chunk_{ix}_{iy}_{iz}")
-        instance_roots = render_object_state(
-            base=self, parent=chunk_np, object_state=object_state
+            cached = self._chunk_cache.get(cache_key, origin=cmin)
+            if cached is not None:
+                object_state.instances = cached
+            else:
+                object_state = place_molecules(
+                    object_state=object_state, config=config, target_counts=target_counts
+                )
+                self._chunk_cache.put(cache_key, object_state.instances, origin=cmin)
+
+        chunk_np = NodePath(f"chunk_{ix}_{iy}_{iz}")
+        instance_roots: dict[int, NodePath] = {}
+        lod_nodes: dict[int, NodePath] = {}
+        if detail <= CHUNK_LOD_FULL:
+            full_np = chunk_np.attachNewNode("lod_full")
+            instance_roots = render_object_state(
+                base=self, parent=full_np, object_state=object_state
+            )
+            lod_nodes[CHUNK_LOD_FULL] = full_np
+        flat_np = None
+        if CHUNK_FLATTEN_STATIC and CHUNK_LOD_FULL in lod_nodes:
+            flat_np = bake_static_geometry(lod_nodes[CHUNK_LOD_FULL], chunk_np)
+            flat_np.stash()
+        if detail <= CHUNK_LOD_POINTS:
+            lod_nodes[CHUNK_LOD_POINTS] = build_atom_points(chunk_np, object_state)
+        lod_nodes[CHUNK_LOD_IMPOSTOR] = build_molecule_impostors(chunk_np, object_state)
+        for lod_np in lod_nodes.values():
+            lod_np.stash()
+
+        return ChunkBuildResult(
+            coords=chunk_coords,
+            object_state=object_state,
+            chunk_np=chunk_np,
+            instance_roots=instance_roots,
+            detail=min(lod_nodes),
+            lod_nodes=lod_nodes,
+            flat_np=flat_np,
         )
-        self._chunk_object_states[chunk_coords] = object_state
-        self._chunk_instance_roots[chunk_coords] = instance_roots
-        return chunk_np
 
     def _bg_fade_task(self, task) -> int:
         """
@@ -641,9 +1051,11 @@ class SeerApp(ShowBase):
 
         obj_key = self.room_state.target_object_key
         if obj_key is not None:
-            self._mol_templates = build_templates_from_object(
-                self.room_data.get(obj_key, {})
-            )
+            templates = self._compiled_templates.templates_for(obj_key)
+            if templates is None:
+                templates = build_templates_from_object(self.room_data.get(obj_key, {}))
+            self._mol_templates = templates
+            self._mol_templates_hash = hash_templates(self._mol_templates)
 
         tp = self.room_state.target_point
         self._mol_origin = tp
@@ -684,10 +1096,14 @@ class SeerApp(ShowBase):
             return
         self._in_molecular_scene = False
 
+        self._chunk_pool.cancel_all()
+        self._prefetcher.reset()
+        self._needed_chunks.clear()
         for chunk_np in self._loaded_chunks.values():
             chunk_np.detachNode()
         self._loaded_chunks.clear()
         self._mol_templates = None
+        self._mol_templates_hash = None
         self._mol_origin = None
 
         for child in self.mol_root.getChildren():
@@ -722,6 +1138,10 @@ class SeerApp(ShowBase):
         self._sim_threads.clear()
         self._chunk_object_states.clear()
         self._chunk_instance_roots.clear()
+        self._chunk_lod_nodes.clear()
+        self._chunk_shown.clear()
+        self._chunk_levels.clear()
+        self._chunk_flat_nodes.clear()
         self._chunk_interp.clear()
         self._sim_running = False
 
@@ -1005,6 +1425,13 @@ class SeerApp(ShowBase):
             self._debug_lock_box.removeNode()
             self._debug_lock_box = None
 
+    def destroy(self) -> None:
+        """
+        Stops the chunk workers before ShowBase tears the window down.
+        """
+        self._chunk_pool.shutdown()
+        super().destroy()
+
 
 if __name__ == "__main__":
     app = SeerApp(aggregation_path=AGGREGATION_PATH, debug=True)
@@ -67,16 +67,68 @@ FADE_FOV_START: float = 10.0
 # -------------------------
 
 CHUNK_SIZE_A: float = 100.0
-LOAD_RADIUS_CHUNKS: int = 1
-UNLOAD_RADIUS_CHUNKS: int = 2
+LOAD_RADIUS_CHUNKS: int = 2
+UNLOAD_RADIUS_CHUNKS: int = 3
+LOD_FULL_RADIUS_CHUNKS: int = 1  # Chunks this close (Chebyshev) get atom spheres and bonds
+LOD_POINTS_RADIUS_CHUNKS: int = 2  # Then point sprites per atom; further out, one impostor per molecule
 MOL_CAM_SPEED_A: float = 50.0
 MOL_VIEW_SCALE: float = 0.01
 MAX_CHUNKS_PER_FRAME: int = 2
+CHUNK_WORKER_THREADS: int = 2  # Background threads running placement + node building
+CHUNK_ATTACH_BUDGET_MS: float = 4.0  # Main-thread time per frame for attaching finished chunks
+CHUNK_FLATTEN_STATIC: bool = True  # Merge full-detail chunks into a few Geoms while dynamics is off
+CHUNK_FLATTEN_PER_FRAME: int = 1  # Chunks re-flattened per frame after dynamics stops
+PREFETCH_HORIZON_S: float = 2.0  # How far ahead along the camera's path chunks are prefetched
+PREFETCH_HISTORY_FRAMES: int = 10  # Camera samples averaged for the velocity estimate
+PREFETCH_PATH_SAMPLES: int = 4  # Points sampled along the predicted path
 CHUNK_MOL_COUNT_PER_TEMPLATE: int = 4
 WORLD_CHUNKS: int = 10  # World loops every WORLD_CHUNKS * CHUNK_SIZE_A Angstroms per axis
+WORLD_SEED: int = 0  # Root of every chunk's placement seed; see derive_chunk_seed
+CHUNK_PLACEMENT_ENGINE: str = "poisson"  # PlacementConfig.placement_engine used for chunks
+# Pack chunks tighter and let relax_overlaps push apart whatever overlaps, instead of rejecting
+CHUNK_RELAXATION: bool = True
+CHUNK_SPACING_RADII: float = 2.5  # min_center_distance in bounding radii with relaxation; 3.5 without
+CHUNK_RELAXATION_PASSES: int = 20
+CHUNK_RELAXATION_STEP_A: float = 0.5  # Max translation per relaxation pass
+CHUNK_RELAXATION_ROTATION: float = 0.1  # Max rotation per relaxation pass, radians
+CHUNK_CACHE_MAX_ENTRIES: int = WORLD_CHUNKS**3  # In-memory arrangements; one per distinct chunk
+CHUNK_CACHE_DIR: str | None = None  # Set (e.g. "data/cache/chunks") to persist arrangements as .npz
+# Compiled molecule templates, rebuilt only when the aggregated JSON changes; None compiles in memory
+TEMPLATE_STORE_DIR: str | None = "data/cache/templates"
 
-# Maximum allowed cumulative drift (from first-received frame) in Angstroms
-# Prevents very slow, multi-step blow-ups that per-step guards miss.
+# ---------------------------------------------------------------------------
+# PubChem PUG REST (see src/render_molecules/processing/pubchem_client.py)
+# ---------------------------------------------------------------------------
+
+PUBCHEM_BASE_URL: str = "https://pubchem.ncbi.nlm.nih.gov/rest/pug"
+PUBCHEM_MAX_REQUESTS_PER_S: float = 5.0  # PubChem's published limit for automated access
+PUBCHEM_WORKERS: int = 4  # Concurrent requests; keeps round trips overlapped under the limit
+PUBCHEM_TIMEOUT_S: float = 30.0  # Per-request connect/read timeout
+PUBCHEM_CACHE_DIR: str | None = "data/cache/pubchem"  # Response cache; None disables it
+
+# ---------------------------------------------------------------------------
+# LLM composition stage (see src/video_processing/material_tagging/add_molecular_components.py)
+# ---------------------------------------------------------------------------
+
+OLLAMA_HOST: str | None = None  # Ollama server URL; None uses the OLLAMA_HOST env var or localhost
+COMPOSITION_WORKERS: int = 4  # Objects sent to the model concurrently
+COMPOSITION_SUMMARY_MAX: int = 40  # Earlier material -> compound choices sent for consistency
+COMPOSITION_CACHE_DIR: str | None = "data/cache/compositions"  # Per-object results; None disables
+# Content hashes recorded by the incremental pipeline runner (src/pipeline.py)
+PIPELINE_STATE_PATH: str = "data/cache/pipeline_state.json"
+
+# ---------------------------------------------------------------------------
+# Frame extraction (see src/video_processing/reconstruction/vid_to_imgs.py)
+# ---------------------------------------------------------------------------
+
+FRAME_EXTRACT_WORKERS: int = 4  # ffmpeg processes run at once, one per time segment
+FRAME_SEGMENT_S: float = 30.0  # Length of each concurrently extracted segment, in seconds
+FRAME_SCENE_THRESHOLD: float = 0.1  # "scene" mode keeps frames whose ffmpeg scene score exceeds this
+FRAME_MAX_GAP_S: float = 1.0  # "scene" mode still keeps at least one frame this often
+FRAME_OVERSAMPLE: int = 3  # "sharp" mode decodes this many candidates per kept frame
+
+# Maximum allowed displacement of any atom from its equilibrium position, in Angstroms.
+# SimulationThread resets instances that exceed it; catches slow multi-step blow-ups too.
 CUMULATIVE_DRIFT_LIMIT_A: float = 20.0
 
 METALLIC_ELEMENTS: frozenset[int] = frozenset({
@@ -106,6 +158,27 @@ HARMONIC_DT: float = 1e-15  # Internal fixed timestep in seconds (1 fs); do not
 K_BOND: float = 200.0  # Bond spring constant in N/m; gives ~0.14 Å bond fluctuation at 298 K
 K_ANCHOR: float = 0.5  # Weak per-atom anchor spring in N/m; prevents unlimited drift
 
+# ---------------------------------------------------------------------------
+# Simulation scheduling (see src/dynamics/sim_scheduler.py)
+# ---------------------------------------------------------------------------
+
+SIM_FULL_RATE_DISTANCE_A: float = 100.0  # On-screen chunks closer than this simulate unthrottled
+SIM_PAUSE_DISTANCE_A: float = 200.0  # Chunks further than this are paused
+SIM_REDUCED_WRITE_INTERVAL_S: float = 0.25  # Min seconds between buffer writes for throttled chunks
+SIM_TARGET_FPS: float = 60.0  # Render frame rate the step budget controller protects
+SIM_WORKER_THREADS: int = 2  # Shared workers running every chunk's simulation batches
+# Few-atom instances routinely swing past 3x the target T under Langevin noise, so an instance is
+# only rescaled once it stays that warm for several batches, or at once past the hot factor
+SIM_HEALTH_HOT_FACTOR: float = 10.0  # Instances hotter than this x target T are rescaled at once
+SIM_HEALTH_WARM_FACTOR: float = 3.0  # Instances this warm are rescaled when it persists...
+SIM_HEALTH_WARM_CHECKS: int = 3  # ...for this many consecutive health checks (one per write batch)
+SIM_HEALTH_MAX_RESETS: int = 3  # Instances reset more often than this are pinned at equilibrium
+SIM_MIN_DT_SCALE: float = 0.125  # Floor for the auto-reduced timestep, as a fraction of HARMONIC_DT
+MD_FRAME_HISTORY: int = 8  # Timestamped MD frames kept per simulation for playback
+MD_RENDER_DELAY_S: float = 0.15  # Playback lags the newest MD frame by this much to interpolate
+MD_MAX_EXTRAPOLATION_S: float = 0.1  # Cap on projecting past the newest frame when MD falls behind
+MD_CULL_PADDING_A: float = 3.0  # Added to instance bounds when culling: atom radii plus playback lag
+
 # ---------------------------------------------------------------------------
 # Crystal structures: atomic_number -> (type, lattice_param_m, basis_fractional)
 # ---------------------------------------------------------------------------
@@ -2,14 +2,52 @@
 ./src/utils/json_io.py
 
 Generic JSON load/save helpers. All paths are relative to the project root.
+
+orjson is used for parsing and compact output when it is installed; the standard library json module
+is the fallback. load_json_lazy indexes a large file without parsing it, so an object's fields are
+only decoded when they are first read.
 """
 
 import json
+import mmap
+import os
+import re
+from collections.abc import Iterator, Mapping
+from typing import Any
 
 from src.utils.resource_path import resource_path
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up; see requirements.txt
+    orjson = None
+
 _FOLDER = "data/vision_json/"
 
+# Strings (with escapes) and brackets; everything else is skipped by the regex engine
+_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]', re.DOTALL)
+_COLON = re.compile(rb"\s*:\s*")
+_INDEX_FORMAT_VERSION = 1
+
+
+def json_path(filename: str) -> str:
+    """
+    Resolves a filename in the vision_json folder to an absolute path.
+
+    Args:
+        filename (str): Filename relative to vision_json/.
+
+    Returns:
+        str: Absolute path.
+    """
+    return resource_path(_FOLDER + filename)
+
+
+def _loads(raw: bytes | bytearray | memoryview) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
 
 def load_json(filename: str) -> dict:
     """
@@ -21,17 +59,187 @@ def load_json(filename: str) -> dict:
     Returns:
         dict: The parsed JSON content.
     """
-    with open(resource_path(_FOLDER + filename), "rb") as f:
-        return json.load(f)
+    with open(json_path(filename), "rb") as f:
+        return _loads(f.read())
 
 
-def save_json(data: dict, filename: str) -> None:
+def save_json(data: dict, filename: str, compact: bool = False) -> None:
     """
     Saves a dict as JSON to the vision_json folder.
 
     Args:
         data (dict): The data to write.
         filename (str): Filename relative to vision_json/.
+        compact (bool, optional): Write without indentation or spaces, through orjson when it is
+            installed. Much faster and smaller for large pipeline outputs. Defaults to False.
+    """
+    path = json_path(filename)
+    if compact and orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+        return
+    with open(path, "w") as f:
+        if compact:
+            json.dump(data, f, separators=(",", ":"))
+        else:
+            json.dump(data, f, indent=2)
+
+
+# Index node: key -> [value start, value end, child node for indexed objects or None]
+_IndexNode = dict[str, list]
+
+
+def _build_index(buf: mmap.mmap | bytes, depth: int) -> _IndexNode | None:
+    """
+    Scans a JSON document once and records the byte span of every value whose key sits at most
+    depth objects deep. Returns None if the document is not a JSON object.
+    """
+    root: _IndexNode | None = None
+    # One entry per open container: [index node or None, last key entry awaiting its end]
+    stack: list[list] = []
+    top: _IndexNode | None = None  # Index node of the innermost container, if it is indexed
+    for match in _TOKEN.finditer(buf):
+        pos = match.start()
+        char = buf[pos]
+        if char == 34:  # '"'
+            if top is None:
+                continue  # Only keys of indexed objects matter
+            colon = _COLON.match(buf, match.end())
+            if colon is None:
+                continue  # A string value, not a key
+            frame = stack[-1]
+            if frame[1] is not None:
+                frame[1][1] = pos
+            entry = [colon.end(), -1, None]
+            top[_loads(match.group())] = entry
+            frame[1] = entry
+        elif char == 123 or char == 91:  # '{' or '['
+            node: _IndexNode | None = None
+            if char == 123:
+                if not stack:
+                    node = root = {}
+                elif top is not None and len(stack) < depth:
+                    parent_entry = stack[-1][1]
+                    if parent_entry is not None and parent_entry[0] == pos:
+                        node = parent_entry[2] = {}
+            elif not stack:
+                return None
+            stack.append([node, None])
+            top = node
+        else:
+            if not stack:
+                break
+            frame = stack.pop()
+            if frame[1] is not None:
+                frame[1][1] = pos
+            if not stack:
+                break
+            top = stack[-1][0]
+    return root
+
+
+def _load_index(path: str, buf: mmap.mmap | bytes, depth: int) -> _IndexNode | None:
+    """
+    Returns the offset index for a file, reusing a sidecar "<path>.index" written for the same
+    size, modification time and depth, and writing one after a fresh scan.
+    """
+    stat = os.stat(path)
+    stamp = [_INDEX_FORMAT_VERSION, stat.st_size, stat.st_mtime_ns, depth]
+    sidecar = f"{path}.index"
+    try:
+        with open(sidecar, "rb") as f:
+            cached = _loads(f.read())
+        if cached.get("stamp") == stamp:
+            return cached["index"]
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    index = _build_index(buf, depth)
+    if index is not None:
+        try:
+            with open(sidecar, "w") as f:
+                json.dump({"stamp": stamp, "index": index}, f, separators=(",", ":"))
+        except OSError:
+            pass  # Read-only data dir (e.g. a frozen build); scan again next time
+    return index
+
+
+class LazyJson(Mapping[str, Any]):
+    """
+    Read-only mapping over a JSON object that parses values on first access.
+
+    The file is memory-mapped and scanned once for key positions; the offsets are kept in a
+    "<path>.index" sidecar so later opens of the unchanged file skip the scan. Values of keys up to
+    index_depth objects deep are located without being parsed; objects at those levels come back as
+    nested LazyJson mappings, and everything below is parsed as plain JSON when first read. Parsed
+    values are cached.
+
+    Args:
+        path (str): Absolute path of the JSON file.
+        index_depth (int, optional): Number of object levels to index. Defaults to 2, which for the
+            aggregation files means object keys and each object's top-level fields.
+    """
+
+    def __init__(self, path: str, index_depth: int = 2) -> None:
+        with open(path, "rb") as f:
+            try:
+                buf: mmap.mmap | bytes = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file
+                buf = f.read()
+        index = _load_index(path, buf, max(1, index_depth))
+        if index is None:
+            raise ValueError(f"{path} does not contain a JSON object")
+        self._init(buf, index)
+
+    @classmethod
+    def _child(cls, buf: mmap.mmap | bytes, index: _IndexNode) -> "LazyJson":
+        child = cls.__new__(cls)
+        child._init(buf, index)
+        return child
+
+    def _init(self, buf: mmap.mmap | bytes, index: _IndexNode) -> None:
+        self._buf = buf
+        self._index: _IndexNode = index
+        self._values: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        start, end, child = self._index[key]
+        if child is not None:
+            value: Any = LazyJson._child(self._buf, child)
+        else:
+            raw = self._buf[start:end].rstrip()
+            value = _loads(raw[:-1] if raw.endswith(b",") else raw)
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def to_dict(self) -> dict:
+        """Parses everything that is left and returns plain nested dicts."""
+        return {
+            key: value.to_dict() if isinstance(value, LazyJson) else value
+            for key, value in self.items()
+        }
+
+
+def load_json_lazy(filename: str, index_depth: int = 2) -> LazyJson:
+    """
+    Opens a JSON file from the vision_json folder for on-demand parsing.
+
+    Args:
+        filename (str): Filename relative to vision_json/ (e.g. "final_aggregated.json").
+        index_depth (int, optional): Object levels to index; see LazyJson. Defaults to 2.
+
+    Returns:
+        LazyJson: Mapping over the file's top-level object.
     """
-    with open(resource_path(_FOLDER + filename), "w") as f:
-        json.dump(data, f, indent=2)
+    return LazyJson(json_path(filename), index_depth=index_depth)
@@ -6,15 +6,34 @@ python -m src.video_processing.material_tagging.add_molecular_components
 Takes the annotations.json file, reads the materials for each object, installs a local Ollama model,
 adds the molecular composition for each material to the same json, then removes the Ollama model.
 
+Objects are sent to the model concurrently, each as an independent request carrying a bounded
+summary of earlier choices instead of the whole chat history. Results are cached per object name,
+materials, model and prompt, which also checkpoints the run: an interrupted run resumes where it
+stopped. OLLAMA_HOST can point the stage at any Ollama-compatible server.
+
 Uses the molecule names in the aggregated JSON file to lookup SMILES.
 """
 
+import copy
+import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import ollama
-import requests
 
+from src.render_molecules.processing.pubchem_client import PubChemClient
+from src.utils.constants import (
+    COMPOSITION_CACHE_DIR,
+    COMPOSITION_SUMMARY_MAX,
+    COMPOSITION_WORKERS,
+    OLLAMA_HOST,
+    PUBCHEM_CACHE_DIR,
+)
 from src.utils.json_io import load_json, save_json
+from src.utils.resource_path import resource_path
 from src.utils.type_annotations import (
     Aggregations,
     AnnotatedObjectDetails,
@@ -72,70 +91,328 @@ Output format (and nothing else):
 
 
 
-def run_ollama(object_details: AnnotatedObjectDetails, messages: list[dict]) -> dict:
+def prompt_digest(system_prompt: str = SYSTEM_PROMPT) -> str:
     """
-    Sends a chat message to the model and appends the exchange to the shared history.
+    Hashes the system prompt, so cached compositions are invalidated when it is edited.
+
+    Args:
+        system_prompt (str, optional): Prompt to hash. Defaults to SYSTEM_PROMPT.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    return hashlib.sha256(system_prompt.encode()).hexdigest()
+
+
+def composition_key(object_details: AnnotatedObjectDetails, model: str, digest: str) -> str:
+    """
+    Builds the cache key for one object's composition from everything the answer depends on.
 
     Args:
         object_details (AnnotatedObjectDetails): The details of the object.
-        messages (list[dict]): Running chat history; mutated in place.
+        model (str): Ollama model name.
+        digest (str): prompt_digest of the system prompt.
 
     Returns:
-        dict: The JSON output from Ollama, being only the composition.
+        str: Hex SHA-256 of (object name, sorted materials, model, prompt digest).
     """
-    print("Generating response...")
-    messages.append({"role": "user", "content": str(object_details)})
-    response = ollama.chat(
-        model=MODEL,
-        messages=messages,
-        format="json",
+    payload = json.dumps(
+        [object_details["name"], sorted(object_details["materials"]), model, digest]
     )
-    content = response.message.content or ""
-    messages.append({"role": "assistant", "content": content})
-    return json.loads(content)
+    return hashlib.sha256(payload.encode()).hexdigest()
 
 
-def build_smiles(composition: dict[str, dict[str, str]]) -> str:
+class CompositionCache:
     """
-    Adds the SMILES string for each molecule name.
+    One JSON file per composition key. Each object's result is written as soon as it arrives, so
+    the cache is also the stage's checkpoint: re-running after a crash only queries the objects
+    that had not finished.
 
     Args:
-        composition (dict[str, dict[str, str]]): The composition value taken from the response dictionary.
+        cache_dir (str | None): Directory for cached compositions. None disables the cache.
     """
-    for molec_name, molec_details in composition.items():
-        url = f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/name/{molec_name}/property/IsomericSMILES/JSON"
-        response = requests.get(url)
-        data = response.json()
+
+    def __init__(self, cache_dir: str | None) -> None:
+        self.cache_dir: str | None = cache_dir
+        if cache_dir is not None:
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+            except OSError as exc:
+                print(f"Composition cache dir {cache_dir} unavailable: {exc}")
+                self.cache_dir = None
+
+    def _path(self, key: str) -> str:
+        assert self.cache_dir is not None
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> dict | None:
+        """
+        Looks up a cached composition.
+
+        Args:
+            key (str): composition_key of the object.
+
+        Returns:
+            dict | None: The composition, or None on a miss.
+        """
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)["composition"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            print(f"Ignoring unreadable composition cache entry {key}: {exc}")
+            return None
+
+    def put(self, key: str, object_details: AnnotatedObjectDetails, composition: dict) -> None:
+        """
+        Stores a composition, writing through a temp file so a crash never leaves a partial entry.
+
+        Args:
+            key (str): composition_key of the object.
+            object_details (AnnotatedObjectDetails): The object, recorded for readability.
+            composition (dict): The model's composition for the object.
+        """
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        entry = {
+            "name": object_details["name"],
+            "materials": object_details["materials"],
+            "composition": composition,
+        }
         try:
-            smiles = data["PropertyTable"]["Properties"][0]["SMILES"]
-            molec_details["smiles"] = smiles
-        except KeyError as e:
-            print(f"Key error: {e}")
-    return smiles
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            print(f"Could not cache composition for {object_details['name']}: {exc}")
+
+
+class ConsistencySummary:
+    """
+    Bounded record of the compounds chosen for earlier materials. It is sent with every request in
+    place of the full chat history, so the model can stay consistent across objects while each
+    request stays the same size however many objects came before. Safe across threads.
+
+    Args:
+        max_entries (int, optional): Material sets remembered; the oldest are dropped first.
+            Defaults to COMPOSITION_SUMMARY_MAX.
+    """
+
+    def __init__(self, max_entries: int = COMPOSITION_SUMMARY_MAX) -> None:
+        self.max_entries: int = max(0, max_entries)
+        self._entries: OrderedDict[tuple[str, ...], str] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, materials: list[str], composition: dict) -> None:
+        """
+        Remembers the compounds chosen for a set of materials.
+
+        Args:
+            materials (list[str]): The object's materials.
+            composition (dict): The composition chosen for them.
+        """
+        key = tuple(sorted(materials))
+        if not key or not composition or self.max_entries == 0:
+            return
+        compounds = ", ".join(
+            f"{name} ({details.get('formula', '?')})" if isinstance(details, dict) else name
+            for name, details in composition.items()
+        )
+        with self._lock:
+            self._entries[key] = compounds
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def render(self) -> str:
+        """
+        Formats the summary as a prompt message.
+
+        Returns:
+            str: The summary as a prompt message, or "" if nothing has been recorded.
+        """
+        with self._lock:
+            lines = [f"- {', '.join(key)}: {compounds}" for key, compounds in self._entries.items()]
+        if not lines:
+            return ""
+        return (
+            "Compounds already chosen for earlier items; use the same ones for the same materials:\n"
+            + "\n".join(lines)
+        )
+
 
+def run_ollama(
+    object_details: AnnotatedObjectDetails,
+    summary: str = "",
+    client: ollama.Client | None = None,
+    model: str = MODEL,
+) -> dict:
+    """
+    Asks the model for one object's composition. Each request is independent: the system prompt,
+    the consistency summary (if any) and the object.
 
-def aggregate_compositions() -> Aggregations:
-    annotations: Annotations = load_json("annotations.json")
-    aggregations: Aggregations = {}
+    Args:
+        object_details (AnnotatedObjectDetails): The details of the object.
+        summary (str, optional): ConsistencySummary.render() output. Defaults to "".
+        client (ollama.Client | None, optional): Client to use. Defaults to None, which uses the
+            ollama module's default client.
+        model (str, optional): Ollama model name. Defaults to MODEL.
+
+    Returns:
+        dict: The JSON output from Ollama, being only the composition.
+    """
     messages: list[dict] = [{"role": "system", "content": SYSTEM_PROMPT}]
+    if summary:
+        messages.append({"role": "system", "content": summary})
+    item = {"name": object_details["name"], "materials": sorted(object_details["materials"])}
+    messages.append({"role": "user", "content": json.dumps(item)})
+    response = (client or ollama).chat(model=model, messages=messages, format="json")
+    content = response.message.content or ""
+    return json.loads(content)
+
+
+def build_smiles(
+    compositions: list[dict[str, dict[str, str]]], client: PubChemClient | None = None
+) -> dict[str, str | None]:
+    """
+    Adds the SMILES string for each molecule name across many compositions, resolving every
+    distinct name once with concurrent, cached PubChem property requests.
+
+    Args:
+        compositions (list[dict[str, dict[str, str]]]): Composition values taken from the responses;
+            molecules that resolve gain a "smiles" entry.
+        client (PubChemClient | None, optional): Client to use. Defaults to None, which creates a
+            cached client for this call.
+
+    Returns:
+        dict[str, str | None]: SMILES per distinct molecule name; None if PubChem had no match.
+    """
+    own_client = client is None
+    if client is None:
+        client = PubChemClient(
+            cache_dir=resource_path(PUBCHEM_CACHE_DIR) if PUBCHEM_CACHE_DIR else None
+        )
+    try:
+        smiles_of = client.resolve_smiles(
+            molec_name for composition in compositions for molec_name in composition
+        )
+    finally:
+        if own_client:
+            client.close()
+
+    for composition in compositions:
+        for molec_name, molec_details in composition.items():
+            smiles = smiles_of.get(molec_name)
+            if smiles:
+                molec_details["smiles"] = smiles
+            else:
+                print(f"No SMILES found for {molec_name}")
+    return smiles_of
+
+
+def aggregate_compositions(
+    annotations: Annotations | None = None,
+    client: ollama.Client | None = None,
+    model: str = MODEL,
+    cache: CompositionCache | None = None,
+    max_workers: int = COMPOSITION_WORKERS,
+    pubchem: PubChemClient | None = None,
+) -> Aggregations:
+    """
+    Adds a composition to every annotated object.
+
+    Objects with the same name and materials share one request. Finished results come from the
+    cache; the rest are sent to the model concurrently, each with the consistency summary built
+    from the results so far, and cached as they arrive.
+
+    Args:
+        annotations (Annotations | None, optional): Annotated objects. Defaults to None, which
+            loads annotations.json.
+        client (ollama.Client | None, optional): Client to use. Defaults to None, which connects
+            to OLLAMA_HOST.
+        model (str, optional): Ollama model name. Defaults to MODEL.
+        cache (CompositionCache | None, optional): Result cache. Defaults to None, which uses
+            COMPOSITION_CACHE_DIR.
+        max_workers (int, optional): Concurrent requests. Defaults to COMPOSITION_WORKERS.
+        pubchem (PubChemClient | None, optional): Client for the SMILES lookups. Defaults to None,
+            which lets build_smiles create a cached one.
+
+    Returns:
+        Aggregations: The annotations with a "composition" (including SMILES) per object.
+    """
+    if annotations is None:
+        annotations = load_json("annotations.json")
+    if client is None:
+        client = ollama.Client(host=OLLAMA_HOST)
+    if cache is None:
+        cache = CompositionCache(
+            resource_path(COMPOSITION_CACHE_DIR) if COMPOSITION_CACHE_DIR else None
+        )
+
+    digest = prompt_digest()
+    keys = {
+        obj_name: composition_key(obj_details, model, digest)
+        for obj_name, obj_details in annotations.items()
+    }
+    summary = ConsistencySummary()
+    compositions: dict[str, dict] = {}
+    pending: dict[str, AnnotatedObjectDetails] = {}
     for obj_name, obj_details in annotations.items():
-        response = run_ollama(object_details=obj_details, messages=messages)
-        print(response)
+        key = keys[obj_name]
+        if key in compositions or key in pending:
+            continue
+        cached = cache.get(key)
+        if cached is None:
+            pending[key] = obj_details
+        else:
+            compositions[key] = cached
+            summary.record(obj_details["materials"], cached)
+    print(f"{len(compositions)} compositions cached, {len(pending)} to generate")
+
+    def compose(key: str, obj_details: AnnotatedObjectDetails) -> dict:
+        response = run_ollama(obj_details, summary=summary.render(), client=client, model=model)
         composition = response["composition"]
-        print(build_smiles(composition))
-        aggregations[obj_name] = {**obj_details, "composition": composition}
+        cache.put(key, obj_details, composition)
+        summary.record(obj_details["materials"], composition)
+        return composition
+
+    if pending:
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(pending))), thread_name_prefix="composition"
+        ) as executor:
+            futures = {
+                executor.submit(compose, key, obj_details): key
+                for key, obj_details in pending.items()
+            }
+            # A failure is raised once the other requests have finished and been cached
+            for future in as_completed(futures):
+                key = futures[future]
+                compositions[key] = future.result()
+                print(f"{pending[key]['name']}: {compositions[key]}")
+
+    aggregations: Aggregations = {
+        obj_name: {**obj_details, "composition": copy.deepcopy(compositions[keys[obj_name]])}
+        for obj_name, obj_details in annotations.items()
+    }
+    build_smiles([obj["composition"] for obj in aggregations.values()], client=pubchem)
     return aggregations
 
 
 def main():
+    client = ollama.Client(host=OLLAMA_HOST)
     print(f"Pulling {MODEL} from ollama")
-    ollama.pull(MODEL)
+    client.pull(MODEL)
 
-    aggregated = aggregate_compositions()
-    save_json(aggregated, "aggregated.json")
+    aggregated = aggregate_compositions(client=client)
+    save_json(aggregated, "aggregated.json", compact=True)
 
     if DELETE_MODEL:
-        ollama.delete(MODEL)
+        client.delete(MODEL)
 
 
 if __name__ == "__main__":
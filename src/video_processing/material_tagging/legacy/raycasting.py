@@ -2,10 +2,14 @@
 ./src/video_processing/material_tagging/raycasting.py
 
 The full raycasting pipeline, including the camera pose calculator.
+
+Run with --benchmark to compare per-ray and batched casting on a synthetic mesh.
 """
 
 import json
 import os
+import sys
+import time
 from pathlib import Path
 from typing import TypedDict
 
@@ -39,6 +43,89 @@ class ObjectData(TypedDict):
 
 
 Detections = dict[str, dict[str, ObjectData]]
+# frame_name: {object_name: [(origin, direction) per bounding-box corner]}
+Rays = dict[str, dict[str, list[tuple[np.ndarray, np.ndarray]]]]
+# frame_name: {object_name: [hit point, or None for a miss, per corner]}
+HitPoints = dict[str, dict[str, list[np.ndarray | None]]]
+
+
+def cast_rays_per_ray(scene: o3d.t.geometry.RaycastingScene, rays: Rays) -> HitPoints:
+    """
+    Casts every corner ray on its own, one cast_rays call per ray.
+
+    Args:
+        scene (o3d.t.geometry.RaycastingScene): Scene holding the mesh.
+        rays (Rays): Rays from Raycast.unprojection.
+
+    Returns:
+        HitPoints: Hit point per ray, or None where the ray misses the mesh.
+    """
+    hit_points: HitPoints = {}
+    for frame_name, objects in rays.items():
+        hit_points[frame_name] = {}
+        for (
+            obj_name,
+            rays_list,
+        ) in (
+            objects.items()
+        ):  # Remember, objects is of this format: {object_name: [(), (), (), ()]}
+            hit_points_list = []
+            for (
+                origin,
+                direction,
+            ) in rays_list:  # Each (origin, direction) tuple is one corner
+                ray = o3d.core.Tensor([[*origin, *direction]], dtype=o3d.core.float32)
+                result = scene.cast_rays(ray)  # Uses builtin raycasting funtion
+                t_hit = result["t_hit"].numpy()[0]
+                if np.isinf(t_hit):
+                    hit_points_list.append(
+                        None
+                    )  # For every ray that misses, None will be appended
+                else:
+                    hit_points_list.append(np.array(origin) + t_hit * np.array(direction))
+            hit_points[frame_name][obj_name] = hit_points_list
+    return hit_points
+
+
+def cast_rays_batched(scene: o3d.t.geometry.RaycastingScene, rays: Rays) -> HitPoints:
+    """
+    Casts all corner rays of all objects in all frames with one cast_rays call, so Open3D traverses
+    the BVH for every ray in parallel, then scatters the hits back into the per-frame structure.
+    Gives the same hit points as cast_rays_per_ray.
+
+    Args:
+        scene (o3d.t.geometry.RaycastingScene): Scene holding the mesh.
+        rays (Rays): Rays from Raycast.unprojection.
+
+    Returns:
+        HitPoints: Hit point per ray, or None where the ray misses the mesh.
+    """
+    layout = [
+        (frame_name, obj_name, len(rays_list))
+        for frame_name, objects in rays.items()
+        for obj_name, rays_list in objects.items()
+    ]
+    pairs = [
+        pair for objects in rays.values() for rays_list in objects.values() for pair in rays_list
+    ]
+    t_hit = np.empty(0, dtype=np.float32)
+    origins = directions = np.empty((0, 3))
+    if pairs:
+        origins = np.array([origin for origin, _ in pairs], dtype=float)  # (R, 3)
+        directions = np.array([direction for _, direction in pairs], dtype=float)  # (R, 3)
+        table = np.hstack([origins, directions]).astype(np.float32)  # (R, 6)
+        t_hit = scene.cast_rays(o3d.core.Tensor(table))["t_hit"].numpy()  # (R,)
+    hit = np.isfinite(t_hit)
+    points = origins + t_hit[:, None] * directions
+
+    hit_points: HitPoints = {frame_name: {} for frame_name in rays}
+    row = 0
+    for frame_name, obj_name, count in layout:
+        hit_points[frame_name][obj_name] = [
+            points[r] if hit[r] else None for r in range(row, row + count)
+        ]
+        row += count
+    return hit_points
 
 
 class Raycast:
@@ -217,7 +304,7 @@ class Raycast:
         scene.add_triangles(mesh_t)
         return scene
 
-    def raycast(self) -> dict[str, dict[str, list[np.ndarray]]] | None:
+    def raycast(self, batched: bool = True) -> dict[str, dict[str, list[np.ndarray]]] | None:
         """
         Main raycasting logic.
         hit_points =
@@ -233,42 +320,19 @@ class Raycast:
             }
         }
 
+        Args:
+            batched (bool, optional): Cast every ray in one call (cast_rays_batched) instead of one
+                call per ray (cast_rays_per_ray). Defaults to True.
+
         Returns:
             dict[str, dict[str, list[np.ndarray]]]: Dictionary containing all rays for each object.
         """
         print(f"{Fore.GREEN}Starting Raycasting now...")
         rays = self.unprojection()
         scene = self.setup_scene()
-        hit_points = {}
-
-        for frame_name, objects in rays.items():
-            hit_points[frame_name] = {}
-            for (
-                obj_name,
-                rays_list,
-            ) in (
-                objects.items()
-            ):  # Remember, objects is of this format: {object_name: [(), (), (), ()]}
-                hit_points_list = []
-                for (
-                    origin,
-                    direction,
-                ) in rays_list:  # Each (origin, direction) tuple is one corner
-                    ray = o3d.core.Tensor(
-                        [[*origin, *direction]], dtype=o3d.core.float32
-                    )
-                    result = scene.cast_rays(ray)  # Uses builtin raycasting funtion
-                    t_hit = result["t_hit"].numpy()[0]
-                    if np.isinf(t_hit):
-                        hit_points_list.append(
-                            None
-                        )  # For every ray that misses, None will be appended
-                    else:
-                        hit_points_list.append(
-                            np.array(origin) + t_hit * np.array(direction)
-                        )
-                hit_points[frame_name][obj_name] = hit_points_list
-        return hit_points
+        if batched:
+            return cast_rays_batched(scene, rays)
+        return cast_rays_per_ray(scene, rays)
 
     def aggregate(self) -> dict[str, list]:
         """
@@ -389,6 +453,72 @@ class Raycast:
         return R_align, t_align, scale
 
 
+def benchmark_raycast(
+    frames: int = 300,
+    objects: int = 8,
+    resolution: int = 100,
+    miss_fraction: float = 0.1,
+    seed: int = 0,
+) -> dict[str, float]:
+    """
+    Times per-ray against batched casting on a synthetic mesh: a sphere "room" of radius 5 with
+    camera origins inside it, plus a share of rays from outside pointing away so misses are covered.
+
+    Args:
+        frames (int, optional): Synthetic frames. Defaults to 300.
+        objects (int, optional): Objects per frame, each with 4 corner rays. Defaults to 8.
+        resolution (int, optional): Sphere resolution; triangles grow with its square.
+            Defaults to 100.
+        miss_fraction (float, optional): Share of rays that miss the mesh. Defaults to 0.1.
+        seed (int, optional): Random seed. Defaults to 0.
+
+    Returns:
+        dict[str, float]: Seconds for each mode, and their ratio as "speedup".
+    """
+    mesh = o3d.geometry.TriangleMesh.create_sphere(radius=5.0, resolution=resolution)
+    scene = o3d.t.geometry.RaycastingScene()
+    scene.add_triangles(o3d.t.geometry.TriangleMesh.from_legacy(mesh))
+
+    rng = np.random.default_rng(seed)
+    rays: Rays = {}
+    for frame in range(frames):
+        origin = rng.uniform(-2.0, 2.0, size=3)
+        frame_rays: dict[str, list[tuple[np.ndarray, np.ndarray]]] = {}
+        for obj in range(objects):
+            corners = []
+            for _ in range(4):
+                direction = rng.normal(size=3)
+                direction /= np.linalg.norm(direction)
+                if rng.random() < miss_fraction:
+                    corners.append((direction * 10.0, direction))  # Outside, facing away
+                else:
+                    corners.append((origin, direction))
+            frame_rays[f"object_{obj}"] = corners
+        rays[f"frame_{frame + 1:04d}.jpg"] = frame_rays
+
+    timings: dict[str, float] = {}
+    results: dict[str, HitPoints] = {}
+    for name, cast in (("per_ray", cast_rays_per_ray), ("batched", cast_rays_batched)):
+        start = time.perf_counter()
+        results[name] = cast(scene, rays)
+        timings[name] = time.perf_counter() - start
+
+    for frame_name, objects_hits in results["per_ray"].items():
+        for obj_name, expected in objects_hits.items():
+            got = results["batched"][frame_name][obj_name]
+            for a, b in zip(expected, got, strict=True):
+                if (a is None) != (b is None) or (a is not None and not np.allclose(a, b)):
+                    raise AssertionError(f"Batched hit differs for {frame_name}/{obj_name}")
+
+    timings["speedup"] = timings["per_ray"] / max(timings["batched"], 1e-12)
+    print(
+        f"{Fore.GREEN}{frames * objects * 4} rays, {len(mesh.triangles)} triangles: "
+        f"per-ray {timings['per_ray']:.3f}s, batched {timings['batched']:.3f}s "
+        f"({timings['speedup']:.1f}x)"
+    )
+    return timings
+
+
 def main():
     raycaster = Raycast(
         database_path=DATABSE_PATH,
@@ -415,4 +545,7 @@ if __name__ == "__main__":
     #     sys.stdout = sys.__stdout__
     #     sys.stderr = sys.__stderr__
     # print(f"{Fore.RED}All debug messages saved to {log_path}")
-    main()
+    if "--benchmark" in sys.argv:
+        benchmark_raycast()
+    else:
+        main()
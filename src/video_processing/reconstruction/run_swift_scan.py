@@ -10,20 +10,6 @@ import argparse
 import os
 import subprocess
 
-parser = argparse.ArgumentParser()
-parser.add_argument(
-    "--input-folder",
-    default="data/env_imgs/albert_room",
-    help="The relative path to your folder of images",
-)
-parser.add_argument(
-    "--output-file",
-    default="data/reconstructions/albert_room.usdz",
-    help="Output file for the .usdz file",
-)
-
-args = parser.parse_args()
-
 
 def native_scan(input_dir: str, output_file: str) -> None:
     """
@@ -91,4 +77,19 @@ RunLoop.main.run()
     )
 
 
-native_scan(args.input_folder, args.output_file)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--input-folder",
+        default="data/env_imgs/albert_room",
+        help="The relative path to your folder of images",
+    )
+    parser.add_argument(
+        "--output-file",
+        default="data/reconstructions/albert_room.usdz",
+        help="Output file for the .usdz file",
+    )
+
+    args = parser.parse_args()
+
+    native_scan(args.input_folder, args.output_file)
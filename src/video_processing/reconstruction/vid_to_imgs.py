@@ -1,28 +1,62 @@
 """
 ./src/video_processing/reconstruction/vid_to_imgs.py
 
-python -m src.video_processing.reconstruction.vid_to_imgs
+python -m src.video_processing.reconstruction.vid_to_imgs [--select fps|scene|sharp]
 
 Turns a video into a folder of images.
+
+extract_frames runs one ffmpeg process at a fixed rate. extract_frames_parallel splits the video into
+time segments that are decoded by concurrent ffmpeg processes, and can pick frames by content:
+"scene" keeps frames where the view changed (with a minimum rate so slow pans stay covered), and
+"sharp" keeps the least blurry of every few candidate frames. It writes manifest.json next to the
+frames, listing each frame's timestamp so later stages know what they are working with.
 """
 
 import argparse
+import glob
+import json
 import os
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 
-parser = argparse.ArgumentParser()
-parser.add_argument(
-    "--vid-path",
-    default="data/env_vids/albert_room.mov",
-    help="The relative path to your environment video",
-)
-parser.add_argument(
-    "--output-folder",
-    default="data/env_imgs/albert_room",
-    help="Output file for the imgs folder",
+import numpy as np
+from PIL import Image
+
+from src.utils.constants import (
+    FRAME_EXTRACT_WORKERS,
+    FRAME_MAX_GAP_S,
+    FRAME_OVERSAMPLE,
+    FRAME_SCENE_THRESHOLD,
+    FRAME_SEGMENT_S,
 )
 
-args = parser.parse_args()
+MANIFEST_NAME = "manifest.json"
+SELECT_MODES = ("fps", "scene", "sharp")
+
+_PTS_TIME = re.compile(r"\bn:\s*\d+\s+pts:\s*-?\d+\s+pts_time:(-?[\d.]+)")
+
+
+@dataclass
+class FrameSelection:
+    """
+    How extract_frames_parallel picks frames.
+
+    Attributes:
+        mode (str): "fps" for a fixed rate, "scene" for view changes, "sharp" for the sharpest of
+            every oversample candidates.
+        fps (float): Frame rate for "fps", and the output rate for "sharp".
+        scene_threshold (float): ffmpeg scene score (0-1) above which "scene" keeps a frame.
+        max_gap_s (float): Longest stretch "scene" goes without keeping a frame.
+        oversample (int): Candidates decoded per kept frame in "sharp".
+    """
+
+    mode: str = "fps"
+    fps: float = 2.0
+    scene_threshold: float = FRAME_SCENE_THRESHOLD
+    max_gap_s: float = FRAME_MAX_GAP_S
+    oversample: int = FRAME_OVERSAMPLE
 
 
 def extract_frames(vid_path: str, output_folder: str, fps=2) -> None:
@@ -53,4 +87,250 @@ def extract_frames(vid_path: str, output_folder: str, fps=2) -> None:
     print("Extraction complete.")
 
 
-extract_frames(args.vid_path, args.output_folder)
+def probe_duration(vid_path: str) -> float | None:
+    """
+    Reads a video's duration with ffprobe.
+
+    Args:
+        vid_path (str): Path to the video.
+
+    Returns:
+        float | None: Duration in seconds, or None if ffprobe is unavailable or cannot tell.
+    """
+    command = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration",
+        "-of",
+        "default=noprint_wrappers=1:nokey=1",
+        vid_path,
+    ]
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        return float(result.stdout.strip().splitlines()[0])
+    except (OSError, subprocess.CalledProcessError, ValueError, IndexError):
+        return None
+
+
+def plan_segments(duration: float | None, segment_s: float) -> list[tuple[float, float | None]]:
+    """
+    Splits a video into back-to-back time segments.
+
+    Args:
+        duration (float | None): Video length in seconds; None gives one segment for the whole video.
+        segment_s (float): Target segment length in seconds.
+
+    Returns:
+        list[tuple[float, float | None]]: (start, length) per segment; length None means to the end.
+    """
+    if duration is None or segment_s <= 0 or duration <= segment_s:
+        return [(0.0, None)]
+    starts = np.arange(0.0, duration, segment_s)
+    return [(float(start), float(min(segment_s, duration - start))) for start in starts]
+
+
+def _select_filter(selection: FrameSelection) -> str:
+    """ffmpeg filter chain for one segment; showinfo logs the timestamp of every kept frame."""
+    if selection.mode == "fps":
+        chain = f"fps={selection.fps}"
+    elif selection.mode == "scene":
+        # Keep each segment's first frame, view changes, and a frame per max_gap_s otherwise
+        chain = (
+            f"select='eq(n\\,0)+gt(scene\\,{selection.scene_threshold})"
+            f"+gte(t-prev_selected_t\\,{selection.max_gap_s})'"
+        )
+    elif selection.mode == "sharp":
+        chain = f"fps={selection.fps * max(1, selection.oversample)}"
+    else:
+        raise ValueError(f"Unknown frame selection mode {selection.mode!r}")
+    return f"{chain},showinfo"
+
+
+def sharpness(image_path: str, max_side: int = 512) -> float:
+    """
+    Scores focus as the variance of the Laplacian of a downscaled greyscale copy.
+
+    Args:
+        image_path (str): Image file.
+        max_side (int, optional): Longest side the image is reduced to first. Defaults to 512.
+
+    Returns:
+        float: Higher is sharper.
+    """
+    with Image.open(image_path) as image:
+        grey = image.convert("L")
+        grey.thumbnail((max_side, max_side))
+        pixels = np.asarray(grey, dtype=np.float32)
+    if pixels.shape[0] < 3 or pixels.shape[1] < 3:
+        return 0.0
+    laplacian = (
+        4.0 * pixels[1:-1, 1:-1]
+        - pixels[:-2, 1:-1]
+        - pixels[2:, 1:-1]
+        - pixels[1:-1, :-2]
+        - pixels[1:-1, 2:]
+    )
+    return float(laplacian.var())
+
+
+def _extract_segment(
+    vid_path: str,
+    output_folder: str,
+    index: int,
+    start: float,
+    length: float | None,
+    selection: FrameSelection,
+    threads: int,
+) -> list[dict]:
+    """Runs ffmpeg on one segment and returns its kept frames, in time order."""
+    prefix = f"seg{index:04d}_"
+    command = ["ffmpeg", "-hide_banner", "-nostdin", "-y", "-loglevel", "info"]
+    command += ["-threads", str(threads)]
+    if start > 0.0:
+        command += ["-ss", f"{start:.3f}"]
+    if length is not None:
+        command += ["-t", f"{length:.3f}"]
+    command += [
+        "-i",
+        vid_path,
+        "-vf",
+        _select_filter(selection),
+        "-fps_mode",
+        "vfr",
+        "-q:v",
+        "2",
+        os.path.join(output_folder, f"{prefix}%05d.jpg"),
+    ]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed on segment {index}: {result.stderr.strip()[-500:]}")
+
+    files = sorted(glob.glob(os.path.join(output_folder, f"{prefix}*.jpg")))
+    times = [float(t) for t in _PTS_TIME.findall(result.stderr)]
+    if len(times) != len(files):  # showinfo output missing or cut short; fall back to order
+        rate = selection.fps * (max(1, selection.oversample) if selection.mode == "sharp" else 1)
+        times = [i / max(rate, 1e-9) for i in range(len(files))]
+    frames = [
+        {"path": path, "time_s": round(start + t, 3), "segment": index}
+        for path, t in zip(files, times, strict=True)
+    ]
+
+    if selection.mode == "sharp":
+        window = max(1, selection.oversample)
+        kept: list[dict] = []
+        for first in range(0, len(frames), window):
+            group = frames[first : first + window]
+            for frame in group:
+                frame["sharpness"] = round(sharpness(frame["path"]), 2)
+            best = max(group, key=lambda frame: frame["sharpness"])
+            kept.append(best)
+            for frame in group:
+                if frame is not best:
+                    os.remove(frame["path"])
+        frames = kept
+    return frames
+
+
+def extract_frames_parallel(
+    vid_path: str,
+    output_folder: str,
+    selection: FrameSelection | None = None,
+    segment_s: float = FRAME_SEGMENT_S,
+    workers: int = FRAME_EXTRACT_WORKERS,
+) -> dict:
+    """
+    Extracts frames from time segments of a video concurrently and writes a manifest.
+
+    Earlier frame_*.jpg files in the folder are removed first, so the folder only holds this run.
+
+    Args:
+        vid_path (str): Path to the video.
+        output_folder (str): Path to the output folder of images.
+        selection (FrameSelection | None, optional): Which frames to keep. Defaults to None, which
+            keeps 2 frames per second like extract_frames.
+        segment_s (float, optional): Segment length in seconds. Defaults to FRAME_SEGMENT_S.
+        workers (int, optional): Concurrent ffmpeg processes. Defaults to FRAME_EXTRACT_WORKERS.
+
+    Returns:
+        dict: The manifest: the video, the selection settings, and per frame its file, timestamp
+            in seconds, segment and (in "sharp" mode) sharpness.
+    """
+    selection = selection or FrameSelection()
+    if selection.mode not in SELECT_MODES:
+        raise ValueError(f"Unknown frame selection mode {selection.mode!r}")
+    os.makedirs(output_folder, exist_ok=True)
+    for stale in glob.glob(os.path.join(output_folder, "frame_*.jpg")) + glob.glob(
+        os.path.join(output_folder, "seg*_*.jpg")
+    ):
+        os.remove(stale)
+
+    segments = plan_segments(probe_duration(vid_path), segment_s)
+    workers = max(1, min(workers, len(segments)))
+    # Share the cores between the ffmpeg processes instead of each decoder claiming all of them
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    print(
+        f"Extracting {selection.mode} frames to {output_folder} "
+        f"from {len(segments)} segment(s) with {workers} worker(s)..."
+    )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        per_segment = list(
+            executor.map(
+                lambda args: _extract_segment(vid_path, output_folder, *args, selection, threads),
+                [(index, start, length) for index, (start, length) in enumerate(segments)],
+            )
+        )
+
+    frames = [frame for segment_frames in per_segment for frame in segment_frames]
+    for number, frame in enumerate(frames, start=1):
+        name = f"frame_{number:04d}.jpg"
+        os.replace(frame.pop("path"), os.path.join(output_folder, name))
+        frame["file"] = name
+
+    manifest = {
+        "video": vid_path,
+        "selection": asdict(selection),
+        "segment_s": segment_s,
+        "frames": [{"file": frame.pop("file"), **frame} for frame in frames],
+    }
+    with open(os.path.join(output_folder, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Extraction complete: {len(frames)} frames.")
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--vid-path",
+        default="data/env_vids/albert_room.mov",
+        help="The relative path to your environment video",
+    )
+    parser.add_argument(
+        "--output-folder",
+        default="data/env_imgs/albert_room",
+        help="Output file for the imgs folder",
+    )
+    parser.add_argument(
+        "--select",
+        choices=SELECT_MODES,
+        default=None,
+        help="Extract segments in parallel and pick frames by fixed rate, scene change or sharpness",
+    )
+    parser.add_argument("--fps", type=float, default=2.0, help="Frame rate for fps/sharp modes")
+    parser.add_argument(
+        "--workers", type=int, default=FRAME_EXTRACT_WORKERS, help="Concurrent ffmpeg processes"
+    )
+
+    args = parser.parse_args()
+
+    if args.select is None:
+        extract_frames(args.vid_path, args.output_folder, fps=args.fps)
+    else:
+        extract_frames_parallel(
+            args.vid_path,
+            args.output_folder,
+            FrameSelection(mode=args.select, fps=args.fps),
+            workers=args.workers,
+        )
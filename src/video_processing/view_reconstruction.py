@@ -13,13 +13,6 @@ import zipfile
 import aspose.threed as a3d
 import open3d as o3d
 
-parser = argparse.ArgumentParser()
-parser.add_argument(
-    "--input-file", default="data/reconstructions/usdz/albert_room.usdz"
-)
-parser.add_argument("--output-file", default="data/reconstructions/obj/albert_room.obj")
-args = parser.parse_args()
-
 
 def extract_textures_from_usdz(usdz_path: str, output_dir: str) -> None:
     """
@@ -62,17 +55,24 @@ def convert_to_obj(input_file: str, output_file: str) -> None:
         print("Was not one of either OBJ or USDZ. Oops...")
 
 
-convert_to_obj(args.input_file, args.output_file)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--input-file", default="data/reconstructions/usdz/albert_room.usdz"
+    )
+    parser.add_argument("--output-file", default="data/reconstructions/obj/albert_room.obj")
+    args = parser.parse_args()
 
+    convert_to_obj(args.input_file, args.output_file)
 
-mesh = o3d.io.read_triangle_mesh(args.output_file, enable_post_processing=True)
-mesh.compute_vertex_normals()
+    mesh = o3d.io.read_triangle_mesh(args.output_file, enable_post_processing=True)
+    mesh.compute_vertex_normals()
 
-if not mesh.has_triangle_uvs():
-    print("Warning: No UVs found in mesh")
-if not mesh.textures:
-    print("Warning: No textures loaded")
+    if not mesh.has_triangle_uvs():
+        print("Warning: No UVs found in mesh")
+    if not mesh.textures:
+        print("Warning: No textures loaded")
 
-o3d.visualization.draw_geometries(
-    [mesh], mesh_show_wireframe=False, mesh_show_back_face=True
-)
+    o3d.visualization.draw_geometries(
+        [mesh], mesh_show_wireframe=False, mesh_show_back_face=True
+    )
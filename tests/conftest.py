@@ -0,0 +1,90 @@
+"""
+./tests/conftest.py
+
+Shared fixtures: a local stub HTTP server that stands in for PubChem and Ollama in tests.
+"""
+
+import json
+import threading
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+# Handler: (method, path, decoded JSON body or None) -> (status, JSON response body)
+Route = Callable[[str, str, Any], tuple[int, Any]]
+
+
+class StubServer:
+    """
+    Serves JSON from a route function on a free localhost port and records every request.
+
+    Args:
+        route (Route): Answers each request.
+    """
+
+    def __init__(self, route: Route) -> None:
+        self.route: Route = route
+        self.requests: list[tuple[str, str, Any]] = []
+        self._lock: threading.Lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _answer(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                body = json.loads(raw) if raw else None
+                with stub._lock:
+                    stub.requests.append((method, self.path, body))
+                status, payload = stub.route(method, self.path, body)
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                self._answer("GET")
+
+            def do_POST(self) -> None:
+                self._answer("POST")
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread: threading.Thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def paths(self, method: str = "GET") -> list[str]:
+        """Paths requested with the given method, in arrival order."""
+        with self._lock:
+            return [path for m, path, _body in self.requests if m == method]
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub_server() -> Iterator[Callable[[Route], StubServer]]:
+    """Starts stub servers for a test and shuts them all down afterwards."""
+    servers: list[StubServer] = []
+
+    def start(route: Route) -> StubServer:
+        server = StubServer(route)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.close()
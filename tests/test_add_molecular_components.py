@@ -0,0 +1,163 @@
+"""
+./tests/test_add_molecular_components.py
+
+python -m pytest tests/test_add_molecular_components.py
+
+Runs the composition stage against local stub PubChem and Ollama servers.
+"""
+
+import json
+from urllib.parse import unquote
+
+import ollama
+import pytest
+
+from src.render_molecules.processing.pubchem_client import PubChemClient
+from src.video_processing.material_tagging.add_molecular_components import (
+    CompositionCache,
+    aggregate_compositions,
+    build_smiles,
+)
+
+SMILES = {"water": "O", "sea salt": "[Na+].[Cl-]", "ethanol": "CCO"}
+NOT_FOUND = {"Fault": {"Code": "PUGREST.NotFound", "Message": "No CID found"}}
+
+
+def _pubchem_route(_method, path, _body):
+    parts = path.split("/")
+    if parts[1:3] == ["compound", "name"] and parts[4:] == ["property", "IsomericSMILES", "JSON"]:
+        name = unquote(parts[3])
+        if name in SMILES:
+            return 200, {"PropertyTable": {"Properties": [{"CID": 1, "SMILES": SMILES[name]}]}}
+    return 404, NOT_FOUND
+
+
+def test_build_smiles_resolves_each_name_once(stub_server, tmp_path) -> None:
+    server = stub_server(_pubchem_route)
+    compositions = [
+        {"water": {"formula": "H2O"}, "sea-salt": {"formula": "NaCl"}},
+        {"water": {"formula": "H2O"}, "ethanol": {"formula": "C2H6O"}},
+        {"water": {"formula": "H2O"}, "mystery": {"formula": "X"}},
+    ]
+    client = PubChemClient(base_url=server.url, cache_dir=str(tmp_path), rate_per_s=0.0)
+    smiles_of = build_smiles(compositions, client=client)
+    client.close()
+
+    assert smiles_of == {
+        "water": "O",
+        "sea-salt": "[Na+].[Cl-]",
+        "ethanol": "CCO",
+        "mystery": None,
+    }
+    assert [c["water"]["smiles"] for c in compositions] == ["O", "O", "O"]
+    assert compositions[0]["sea-salt"]["smiles"] == "[Na+].[Cl-]"
+    assert "smiles" not in compositions[2]["mystery"]
+
+    # One direct property request per distinct name, plus the hyphen-as-space retry
+    names = sorted(unquote(path.split("/")[3]) for path in server.paths())
+    assert names == ["ethanol", "mystery", "sea salt", "sea-salt", "water"]
+
+
+def test_build_smiles_rerun_is_served_from_cache(stub_server, tmp_path) -> None:
+    server = stub_server(_pubchem_route)
+    for _run in range(2):
+        compositions = [{"water": {"formula": "H2O"}, "mystery": {"formula": "X"}}]
+        client = PubChemClient(base_url=server.url, cache_dir=str(tmp_path), rate_per_s=0.0)
+        build_smiles(compositions, client=client)
+        client.close()
+        assert compositions[0]["water"]["smiles"] == "O"
+    assert len(server.paths()) == 2
+
+
+COMPOUNDS = {"glass": "silicon-dioxide", "water": "water", "wood": "cellobiose"}
+FORMULAS = {"silicon-dioxide": "O2Si", "water": "H2O", "cellobiose": "C12H22O11"}
+
+
+def _annotation(name: str, materials: list[str]) -> dict:
+    return {"name": name, "materials": materials, "corners": {}, "base_normal": [0.0, 0.0, 1.0]}
+
+
+ANNOTATIONS = {
+    "cup_1": _annotation("cup", ["glass", "water"]),
+    "cup_2": _annotation("cup", ["water", "glass"]),  # Same object as cup_1, materials reordered
+    "table_1": _annotation("table", ["wood"]),
+    "shelf_1": _annotation("shelf", ["wood", "glass"]),
+}
+
+
+class FakeOllama:
+    """Answers /api/chat with one compound per material; objects in failing get a 500."""
+
+    def __init__(self) -> None:
+        self.failing: set[str] = set()
+        self.asked: list[str] = []
+
+    def route(self, method: str, path: str, body: dict | None) -> tuple[int, dict]:
+        if method != "POST" or path != "/api/chat" or body is None:
+            return 404, {"error": "not found"}
+        item = json.loads(body["messages"][-1]["content"])
+        self.asked.append(item["name"])
+        if item["name"] in self.failing:
+            return 500, {"error": "model crashed"}
+        composition = {
+            COMPOUNDS[m]: {"formula": FORMULAS[COMPOUNDS[m]]} for m in item["materials"]
+        }
+        return 200, {
+            "model": body["model"],
+            "created_at": "2026-01-01T00:00:00Z",
+            "message": {"role": "assistant", "content": json.dumps({"composition": composition})},
+            "done": True,
+        }
+
+
+def _run(llm_server, pubchem_server, cache_dir) -> dict:
+    pubchem = PubChemClient(base_url=pubchem_server.url, rate_per_s=0.0)
+    try:
+        return aggregate_compositions(
+            annotations=json.loads(json.dumps(ANNOTATIONS)),
+            client=ollama.Client(host=llm_server.url),
+            model="fake-model",
+            cache=CompositionCache(str(cache_dir)),
+            max_workers=4,
+            pubchem=pubchem,
+        )
+    finally:
+        pubchem.close()
+
+
+def test_identical_objects_share_one_request(stub_server, tmp_path) -> None:
+    llm = FakeOllama()
+    aggregations = _run(stub_server(llm.route), stub_server(_pubchem_route), tmp_path)
+
+    assert sorted(llm.asked) == ["cup", "shelf", "table"]
+    assert aggregations["cup_1"]["composition"] == aggregations["cup_2"]["composition"]
+    assert aggregations["cup_1"]["composition"] is not aggregations["cup_2"]["composition"]
+    assert aggregations["cup_1"]["composition"]["water"] == {"formula": "H2O", "smiles": "O"}
+    assert set(aggregations["shelf_1"]["composition"]) == {"cellobiose", "silicon-dioxide"}
+
+
+def test_rerun_is_served_from_cache(stub_server, tmp_path) -> None:
+    llm = FakeOllama()
+    llm_server, pubchem_server = stub_server(llm.route), stub_server(_pubchem_route)
+    first = _run(llm_server, pubchem_server, tmp_path)
+    asked = len(llm.asked)
+
+    second = _run(llm_server, pubchem_server, tmp_path)
+    assert len(llm.asked) == asked
+    assert second == first
+
+
+def test_failed_run_resumes_with_only_the_missing_object(stub_server, tmp_path) -> None:
+    llm = FakeOllama()
+    llm.failing.add("table")
+    llm_server, pubchem_server = stub_server(llm.route), stub_server(_pubchem_route)
+    with pytest.raises(ollama.ResponseError):
+        _run(llm_server, pubchem_server, tmp_path)
+    assert sorted(llm.asked) == ["cup", "shelf", "table"]
+
+    llm.failing.clear()
+    llm.asked.clear()
+    aggregations = _run(llm_server, pubchem_server, tmp_path)
+    assert llm.asked == ["table"]
+    assert set(aggregations) == set(ANNOTATIONS)
+    assert aggregations["table_1"]["composition"]["cellobiose"]["formula"] == "C12H22O11"
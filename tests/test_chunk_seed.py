@@ -0,0 +1,94 @@
+"""
+./tests/test_chunk_seed.py
+
+python -m pytest tests/test_chunk_seed.py
+
+Pins chunk seeds and the placements they produce, so a change to seeding or the placement engines
+that would silently reshuffle every streamed chunk (and invalidate the arrangement cache) shows up.
+"""
+
+import numpy as np
+import pytest
+
+from src.render_molecules.arrangement.placement import (
+    PlacementConfig,
+    derive_chunk_seed,
+    place_molecules,
+)
+from src.render_molecules.arrangement.scene_state import MoleculeTemplate, ObjectState
+from src.utils.constants import WORLD_CHUNKS, WORLD_SEED
+
+
+def _water_template() -> MoleculeTemplate:
+    return MoleculeTemplate(
+        name="water",
+        aids=np.array([1, 2, 3]),
+        elements=np.array([8, 1, 1]),
+        local_xyz=(
+            np.array([0.0, 0.96, -0.24]),
+            np.array([0.0, 0.0, 0.93]),
+            np.array([0.0, 0.0, 0.0]),
+        ),
+        bonds_aid1=np.array([1, 1]),
+        bonds_aid2=np.array([2, 3]),
+        bond_order=np.array([1, 1]),
+    )
+
+
+def _chunk_state(seed: int) -> ObjectState:
+    return ObjectState(
+        object_key="chunk",
+        object_name="chunk",
+        instance_id="chunk",
+        display_name="chunk",
+        templates={0: _water_template()},
+        instances={},
+        box_bottom=np.zeros((3, 1)),
+        box_top=np.full((3, 1), 20.0),
+        rng_seed=seed,
+    )
+
+
+@pytest.mark.parametrize(
+    ("coords", "expected"),
+    [
+        ((0, 0, 0), 1530983934),
+        ((1, 2, 3), 51760083),
+        ((-1, 0, 0), 88616708),
+        ((3, -4, 12), 1613292386),
+    ],
+)
+def test_derive_chunk_seed_is_pinned(coords: tuple[int, int, int], expected: int) -> None:
+    assert derive_chunk_seed(WORLD_SEED, coords, WORLD_CHUNKS) == expected
+
+
+def test_derive_chunk_seed_wraps() -> None:
+    seed = derive_chunk_seed(WORLD_SEED, (-1, 0, 0), WORLD_CHUNKS)
+    assert seed == derive_chunk_seed(WORLD_SEED, (WORLD_CHUNKS - 1, 0, 0), WORLD_CHUNKS)
+    assert derive_chunk_seed(WORLD_SEED, (3, -4, 12), WORLD_CHUNKS) == derive_chunk_seed(
+        WORLD_SEED, (3, WORLD_CHUNKS - 4, 12 - WORLD_CHUNKS), WORLD_CHUNKS
+    )
+
+
+def test_poisson_placement_is_pinned() -> None:
+    seed = derive_chunk_seed(WORLD_SEED, (1, 2, 3), WORLD_CHUNKS)
+    config = PlacementConfig(
+        seed=seed,
+        placement_engine="poisson",
+        min_center_distance=4.0,
+        max_total_attempts=2000,
+        target_instance_count=5,
+    )
+    state = place_molecules(object_state=_chunk_state(seed), config=config, target_counts={0: 5})
+
+    assert len(state.instances) == 5
+    positions = [state.instances[i].position.ravel() for i in sorted(state.instances)[:3]]
+    np.testing.assert_allclose(
+        positions,
+        [
+            [10.036924, 10.018757, 9.948857],
+            [7.231706, 13.187995, 5.912227],
+            [6.396586, 19.261601, 9.445974],
+        ],
+        atol=1e-6,
+    )
@@ -0,0 +1,89 @@
+"""
+./tests/test_frustum_culler.py
+
+python -m pytest tests/test_frustum_culler.py
+
+Checks that a simulation's instance bounds follow its atoms and cull against the view frustum.
+"""
+
+import numpy as np
+
+from src.dynamics.frustum_culler import (
+    frustum_planes,
+    get_active_instances,
+    get_frustum_instances,
+)
+from src.dynamics.sim_thread import SimulationThread
+from src.render_molecules.arrangement.geometry import calculate_environment_center_of_mass
+from src.render_molecules.arrangement.scene_state import MoleculeInstance, ObjectState
+from src.utils.constants import ELEMENT_MASSES
+from tests.test_chunk_seed import _water_template
+
+FORWARD = np.array([1.0, 0.0, 0.0])
+
+
+def _state() -> ObjectState:
+    positions = [(20.0, 0.0, 0.0), (-20.0, 0.0, 0.0), (20.0, 40.0, 0.0)]
+    return ObjectState(
+        object_key="chunk",
+        object_name="chunk",
+        instance_id="chunk",
+        display_name="chunk",
+        templates={0: _water_template()},
+        instances={
+            i: MoleculeInstance(
+                template_id=0,
+                position=np.array(position),
+                rotation=np.eye(3),
+                hpr=(0.0, 0.0, 0.0),
+                id=i,
+            )
+            for i, position in enumerate(positions)
+        },
+        box_bottom=np.full((3, 1), -50.0),
+        box_top=np.full((3, 1), 50.0),
+        rng_seed=0,
+    )
+
+
+def test_bounds_start_at_instance_coms() -> None:
+    state = _state()
+    sim = SimulationThread(state, list(state.instances))
+    expected = [
+        calculate_environment_center_of_mass(template=state.templates[0], instance=inst)
+        for inst in state.instances.values()
+    ]
+    np.testing.assert_allclose(sim.bounds.centres, np.reshape(expected, (-1, 3)), atol=1e-9)
+
+
+def test_only_instances_ahead_are_culled_in() -> None:
+    state = _state()
+    sim = SimulationThread(state, list(state.instances))
+    planes = frustum_planes(
+        camera_pos=np.zeros(3),
+        camera_forward=FORWARD,
+        camera_up=np.array([0.0, 0.0, 1.0]),
+        fov_degrees=60.0,
+        aspect_ratio=1.5,
+        near=0.1,
+        far=1000.0,
+    )
+    assert get_frustum_instances(sim.bounds, planes) == [0]
+    assert get_active_instances(np.zeros(3), FORWARD, 60.0, sim.bounds) == [0]
+
+
+def test_bounds_follow_written_frames() -> None:
+    state = _state()
+    sim = SimulationThread(state, list(state.instances))
+    before = sim.bounds.centres
+    assert sim.run_batch() is not None
+
+    # Mass-weighted COM of the frame just written, per instance, in Angstroms. The bounds weight
+    # by real element masses, not the integrator's heavier hydrogen.
+    frame = sim.state.positions * 1e10
+    masses = np.tile([ELEMENT_MASSES[8], ELEMENT_MASSES[1], ELEMENT_MASSES[1]], len(state.instances))
+    starts = sim.mapping.starts
+    coms = np.add.reduceat(frame * masses[:, None], starts) / np.add.reduceat(masses, starts)[:, None]
+
+    assert sim.bounds.centres is not before
+    np.testing.assert_allclose(sim.bounds.centres, coms, atol=1e-6)
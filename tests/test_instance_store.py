@@ -0,0 +1,60 @@
+"""
+./tests/test_instance_store.py
+
+python -m pytest tests/test_instance_store.py
+
+Covers InstanceStore grouping, including the empty store that chunks without templates produce.
+"""
+
+import numpy as np
+
+from src.dynamics.frustum_culler import InstanceBounds
+from src.render_molecules.arrangement.scene_state import (
+    InstanceStore,
+    MoleculeInstance,
+    ObjectState,
+)
+
+
+def _empty_state() -> ObjectState:
+    return ObjectState(
+        object_key="chunk",
+        object_name="chunk",
+        instance_id="chunk",
+        display_name="chunk",
+        templates={},
+        instances={},
+        box_bottom=np.zeros((3, 1)),
+        box_top=np.full((3, 1), 20.0),
+        rng_seed=0,
+    )
+
+
+def _instance(instance_id: int, template_id: int) -> MoleculeInstance:
+    return MoleculeInstance(
+        template_id=template_id,
+        position=np.full(3, float(instance_id)),
+        rotation=np.eye(3),
+        hpr=(0.0, 0.0, 0.0),
+        id=instance_id,
+    )
+
+
+def test_rows_by_template_empty_store() -> None:
+    assert InstanceStore().rows_by_template() == {}
+
+
+def test_rows_by_template_groups_rows() -> None:
+    store = InstanceStore({i: _instance(i, tid) for i, tid in enumerate([1, 0, 1, 2])})
+    groups = store.rows_by_template()
+    assert sorted(groups) == [0, 1, 2]
+    np.testing.assert_array_equal(groups[1], [0, 2])
+    np.testing.assert_array_equal(groups[0], [1])
+    np.testing.assert_array_equal(groups[2], [3])
+
+
+def test_instance_bounds_empty_state() -> None:
+    bounds = InstanceBounds(_empty_state())
+    assert bounds.ids.size == 0
+    assert bounds.centres.shape == (0, 3)
+    assert bounds.radii.shape == (0,)
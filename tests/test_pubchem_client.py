@@ -0,0 +1,116 @@
+"""
+./tests/test_pubchem_client.py
+
+python -m pytest tests/test_pubchem_client.py
+
+Runs PubChemClient and build_details against a local stub PUG REST server.
+"""
+
+import time
+
+from src.render_molecules.processing.mol_details_pubchem import build_details
+from src.render_molecules.processing.pubchem_client import PubChemClient
+
+WATER_RECORD = {
+    "PC_Compounds": [
+        {
+            "atoms": {"aid": [1, 2, 3], "element": [8, 1, 1]},
+            "bonds": {"aid1": [1, 1], "aid2": [2, 3], "order": [1, 1]},
+            "coords": [{"conformers": [{"x": [0.0, 0.96, -0.24], "y": [0.0, 0.0, 0.93]}]}],
+        }
+    ]
+}
+NOT_FOUND = {"Fault": {"Code": "PUGREST.NotFound", "Message": "No CID found"}}
+
+
+def _client(server, **kwargs) -> PubChemClient:
+    options = {"rate_per_s": 0.0, "backoff_s": 0.01, "timeout_s": 5.0}
+    options.update(kwargs)
+    return PubChemClient(base_url=server.url, **options)
+
+
+def test_build_details_fetches_each_molecule_once(stub_server) -> None:
+    def route(_method, path, _body):
+        if path.startswith("/compound/name/water/"):
+            return 200, WATER_RECORD
+        return 404, NOT_FOUND
+
+    server = stub_server(route)
+    aggregations = {
+        "cup": {"composition": {"water": {}, "mystery": {}}},
+        "glass": {"composition": {"water": {}}},
+        "jug": {"composition": {"water": {}, "mystery": {}}},
+    }
+    client = _client(server)
+    build_details(aggregations, client=client)
+    client.close()
+
+    paths = server.paths()
+    assert len(paths) == len(set(paths))
+    # Water resolves on its first (3D) lookup; the unknown name tries both record types once
+    assert paths.count("/compound/name/water/JSON?record_type=3d") == 1
+    assert sorted(p for p in paths if "mystery" in p) == [
+        "/compound/name/mystery/JSON",
+        "/compound/name/mystery/JSON?record_type=3d",
+    ]
+    for obj in aggregations.values():
+        assert list(obj["composition"]) == ["water"]
+        assert obj["composition"]["water"]["sim_details"]["atoms"]["element"] == [8, 1, 1]
+    # 2D record padded with z
+    conformer = aggregations["cup"]["composition"]["water"]["sim_details"]["coords"][0]
+    assert conformer["conformers"][0]["z"] == [0.0, 0.0, 0.0]
+
+
+def test_busy_responses_are_retried_with_backoff_under_the_rate_limit(stub_server) -> None:
+    arrivals: list[float] = []
+
+    def route(_method, _path, _body):
+        arrivals.append(time.monotonic())
+        if len(arrivals) <= 2:
+            return 503, {}
+        return 200, WATER_RECORD
+
+    server = stub_server(route)
+    client = _client(server, rate_per_s=20.0, backoff_s=0.05, retries=3)
+    assert client.get_json("/compound/cid/962/JSON") == WATER_RECORD
+    client.close()
+
+    assert client.requests_sent == 3
+    assert len(server.paths()) == 3
+    gaps = [later - earlier for earlier, later in zip(arrivals, arrivals[1:])]
+    # Each retry waits its backoff (0.05 s, then 0.1 s) and at least the 0.05 s rate interval
+    assert gaps[0] >= 0.045
+    assert gaps[1] >= 0.095
+
+
+def test_retries_give_up_after_the_limit(stub_server) -> None:
+    server = stub_server(lambda _method, _path, _body: (429, {}))
+    client = _client(server, retries=2)
+    assert client.get_json("/compound/cid/962/JSON") is None
+    client.close()
+    assert len(server.paths()) == 3
+
+
+def test_found_and_not_found_answers_are_cached(stub_server, tmp_path) -> None:
+    def route(_method, path, _body):
+        if path == "/compound/name/water/JSON":
+            return 200, WATER_RECORD
+        if path == "/compound/name/busy/JSON":
+            return 503, {}
+        return 404, NOT_FOUND
+
+    server = stub_server(route)
+    for _run in range(2):
+        client = _client(server, cache_dir=str(tmp_path), retries=0)
+        assert client.get_json("/compound/name/water/JSON") == WATER_RECORD
+        assert client.get_json("/compound/name/mystery/JSON") is None
+        assert client.get_json("/compound/name/busy/JSON") is None
+        client.close()
+
+    # The second run only goes back to the network for the transient failure
+    assert server.paths() == [
+        "/compound/name/water/JSON",
+        "/compound/name/mystery/JSON",
+        "/compound/name/busy/JSON",
+        "/compound/name/busy/JSON",
+    ]
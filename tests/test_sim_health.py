@@ -0,0 +1,73 @@
+"""
+./tests/test_sim_health.py
+
+python -m pytest tests/test_sim_health.py
+
+Checks when the simulation's health check rescales a hot instance.
+"""
+
+import numpy as np
+
+from src.dynamics.sim_thread import SimulationThread
+from src.utils.constants import (
+    BOLTZMANN_CONSTANT,
+    SIM_HEALTH_HOT_FACTOR,
+    SIM_HEALTH_WARM_CHECKS,
+    SIM_HEALTH_WARM_FACTOR,
+)
+from tests.test_frustum_culler import _state
+
+TARGET_K = 300.0
+
+
+def _sim_at(factors: list[float]) -> tuple[SimulationThread, np.ndarray]:
+    """A simulation whose instances' kinetic temperatures are factors x TARGET_K."""
+    state = _state()
+    sim = SimulationThread(state, list(state.instances)[: len(factors)], temperature=TARGET_K)
+    vel = sim.state.velocities.copy()
+    masses = sim.state.masses
+    starts = sim.mapping.starts
+    kinetic = np.add.reduceat(0.5 * masses * np.sum(vel * vel, axis=1), starts)
+    current = kinetic / (1.5 * sim.mapping.atom_counts * BOLTZMANN_CONSTANT)
+    vel *= np.sqrt(np.asarray(factors) * TARGET_K / current)[sim.mapping.atom_slot][:, None]
+    return sim, vel
+
+
+def _check(sim: SimulationThread, vel: np.ndarray) -> np.ndarray:
+    _pos, out = sim._check_health(sim.state.positions.copy(), vel.copy(), sim.state.masses, TARGET_K)
+    return out
+
+
+def test_brief_warm_fluctuation_is_left_alone() -> None:
+    factor = (SIM_HEALTH_WARM_FACTOR + SIM_HEALTH_HOT_FACTOR) / 2.0
+    sim, vel = _sim_at([factor, 1.0])
+    for _ in range(SIM_HEALTH_WARM_CHECKS - 1):
+        np.testing.assert_array_equal(_check(sim, vel), vel)
+
+
+def test_sustained_warmth_is_rescaled() -> None:
+    factor = (SIM_HEALTH_WARM_FACTOR + SIM_HEALTH_HOT_FACTOR) / 2.0
+    sim, vel = _sim_at([factor, 1.0])
+    for _ in range(SIM_HEALTH_WARM_CHECKS - 1):
+        _check(sim, vel)
+    out = _check(sim, vel)
+    first = sim.mapping.atom_slot == 0
+    np.testing.assert_allclose(out[first], vel[first] / np.sqrt(factor))
+    np.testing.assert_array_equal(out[~first], vel[~first])
+
+
+def test_cooling_between_checks_restarts_the_count() -> None:
+    factor = (SIM_HEALTH_WARM_FACTOR + SIM_HEALTH_HOT_FACTOR) / 2.0
+    sim, vel = _sim_at([factor])
+    _cool_sim, cool = _sim_at([1.0])
+    for _ in range(SIM_HEALTH_WARM_CHECKS - 1):
+        _check(sim, vel)
+    _check(sim, cool)
+    for _ in range(SIM_HEALTH_WARM_CHECKS - 1):
+        np.testing.assert_array_equal(_check(sim, vel), vel)
+
+
+def test_far_hotter_instance_is_rescaled_at_once() -> None:
+    factor = 2.0 * SIM_HEALTH_HOT_FACTOR
+    sim, vel = _sim_at([factor])
+    np.testing.assert_allclose(_check(sim, vel), vel / np.sqrt(factor))